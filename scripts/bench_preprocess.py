@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OCR 전처리 벤치마크: 기존 PIL 경로 vs utils/preprocess.py (OpenCV/NumPy).
+
+프레임당 지연(중앙값/p95)과 최대 메모리 증가량(경로별 별도 프로세스의 ru_maxrss 차이)을 비교하고,
+PIL 결과와의 픽셀 차이도 함께 출력합니다.
+
+실행 방법:
+  python3 scripts/bench_preprocess.py                      # 1080x2340 합성 화면
+  python3 scripts/bench_preprocess.py reports/screenshots/nav_scroll.png -n 50
+  python3 scripts/bench_preprocess.py --max-side 1600      # 축소 설정 포함 비교
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+
+import cv2
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.preprocess import PreprocessConfig, preprocess_array  # noqa: E402
+
+
+def load_gray(path):
+    if path:
+        image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            sys.exit(f"❌ 이미지를 읽을 수 없음: {path}")
+        return image
+    # 채팅/네비 화면과 비슷한 합성 화면 (흰 배경 + 글자 줄)
+    image = np.full((2340, 1080), 245, np.uint8)
+    for i, y in enumerate(range(180, 2300, 90)):
+        cv2.putText(image, f"CHANNEL_{i} message text {i * 7}", (40, y), cv2.FONT_HERSHEY_SIMPLEX,
+                    1.4, 30, 3)
+    return image
+
+
+def pil_path(gray):
+    image = Image.fromarray(gray)
+    image = image.filter(ImageFilter.SHARPEN)
+    image = ImageEnhance.Contrast(image).enhance(2.0)
+    return np.array(image)
+
+
+def cv_path(gray, config):
+    return preprocess_array(gray, config)[0]
+
+
+def run_one(mode, path, n, scale, max_side):
+    """단일 경로 측정 (별도 프로세스에서 실행되어 메모리 최대치가 섞이지 않음)"""
+    gray = load_gray(path)
+    config = PreprocessConfig(scale=scale, max_side=max_side)
+    fn = (lambda: pil_path(gray)) if mode == "pil" else (lambda: cv_path(gray, config))
+    fn()  # 워밍업
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - start)
+        del out
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    times.sort()
+    return {
+        "mode": mode,
+        "shape": list(gray.shape),
+        "median_ms": times[len(times) // 2] * 1000,
+        "p95_ms": times[int(len(times) * 0.95) - 1] * 1000,
+        "peak_rss_delta_kb": peak - base,
+        "frame_kb": gray.nbytes // 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 전처리 지연/메모리 비교")
+    parser.add_argument("image", nargs="?", help="흑백으로 읽을 스크린샷 경로 (없으면 합성 화면)")
+    parser.add_argument("-n", type=int, default=30, help="반복 횟수")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--max-side", type=int, default=None)
+    parser.add_argument("--worker", choices=["pil", "cv"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_one(args.worker, args.image, args.n, args.scale, args.max_side)))
+        return
+
+    results = []
+    for mode in ("pil", "cv"):
+        cmd = [sys.executable, os.path.abspath(__file__), "--worker", mode, "-n", str(args.n),
+               "--scale", str(args.scale)]
+        if args.max_side:
+            cmd += ["--max-side", str(args.max_side)]
+        if args.image:
+            cmd.append(args.image)
+        out = subprocess.run(cmd, stdout=subprocess.PIPE, check=True, text=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+
+    gray = load_gray(args.image)
+    reference = pil_path(gray)
+    same_size = cv_path(gray, PreprocessConfig())
+    diff = np.abs(reference.astype(np.int16) - same_size.astype(np.int16))
+
+    print(f"📐 입력 {gray.shape[1]}x{gray.shape[0]} ({gray.nbytes // 1024} KB), 반복 {args.n}회")
+    print(f"{'경로':<6}{'중앙값(ms)':>12}{'p95(ms)':>10}{'최대 RSS 증가(KB)':>20}")
+    for r in results:
+        print(f"{r['mode']:<6}{r['median_ms']:>12.2f}{r['p95_ms']:>10.2f}{r['peak_rss_delta_kb']:>20}")
+    print(f"🔍 PIL 대비 픽셀 차이 (축소 없음): 최대 {int(diff.max())}, "
+          f"불일치 {float((diff > 0).mean()) * 100:.3f}%")
+
+
+if __name__ == "__main__":
+    main()
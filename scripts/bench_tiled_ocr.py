@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+타일 병렬 OCR 벤치마크: 화면 전체 readtext 한 번(기준) vs utils/tiled_ocr.py.
+
+코어 수마다 별도 프로세스를 띄워 CPU 친화도(sched_setaffinity)로 사용 코어를 제한하고,
+- 기준: readtext 1회, torch 스레드 = 코어 수
+- 타일: 타일 수만큼 병렬(스레드 풀 또는 OCR 프로세스 풀), torch 스레드 = 코어 수 / 동시 실행 수
+화면당 지연(중앙값)과 기준 대비 배속, 기준 결과 텍스트를 타일 결과가 얼마나 찾았는지(일치율)를 출력하고
+reports/benchmarks/ 에 JSON으로 저장한다.
+
+실행 방법:
+  python3 scripts/bench_tiled_ocr.py                              # 1080x2340 합성 화면, 코어 1,2,4,... 전체
+  python3 scripts/bench_tiled_ocr.py reports/screenshots/*.png -n 3
+  python3 scripts/bench_tiled_ocr.py --cores 1 2 4 8 --tiles 4 --overlap 128
+  python3 scripts/bench_tiled_ocr.py --pool process               # 타일을 OCR 프로세스 풀로 실행
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.preprocess import preprocess_array  # noqa: E402
+from utils.tiled_ocr import DEFAULT_OVERLAP, TiledOCR, tile_bounds  # noqa: E402
+
+OUTPUT_DIR = "./reports/benchmarks"
+
+
+def git_revision() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], stdout=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL, text=True, check=True)
+        return out.stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def load_frames(paths):
+    """OCR 입력과 같은 전처리를 거친 흑백 화면 목록 (경로가 없으면 합성 화면 1장)"""
+    if not paths:
+        image = np.full((2340, 1080), 245, np.uint8)
+        for i, y in enumerate(range(180, 2300, 90)):
+            cv2.putText(image, f"CHANNEL_{i} message text {i * 7}", (40, y), cv2.FONT_HERSHEY_SIMPLEX,
+                        1.4, 30, 3)
+        return [("synthetic", preprocess_array(image)[0])]
+    frames = []
+    for path in paths:
+        image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            sys.exit(f"❌ 이미지를 읽을 수 없음: {path}")
+        frames.append((os.path.basename(path), preprocess_array(image)[0]))
+    return frames
+
+
+def _texts(results) -> set:
+    return {"".join(text.split()).lower() for _, text, _ in results if text.strip()}
+
+
+def _median_ms(fn, frame, n) -> tuple:
+    fn(frame)  # 워밍업
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        result = fn(frame)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, result
+
+
+def run_cores(cores, paths, n, tiles, overlap, pool):
+    """코어 cores개로 제한한 프로세스에서 기준/타일 측정 (torch import 전에 친화도 설정)"""
+    limited = hasattr(os, "sched_setaffinity")
+    if limited:
+        allowed = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, allowed[:cores])
+    from utils.ocr_engine import configure_ocr
+    from utils.ocr_service import OCRService
+
+    engine = configure_ocr(threads=cores)
+    frames = load_frames(paths)
+    tiles = tiles or cores
+    concurrent = min(tiles, cores)
+    service = None
+    screens = []
+    try:
+        baseline = []
+        for name, frame in frames:
+            ms, result = _median_ms(lambda f: engine.readtext(f, detail=1, paragraph=False), frame, n)
+            baseline.append((name, ms, result))
+
+        if pool == "process":
+            service = OCRService(workers=concurrent, threads=max(1, cores // concurrent))
+        else:
+            engine.configure(threads=max(1, cores // concurrent))
+        tiler = TiledOCR(tiles=tiles, overlap=overlap, min_height=0, workers=concurrent, service=service)
+        for (name, frame), (_, base_ms, base_result) in zip(frames, baseline):
+            ms, result = _median_ms(lambda f: tiler.readtext(f, detail=1, paragraph=False), frame, n)
+            expected, found = _texts(base_result), _texts(result)
+            screens.append({
+                "screen": name,
+                "shape": list(frame.shape),
+                "tiles": len(tile_bounds(frame.shape[0], tiles, overlap)),
+                "baseline_ms": base_ms,
+                "tiled_ms": ms,
+                "baseline_boxes": len(base_result),
+                "tiled_boxes": len(result),
+                "agreement": len(expected & found) / len(expected) if expected else 1.0,
+            })
+        tiler.shutdown()
+    finally:
+        if service is not None:
+            service.shutdown()
+    return {"cores": cores, "limited": limited, "screens": screens}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="타일 병렬 OCR 코어 수별 지연 비교")
+    parser.add_argument("images", nargs="*", help="스크린샷 경로 (없으면 합성 화면)")
+    parser.add_argument("-n", type=int, default=5, help="화면당 반복 횟수")
+    parser.add_argument("--cores", type=int, nargs="*", help="측정할 코어 수 (기본: 1, 2, 4, ... 전체)")
+    parser.add_argument("--tiles", type=int, default=0, help="타일 수 (기본: 코어 수)")
+    parser.add_argument("--overlap", type=int, default=DEFAULT_OVERLAP, help="타일 간 겹침(px)")
+    parser.add_argument("--pool", choices=["thread", "process"], default="thread", help="타일 병렬 실행 방식")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_cores(args.worker, args.images, args.n, args.tiles, args.overlap, args.pool)))
+        return
+
+    available = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    cores = args.cores or sorted({min(2 ** i, available) for i in range(available.bit_length() + 1)})
+    results = []
+    for n_cores in cores:
+        cmd = [sys.executable, os.path.abspath(__file__), "--worker", str(n_cores), "-n", str(args.n),
+               "--tiles", str(args.tiles), "--overlap", str(args.overlap), "--pool", args.pool, *args.images]
+        out = subprocess.run(cmd, stdout=subprocess.PIPE, check=True, text=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+
+    print(f"🧮 사용 가능 코어 {available}, 겹침 {args.overlap}px, 타일 {args.tiles or '코어 수'}, "
+          f"{args.pool} 풀, 반복 {args.n}회")
+    if not all(r["limited"] for r in results):
+        print("⚠️ sched_setaffinity 미지원 — 코어 수 제한 없이 스레드 수만 바꿔 측정")
+    print(f"{'코어':>4}{'타일':>6}{'기준(ms)':>12}{'타일(ms)':>12}{'배속':>8}{'일치율':>9}")
+    for r in results:
+        screens = r["screens"]
+        base = statistics.median(s["baseline_ms"] for s in screens)
+        tiled = statistics.median(s["tiled_ms"] for s in screens)
+        r["baseline_ms"], r["tiled_ms"], r["speedup"] = base, tiled, base / tiled if tiled else 0.0
+        r["agreement"] = min(s["agreement"] for s in screens)
+        print(f"{r['cores']:>4}{screens[0]['tiles']:>6}{base:>12.1f}{tiled:>12.1f}"
+              f"{r['speedup']:>7.2f}x{r['agreement'] * 100:>8.1f}%")
+
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    revision = git_revision()
+    path = os.path.join(OUTPUT_DIR, f"tiled_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{revision}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"revision": revision, "overlap": args.overlap, "pool": args.pool,
+                   "images": args.images or ["synthetic"], "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"💾 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
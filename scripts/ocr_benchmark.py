@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기기 없이 녹화된 스크린샷으로 OCR/매칭 파이프라인을 측정하는 오프라인 벤치마크.
+
+단계별 지연(decode, preprocess, detect, recognize, match), 처리량(화면/초),
+키워드 적중률과 판정 정확도(홈 화면 / 로그인 다이얼로그)를 출력하고
+reports/benchmarks/ 에 JSON으로 저장한다. --compare 로 이전 결과와 비교.
+
+픽스처 디렉토리 구성 (기본: tests/fixtures/screens):
+  manifest.json
+  home.png, side_nav.png, block_1.png, chat_1_login.png, ...
+
+manifest.json 예시:
+  {
+    "screens": [
+      {"file": "home.png", "home": true, "login_dialog": false},
+      {"file": "side_nav.png", "region": "side_nav_list",
+       "keywords": {"BLOCK_1": ["BLOCK_1", "BLOCK1"], "CHAT_1": ["CHAT_1"]},
+       "tap": {"category": "BLOCK_1", "point": [210, 655]}},
+      {"file": "chat_1_login.png", "region": "dialog_body", "login_dialog": true}
+    ]
+  }
+  - keywords: 카테고리 → 변형 목록 (리스트만 주면 각 항목이 하나의 카테고리). 전부 찾아야 적중
+  - tap: 탭 대상 카테고리. point가 있으면 찾은 박스가 그 좌표를 포함해야 적중
+  - home / login_dialog: is_home_screen_text / contains_login_dialog 기대값
+
+픽스처 만들기 (저장소에는 커밋하지 않음 — 실제 앱 화면):
+  1) APPIUM_RECORD_SESSION=tc2_guest 로 실기기 테스트를 한 번 실행 → reports/sessions/<세션>/frames/*.png
+     (또는 OCR_SAVE_SCREENSHOTS=true 실행의 reports/screenshots/)
+  2) 측정할 화면을 tests/fixtures/screens/ 에 복사하고 위 형식으로 manifest.json 작성
+manifest.json이 없으면 합성 화면(사이드 네비 채널 목록, 키워드/탭 판정만)으로 실행한다.
+
+실행 방법:
+  python3 scripts/ocr_benchmark.py
+  python3 scripts/ocr_benchmark.py --fixtures ./my_screens --repeat 3
+  python3 scripts/ocr_benchmark.py --compare reports/benchmarks/ocr_20250101_120000_abc1234.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.ocr_engine import get_ocr_engine  # noqa: E402
+from utils.preprocess import preprocess_array  # noqa: E402
+from utils.coordinates import resolve_region  # noqa: E402
+from utils.screen_text import ScreenText  # noqa: E402
+from utils.keyword_matcher import KeywordMatcher  # noqa: E402
+from utils.easyocr_utils import contains_login_dialog, is_home_screen_text  # noqa: E402
+
+STAGES = ("decode", "preprocess", "detect", "recognize", "match")
+OUTPUT_DIR = "./reports/benchmarks"
+
+
+def git_revision() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], stdout=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL, text=True, check=True)
+        return out.stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+SYNTHETIC_CHANNELS = ["BLOCK_1", "BLOCK_2", "CHAT_1", "CHAT_2", "FORUM_1", "FORUM_2"]
+
+
+def synthetic_screens() -> list:
+    """픽스처가 없을 때 쓰는 합성 화면: 1080x2340 사이드 네비 채널 목록 (채널명 + 탭 좌표 기대값)"""
+    image = np.full((2340, 1080), 245, np.uint8)
+    for i, name in enumerate(SYNTHETIC_CHANNELS):
+        cv2.putText(image, name, (60, 400 + i * 160), cv2.FONT_HERSHEY_SIMPLEX, 2.0, 30, 4)
+    spec = {"file": "synthetic_side_nav", "keywords": SYNTHETIC_CHANNELS,
+            "tap": {"category": "CHAT_1", "point": [200, 700]}}
+    return [(spec, cv2.imencode(".png", image)[1].tobytes())]
+
+
+def load_screens(fixtures: str) -> list:
+    """[(manifest 항목, PNG 바이트), ...]. manifest.json이 없으면 합성 화면"""
+    path = os.path.join(fixtures, "manifest.json")
+    if not os.path.exists(path):
+        print(f"⚠️ manifest.json 없음: {path} → 합성 화면으로 실행 (픽스처 만드는 법은 스크립트 docstring 참고)")
+        return synthetic_screens()
+    with open(path, "r", encoding="utf-8") as f:
+        specs = json.load(f)["screens"]
+    screens = []
+    for spec in specs:
+        with open(os.path.join(fixtures, spec["file"]), "rb") as f:
+            screens.append((spec, f.read()))
+    return screens
+
+
+def _categories(keywords) -> dict:
+    if isinstance(keywords, dict):
+        return keywords
+    return {k: [k] for k in keywords}
+
+
+def build_matchers(spec: dict) -> dict:
+    """화면 항목의 키워드/탭 매처 (오토마톤 생성은 match 단계 측정에서 제외하도록 미리 만듦)"""
+    matchers = {}
+    if "keywords" in spec:
+        matchers["keywords"] = KeywordMatcher(_categories(spec["keywords"]))
+    if "tap" in spec:
+        keywords = spec.get("keywords") or [spec["tap"]["category"]]
+        matchers["tap"] = KeywordMatcher(_categories(keywords), fuzzy=True)
+    return matchers
+
+
+def run_screen(engine, spec: dict, png: bytes, matchers: dict) -> dict:
+    """화면 하나를 단계별로 실행하고 소요 시간 + 판정 결과를 반환"""
+    t = {}
+
+    start = time.perf_counter()
+    gray = cv2.imdecode(np.frombuffer(png, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    t["decode"] = time.perf_counter() - start
+    if gray is None:
+        raise ValueError(f"디코딩 실패: {spec['file']}")
+    size = (gray.shape[1], gray.shape[0])
+
+    start = time.perf_counter()
+    crop = resolve_region(spec.get("region"), size)
+    part = gray[crop[1]:crop[3], crop[0]:crop[2]] if crop else gray
+    image, scale = preprocess_array(part)
+    t["preprocess"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    horizontal, free = engine.detect(image)
+    t["detect"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = engine.recognize(image, horizontal, free, detail=1, paragraph=False)
+    t["recognize"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    offset = (crop[0], crop[1]) if crop else (0, 0)
+    screen = ScreenText.from_readtext(results, offset=offset, size=size, scale=scale)
+    checks = {}
+    if "keywords" in spec:
+        categories = _categories(spec["keywords"])
+        found = matchers["keywords"].screen_categories(screen)
+        checks["keywords"] = {"expected": len(categories), "found": len(found & set(categories)),
+                              "missing": sorted(set(categories) - found)}
+    if "tap" in spec:
+        tap = spec["tap"]
+        hit = matchers["tap"].query(tap["category"]).locate(screen)
+        ok = hit is not None
+        if ok and tap.get("point"):
+            x, y = tap["point"]
+            box = hit.box
+            ok = box.left <= x <= box.right and box.top <= y <= box.bottom
+        checks["tap"] = {"ok": ok, "box": list(hit.box.center) if hit else None}
+    if "home" in spec:
+        checks["home"] = {"ok": is_home_screen_text(screen.text) == spec["home"]}
+    if "login_dialog" in spec:
+        checks["login_dialog"] = {"ok": contains_login_dialog(screen.text) == spec["login_dialog"]}
+    t["match"] = time.perf_counter() - start
+
+    return {"file": spec["file"], "boxes": len(screen), "seconds": t, "checks": checks}
+
+
+def summarize(runs: list, wall: float) -> dict:
+    stages = {}
+    for stage in STAGES:
+        values = [r["seconds"][stage] for r in runs]
+        values.sort()
+        stages[stage] = {
+            "mean_ms": statistics.mean(values) * 1000,
+            "median_ms": statistics.median(values) * 1000,
+            "p95_ms": values[max(0, int(len(values) * 0.95) - 1)] * 1000,
+        }
+    expected = sum(r["checks"].get("keywords", {}).get("expected", 0) for r in runs)
+    found = sum(r["checks"].get("keywords", {}).get("found", 0) for r in runs)
+    verdicts = {}
+    for name in ("tap", "home", "login_dialog"):
+        results = [r["checks"][name]["ok"] for r in runs if name in r["checks"]]
+        if results:
+            verdicts[name] = sum(results) / len(results)
+    return {
+        "screens": len(runs),
+        "wall_seconds": wall,
+        "throughput_per_sec": len(runs) / wall if wall else None,
+        "stages": stages,
+        "keyword_hit_rate": found / expected if expected else None,
+        "verdict_accuracy": verdicts,
+    }
+
+
+def print_summary(summary: dict, previous: dict = None):
+    print(f"\n📊 {summary['screens']}개 화면, {summary['wall_seconds']:.2f}s "
+          f"({summary['throughput_per_sec']:.2f} 화면/초)")
+    print(f"{'단계':<12}{'평균(ms)':>10}{'중앙값(ms)':>12}{'p95(ms)':>10}{'이전 대비':>12}")
+    for stage, s in summary["stages"].items():
+        delta = ""
+        if previous and stage in previous.get("stages", {}):
+            before = previous["stages"][stage]["median_ms"]
+            if before:
+                delta = f"{(s['median_ms'] - before) / before * 100:+.1f}%"
+        print(f"{stage:<12}{s['mean_ms']:>10.1f}{s['median_ms']:>12.1f}{s['p95_ms']:>10.1f}{delta:>12}")
+    if summary["keyword_hit_rate"] is not None:
+        print(f"🎯 키워드 적중률: {summary['keyword_hit_rate'] * 100:.1f}%")
+    for name, acc in summary["verdict_accuracy"].items():
+        print(f"✅ {name} 판정 정확도: {acc * 100:.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화된 스크린샷 기반 OCR 파이프라인 벤치마크")
+    parser.add_argument("--fixtures", default="tests/fixtures/screens", help="manifest.json이 있는 디렉토리")
+    parser.add_argument("--repeat", type=int, default=1, help="화면별 반복 횟수")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--output", default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    screens = load_screens(args.fixtures)
+    matchers = [build_matchers(spec) for spec, _ in screens]
+    engine = get_ocr_engine()
+    engine.reader  # 모델 로드 시간은 단계 측정에서 제외
+
+    runs = []
+    wall_start = time.perf_counter()
+    for (spec, png), screen_matchers in zip(screens, matchers):
+        for _ in range(args.repeat):
+            run = run_screen(engine, spec, png, screen_matchers)
+            runs.append(run)
+        failed = [name for name, c in run["checks"].items() if not c.get("ok", not c.get("missing"))]
+        print(f"{'❌' if failed else '✅'} {spec['file']}: 박스 {run['boxes']}개, "
+              f"{sum(run['seconds'].values()) * 1000:.0f}ms" + (f" (실패: {', '.join(failed)})" if failed else ""))
+    wall = time.perf_counter() - wall_start
+
+    summary = summarize(runs, wall)
+    previous = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)["summary"]
+    print_summary(summary, previous)
+
+    revision = git_revision()
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f"ocr_{datetime.now():%Y%m%d_%H%M%S}_{revision}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "revision": revision,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "engine": engine.stats(),
+            "fixtures": os.path.abspath(args.fixtures),
+            "repeat": args.repeat,
+            "summary": summary,
+            "runs": runs,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+녹화된 드라이버 세션으로 시나리오를 기기/Appium 없이 재생합니다.
+
+녹화 방법 (실기기 1회):
+  APPIUM_RECORD_SESSION=tc2_guest python3 tests/android/tc2_permission_guest.py
+  → reports/sessions/tc2_guest_YYYYmmdd_HHMMSS/ 생성
+
+재생 방법:
+  python3 scripts/replay_session.py reports/sessions/tc2_guest_20250101_120000
+  python3 scripts/replay_session.py <세션> --scenario tc2 --settle     # 구간별 안정 화면만 사용
+  python3 scripts/replay_session.py <세션> --strict                   # 녹화와 다른 동작이면 중단
+  python3 scripts/replay_session.py <세션> --profile                  # cProfile 상위 25개 출력
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.replay import FakeDriver  # noqa: E402
+from utils.tracing import end_step, export_chrome_trace, print_trace_summary  # noqa: E402
+from tests.common import SCENARIOS, load_scenario  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 세션 재생")
+    parser.add_argument("session", help="reports/sessions/ 아래 세션 디렉토리")
+    parser.add_argument("--scenario", default="tc2", choices=sorted(SCENARIOS))
+    parser.add_argument("--strict", action="store_true", help="녹화에 없는 동작이면 ReplayMismatch")
+    parser.add_argument("--settle", action="store_true", help="각 구간의 마지막 화면만 제공")
+    parser.add_argument("--profile", action="store_true", help="cProfile 결과 출력")
+    args = parser.parse_args()
+
+    # 시나리오 코드가 상대 경로(utils/rel_position.json 등)를 쓰므로 저장소 루트에서 실행
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    run = load_scenario(args.scenario)
+    driver = FakeDriver(args.session, strict=args.strict, settle=args.settle)
+    print(f"▶️ 재생 시작: {args.session} ({len(driver.segments) - 1}개 동작 구간)")
+
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    start = time.perf_counter()
+    try:
+        run(driver)
+    finally:
+        elapsed = time.perf_counter() - start
+        end_step()
+        if profiler is not None:
+            import pstats
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+        stats = driver.stats()
+        print(f"⏹️ 재생 종료: {elapsed:.2f}s, 동작 {stats['actions']}회, "
+              f"구간 {stats['position']}/{stats['segments'] - 1}, "
+              f"건너뛴 녹화 동작 {stats['skipped_recorded_actions']}, "
+              f"불일치 {stats['unmatched_actions']}")
+        print_trace_summary(f"replay {args.scenario}")
+        export_chrome_trace(f"replay_{args.scenario}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+config/devices.json 에 등록된 기기들에서 테스트 케이스를 병렬로 실행합니다.
+
+기기마다 프로세스 하나 / Appium 세션 하나 / 산출물 디렉토리 하나(reports/runs/<run_id>/<기기>/),
+케이스는 끝난 기기가 다음 것을 가져가는 방식으로 분배되고 결과는 report.json 하나로 병합됩니다.
+분할 정의(tests.common.SHARDS)가 있는 시나리오는 그룹 단위(tc2 → BLOCK/CHAT/FORUM)로 나누고,
+지난 실행 기록(reports/durations.db)으로 소요 시간을 추정해 긴 케이스부터 배정합니다(LPT).
+
+실행 방법:
+  APPIUM_UDID=emulator-5554 APPIUM_UDID_2=R3CN30XXXX python3 scripts/run_devices.py
+  python3 scripts/run_devices.py tc2 --devices device1 device2
+  python3 scripts/run_devices.py --config ./my_devices.json
+  python3 scripts/run_devices.py tc2 --no-split       # 그룹으로 나누지 않고 시나리오 통째로
+  python3 scripts/run_devices.py --plan               # 실행 없이 추정/배정 계획만 출력
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dotenv import load_dotenv  # noqa: E402
+from tests.common import CASE_STEPS, SCENARIOS, SHARDS, expand_shards  # noqa: E402
+from utils.device_runner import DEVICES_PATH, load_devices, lpt_plan, run_on_devices, print_run_report  # noqa: E402
+from utils.duration_store import get_duration_store  # noqa: E402
+from utils.helpers import log_result_to_sheet  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다중 기기 병렬 실행")
+    parser.add_argument("cases", nargs="*", help=f"실행할 케이스 (기본: {', '.join(sorted(SHARDS))})")
+    parser.add_argument("--config", default=DEVICES_PATH, help="기기 목록 JSON")
+    parser.add_argument("--devices", nargs="*", help="사용할 기기 이름 (기본: 전체)")
+    parser.add_argument("--no-log", action="store_true", help="결과 기록 버퍼(Sheets/CSV)에 기록하지 않음")
+    parser.add_argument("--no-split", action="store_true", help="시나리오를 그룹으로 나누지 않음")
+    parser.add_argument("--plan", action="store_true", help="실행하지 않고 소요 시간 추정과 LPT 배정만 출력")
+    args = parser.parse_args()
+
+    # 시나리오 코드가 상대 경로(utils/rel_position.json 등)를 쓰므로 저장소 루트에서 실행
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    load_dotenv()
+    cases = args.cases or sorted(SHARDS)
+    unknown = [c for c in cases if c not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 케이스: {', '.join(unknown)}")
+    if not args.no_split:
+        cases = expand_shards(cases)
+
+    store = get_duration_store()
+    estimates = store.estimates(cases, CASE_STEPS)
+    devices = load_devices(args.config, only=args.devices)
+    if args.plan:
+        _, plan, expected = lpt_plan({name: sec for name, (sec, _) in estimates.items()}, len(devices))
+        for name, (sec, source) in sorted(estimates.items(), key=lambda x: -x[1][0]):
+            print(f"  {name:<20}{sec:>8.1f}s  ({source})")
+        for device, assigned in zip(devices, plan):
+            print(f"📱 {device.name}: {', '.join(assigned) or '-'}")
+        print(f"🗂️ 예상 makespan {expected:.1f}s")
+        return 0
+
+    report = run_on_devices(cases, devices, estimates={name: sec for name, (sec, _) in estimates.items()})
+    print_run_report(report)
+    store.record_report(report)
+    if not args.no_log:
+        for r in report["cases"]:
+            log_result_to_sheet(f"{r['case']}@{r['device'] or '-'}", r["status"],
+                                r["error"] or ", ".join(r["failures"]) or None)
+    return 0 if all(r["status"] == "PASS" for r in report["cases"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 import os
-import time
+import sys
 from dotenv import load_dotenv
 from appium import webdriver
 from appium.options.android import UiAutomator2Options
@@ -7,6 +7,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from utils.waits import wait_until_stable, print_wait_report
+
 # .env 파일 로드
 load_dotenv()
 
@@ -30,14 +33,14 @@ try:
     driver = webdriver.Remote(command_executor=appium_server_url, options=options)
     driver.implicitly_wait(10)
 
-    time.sleep(5)  # 앱 첫 화면 로딩 대기
+    wait_until_stable(driver, 5, label="app_launch")  # 앱 첫 화면 로딩 대기
 
     # ✅ 1단계: 알림 권한 팝업에서 "허용" 버튼 클릭
     try:
         allow_button = driver.find_element(By.ID, "com.android.permissioncontroller:id/permission_allow_button")
         allow_button.click()
         print("알림 권한 허용 버튼 클릭 완료")
-        time.sleep(1)
+        wait_until_stable(driver, 1, label="permission_allow")
     except Exception as e:
         print("허용 버튼이 표시되지 않음 (이미 권한 있음 또는 팝업 없음)")
 
@@ -54,6 +57,7 @@ try:
     actions.perform()
 
     print(f"로그인 버튼 좌표 (x={login_x}, y={login_y}) 탭 완료")
+    print_wait_report()
 
 except Exception as e:
     print(f"오류 발생: {e}")
@@ -4,10 +4,16 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.
 
 from utils.driver_setup import setup_android_driver
 from tests.common.tc2_permission_guest import run_tc2_permission_guest
+from utils.tracing import end_step, export_chrome_trace, print_trace_summary
+from utils.frame_buffer import dump_frames_on_error
 
 driver = setup_android_driver()
 
 try:
-    run_tc2_permission_guest(driver)
+    with dump_frames_on_error("tc2_exception"):
+        run_tc2_permission_guest(driver)
 finally:
-    driver.quit()
\ No newline at end of file
+    end_step()
+    print_trace_summary("tc2_permission_guest")
+    export_chrome_trace("tc2_permission_guest")
+    driver.quit()
@@ -1 +1,37 @@
-# tests.common 패키지 초기화 
\ No newline at end of file
+# tests.common 패키지 초기화
+import importlib
+
+# 시나리오 이름 → "모듈:함수" (tc3~tc5 구현 시 여기에 추가). 재생/다중 기기 실행기가 공유
+SCENARIOS = {
+    "tc2": "tests.common.tc2_permission_guest:run_tc2_permission_guest",
+    "tc2_block": "tests.common.tc2_permission_guest:run_tc2_block",
+    "tc2_chat": "tests.common.tc2_permission_guest:run_tc2_chat",
+    "tc2_forum": "tests.common.tc2_permission_guest:run_tc2_forum",
+}
+
+# 다중 기기 실행 시 나눠서 돌릴 수 있는 시나리오 → 독립 실행 그룹 (각 그룹이 앱 재시작부터 수행)
+SHARDS = {
+    "tc2": ["tc2_block", "tc2_chat", "tc2_forum"],
+}
+
+# 케이스가 거치는 단계(set_step 이름). 케이스 자체 실행 기록이 없으면 단계별 기록의 합으로 소요 시간 추정
+_TC2_SETUP = ["launch", "guest_entry", "home_check"]
+CASE_STEPS = {
+    "tc2": _TC2_SETUP + ["BLOCK", "CHAT", "FORUM"],
+    "tc2_block": _TC2_SETUP + ["BLOCK"],
+    "tc2_chat": _TC2_SETUP + ["CHAT"],
+    "tc2_forum": _TC2_SETUP + ["FORUM"],
+}
+
+
+def load_scenario(name: str):
+    module_name, func_name = SCENARIOS[name].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def expand_shards(names):
+    """['tc2'] → ['tc2_block', 'tc2_chat', 'tc2_forum'] (분할 정의가 없는 시나리오는 그대로)"""
+    expanded = []
+    for name in names:
+        expanded.extend(SHARDS.get(name, [name]))
+    return expanded
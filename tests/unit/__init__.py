@@ -0,0 +1 @@
+# 기기 없이 도는 순수 로직 단위 테스트
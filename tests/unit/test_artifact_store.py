@@ -0,0 +1,60 @@
+import os
+import threading
+
+import cv2
+import numpy as np
+
+from utils.artifact_store import ArtifactStore
+
+
+def _png(seed):
+    image = np.random.default_rng(seed).integers(0, 255, size=(40, 30, 3), dtype=np.uint8)
+    return cv2.imencode(".png", image)[1].tobytes()
+
+
+def _objects(root):
+    return sorted(os.listdir(os.path.join(root, "objects")))
+
+
+def test_same_frame_saved_both_ways_is_stored_once(tmp_path):
+    store = ArtifactStore(str(tmp_path), fmt="jpg")
+    png = _png(1)
+    lossy = store.save_png(png, "nav", wait=True)
+    assert lossy.endswith(".jpg")
+    kept = store.save_png(png, "nav_fail", keep=True, wait=True)
+    assert kept.endswith(".keep.png")
+    assert store.save_png(png, "nav_again", wait=True) == kept     # 승격 후에는 일반 저장도 같은 객체
+    assert _objects(tmp_path) == [os.path.basename(kept)]
+    steps = store.manifest()["steps"]
+    assert {e["file"] for entries in steps.values() for e in entries} == {os.path.relpath(kept, tmp_path)}
+    assert not any(e["evicted"] for entries in steps.values() for e in entries)
+
+
+def test_keep_objects_survive_restart_and_eviction(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    kept = store.save_png(_png(1), "fail", keep=True, wait=True)
+    store.flush()
+    store = ArtifactStore(str(tmp_path), max_bytes=1)
+    for seed in range(2, 6):
+        store.save_png(_png(seed), f"frame{seed}", wait=True)
+    assert os.path.basename(kept) in _objects(tmp_path)
+    assert store.evicted >= 3
+
+
+def test_wait_returns_after_file_is_written(tmp_path):
+    store = ArtifactStore(str(tmp_path), fmt="webp")
+    path = store.save_png(_png(7), "evidence", keep=True, wait=True)
+    assert cv2.imread(path) is not None
+
+
+def test_flush_waits_for_saves_racing_with_it(tmp_path):
+    store = ArtifactStore(str(tmp_path), fmt="jpg")
+    frames = [_png(seed) for seed in range(40)]
+    saver = threading.Thread(target=lambda: [store.save_png(p, f"f{i}") for i, p in enumerate(frames)])
+    saver.start()
+    store.flush()
+    saver.join()
+    store.flush()
+    entries = [e for entries in store.manifest()["steps"].values() for e in entries]
+    assert len(entries) == 40
+    assert not any(e["evicted"] for e in entries)
@@ -0,0 +1,57 @@
+import pytest
+
+import utils.frame_buffer as frame_buffer
+from utils.artifact_store import ArtifactStore
+from utils.frame_buffer import FrameRing, dump_failure_frames
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ArtifactStore(str(tmp_path))
+    monkeypatch.setattr(frame_buffer, "_ring", FrameRing(max_frames=4))
+    monkeypatch.setattr(frame_buffer, "get_artifact_store", lambda: store)
+    return store
+
+
+def _labels(store, reason):
+    return [e["label"] for e in store.manifest()["steps"].get(reason, [])]
+
+
+def test_second_failure_dumps_only_frames_after_first(store):
+    ring = frame_buffer.get_frame_buffer()
+    ring.push(b"a", "a")
+    ring.push(b"b", "b")
+    assert len(dump_failure_frames("first")) == 2
+    ring.push(b"c", "c")
+    dump_failure_frames("second")
+    assert _labels(store, "first") == ["a", "b"]
+    assert _labels(store, "second") == ["c"]
+    assert dump_failure_frames("third") == []
+
+
+def test_clear_drops_previous_case_frames(store):
+    ring = frame_buffer.get_frame_buffer()
+    ring.push(b"case1-a", "case1_a")
+    ring.push(b"case1-b", "case1_b")
+    ring.clear()                                # 다음 케이스 시작
+    ring.push(b"case2-a", "case2_a")
+    dump_failure_frames("case2_fail")
+    assert _labels(store, "case2_fail") == ["case2_a"]
+
+
+def test_snapshot_frames_already_dumped_are_skipped(store):
+    ring = frame_buffer.get_frame_buffer()
+    ring.push(b"x", "x")
+    snapshot = ring.frames()                    # Verifier 제출 시점
+    ring.push(b"y", "y")
+    dump_failure_frames("inline")
+    assert dump_failure_frames("deferred", snapshot) == []
+    assert _labels(store, "inline") == ["x", "y"]
+
+
+def test_ring_keeps_most_recent_frames(store):
+    ring = frame_buffer.get_frame_buffer()
+    for i in range(6):
+        ring.push(bytes([i]), f"f{i}")
+    assert [f.label for f in ring.frames()] == ["f2", "f3", "f4", "f5"]
+    assert ring.dropped == 2
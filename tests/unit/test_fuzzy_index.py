@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from tests.common.tc2_permission_guest import NAV_MATCHER, NAV_NAME_VARIANTS
+from utils.fuzzy_index import FuzzyIndex, fold, substring_distance, weighted_distance
+from utils.screen_text import OCRBox, ScreenText
+
+CHANNELS = sorted(NAV_NAME_VARIANTS)
+
+
+def _brute_force(index_forms, token, max_distance):
+    q = fold(token)
+    return sorted(round(weighted_distance(q, f), 6) for f in index_forms
+                  if weighted_distance(q, f) <= max_distance)
+
+
+def test_confusable_characters_are_cheap():
+    assert weighted_distance("FORUM_1", "F0RUM_1") == pytest.approx(0.25)
+    assert weighted_distance("CHAT_1", "CHAT1") == pytest.approx(0.25)
+    assert weighted_distance("CHAT_1", "CHAT_7") == pytest.approx(1.0)
+
+
+def test_substring_distance_finds_phrase_inside_line():
+    assert substring_distance("로그인이필요합니다", "알림로그인이필요합니다확인") == 0
+    assert substring_distance("로그인하시겠습니까", "로그인하시켓습니까") == pytest.approx(0.25)
+
+
+def test_bk_tree_search_matches_brute_force():
+    rng = random.Random(7)
+    index = FuzzyIndex(CHANNELS)
+    forms = []
+    for name in CHANNELS:
+        forms.append(fold(name))
+        forms.append(fold(name[:-1] + {"1": "I", "2": "II", "3": "III", "4": "IV"}[name[-1]]))
+    alphabet = "CHATBLOKFRUM_0123I4l|"
+    for _ in range(300):
+        token = rng.choice(CHANNELS)
+        token = "".join(ch if rng.random() > 0.2 else rng.choice(alphabet) for ch in token)
+        for max_distance in (0.5, 1.0, 2.0):
+            found = sorted(round(m.distance, 6) for m in index.search(token, max_distance))
+            assert found == _brute_force(forms, token, max_distance), token
+
+
+def test_lookup_maps_new_misreads_and_rejects_ties():
+    index = FuzzyIndex(CHANNELS)
+    assert index.lookup("CHAT_l").canonical == "CHAT_1"
+    assert index.lookup("BL0CK_2").canonical == "BLOCK_2"
+    assert index.lookup("FORUM_") is None          # FORUM_1~4 모두 같은 거리
+
+
+def _screen(text):
+    return ScreenText([OCRBox(text, ((0, 0), (100, 0), (100, 10), (0, 10)), 0.9)], (100, 10))
+
+
+def test_absence_checks_can_disable_fuzzy_fallback():
+    screen = _screen("FORUM_A")
+    assert NAV_MATCHER.query("FORUM_4").locate(screen).box.text == "FORUM_A"
+    assert NAV_MATCHER.query("FORUM_4", fuzzy=False).locate(screen) is None
+    assert NAV_MATCHER.query("FORUM_4").locate(screen, fuzzy=False) is None
+    assert NAV_MATCHER.query("FORUM_4", fuzzy=False).locate(_screen("FORUM_4")) is not None
@@ -0,0 +1,43 @@
+import pytest
+
+from tests.common.tc2_permission_guest import NAV_MATCHER
+from utils.keyword_matcher import KeywordMatcher, _norm_ocr
+from utils.screen_text import OCRBox, ScreenText
+
+
+def _screen(*texts):
+    boxes = [OCRBox(t, ((0, i * 20), (100, i * 20), (100, i * 20 + 10), (0, i * 20 + 10)), 0.9)
+             for i, t in enumerate(texts)]
+    return ScreenText(boxes, (100, 20 * len(texts)))
+
+
+def test_norm_keeps_vertical_bar_as_i():
+    assert _norm_ocr("CHAT|") == "CHATI"
+    assert _norm_ocr("CHAT ||") == "CHATII"
+
+
+@pytest.mark.parametrize("category", ["CHAT_1", "CHAT_2"])
+@pytest.mark.parametrize("text", ["CHAT", "CHATTING", "CHAT 채널 목록", "CHAT_"])
+def test_chat_queries_ignore_bare_chat_boxes(category, text):
+    assert NAV_MATCHER.query(category).locate(_screen(text)) is None
+
+
+def test_vertical_bar_variants_resolve_to_their_channel():
+    screen = _screen("CHAT||", "CHAT|")
+    assert NAV_MATCHER.query("CHAT_2").locate(screen).box.text == "CHAT||"
+    assert NAV_MATCHER.query("CHAT_1").locate(screen).box.text == "CHAT|"
+
+
+def test_longest_keyword_wins_between_categories():
+    hits = NAV_MATCHER.box_hits(_screen("CHATII").boxes[0], exclusive=True)
+    assert [h.category for h in hits] == ["CHAT_2"]
+
+
+def test_scan_screen_finds_all_categories_in_one_pass():
+    hits = NAV_MATCHER.scan_screen(_screen("BLOCK_1", "CHAT 2", "F0RUM_1"))
+    assert set(hits) == {"BLOCK_1", "CHAT_2", "FORUM_1"}
+
+
+def test_pattern_that_prefixes_another_category_is_rejected():
+    with pytest.raises(ValueError):
+        KeywordMatcher({"CHAT_1": ["CHAT_1", "CHAT"], "CHAT_2": ["CHAT_2"]})
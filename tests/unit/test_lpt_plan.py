@@ -0,0 +1,45 @@
+import itertools
+import random
+
+import pytest
+
+from utils.device_runner import lpt_plan
+
+
+def _optimal_makespan(durations, slots):
+    best = float("inf")
+    for assignment in itertools.product(range(slots), repeat=len(durations)):
+        loads = [0.0] * slots
+        for d, slot in zip(durations, assignment):
+            loads[slot] += d
+        best = min(best, max(loads))
+    return best
+
+
+def test_longest_cases_are_queued_first_and_all_assigned_once():
+    estimates = {"tc2_block": 120.0, "tc2_chat": 300.0, "tc2_forum": 200.0, "tc1": 60.0}
+    order, plan, makespan = lpt_plan(estimates, 2)
+    assert order == ["tc2_chat", "tc2_forum", "tc2_block", "tc1"]
+    assert sorted(itertools.chain.from_iterable(plan)) == sorted(estimates)
+    assert makespan == max(sum(estimates[c] for c in slot) for slot in plan)
+    assert makespan == 360.0                          # LPT: chat | forum+block → tc1은 chat 쪽
+
+
+def test_single_slot_and_more_slots_than_cases():
+    estimates = {"a": 3.0, "b": 2.0}
+    assert lpt_plan(estimates, 1)[2] == 5.0
+    assert lpt_plan(estimates, 0)[2] == 5.0          # 기기 0대도 1슬롯으로 취급
+    _, plan, makespan = lpt_plan(estimates, 4)
+    assert makespan == 3.0
+    assert sum(1 for slot in plan if slot) == 2
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_makespan_within_lpt_bound_of_optimum(seed):
+    rng = random.Random(seed)
+    slots = rng.randint(2, 3)
+    durations = [round(rng.uniform(1, 100), 1) for _ in range(rng.randint(3, 7))]
+    estimates = {f"case{i}": d for i, d in enumerate(durations)}
+    makespan = lpt_plan(estimates, slots)[2]
+    optimum = _optimal_makespan(durations, slots)
+    assert optimum - 1e-9 <= makespan <= (4 / 3 - 1 / (3 * slots)) * optimum + 1e-9
@@ -0,0 +1,40 @@
+import numpy as np
+
+from utils.ocr_cache import _MISS, OCRCache
+from utils.ocr_engine import OCREngine
+
+
+class _CountingEngine(OCREngine):
+    """Reader를 로드하지 않고 언어 설정을 결과로 돌려주는 엔진"""
+
+    def __init__(self, langs):
+        super().__init__(langs=langs)
+        self.calls = 0
+
+    def readtext(self, image, **kwargs):
+        self.calls += 1
+        return [([[0, 0], [1, 0], [1, 1], [0, 1]], "+".join(self.langs), 0.9)]
+
+
+def test_disk_tier_is_separated_by_engine_langs(tmp_path):
+    image = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    ko = _CountingEngine(["ko", "en"])
+    assert OCRCache(disk_dir=str(tmp_path)).readtext(ko, image, detail=1) == (ko.readtext(image), False)
+
+    same = OCRCache(disk_dir=str(tmp_path))     # 다음 실행: 같은 모델이면 디스크 적중
+    assert same.readtext(_CountingEngine(["ko", "en"]), image, detail=1)[1] is True
+
+    ja = _CountingEngine(["ja", "en"])
+    result, hit = OCRCache(disk_dir=str(tmp_path)).readtext(ja, image, detail=1)
+    assert not hit and result[0][1] == "ja+en"
+
+
+def test_hit_and_miss_counts():
+    cache = OCRCache()
+    engine = _CountingEngine(["ko", "en"])
+    okey = cache.option_key({"detail": 1}, engine)
+    assert cache.get("img", okey) is _MISS
+    cache.put("img", okey, ["r"])
+    assert cache.get("img", okey) == ["r"]
+    assert cache.option_key({"detail": 1}, _CountingEngine(["en"])) != okey
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,127 @@
+import json
+import os
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+
+from utils.replay import FRAMES_DIR, LOOKAHEAD, SESSION_FILE, FakeDriver, ReplayMismatch
+
+
+def _tap(x, y):
+    return {"actions": [{"actions": [{"type": "pointerMove", "x": x, "y": y},
+                                     {"type": "pointerDown"}, {"type": "pointerUp"}]}]}
+
+
+def _write_session(session_dir, calls):
+    """calls: ('shot', 이름) | ('tap', x, y) | ('find', 값, 찾음) | ('size',) 목록 → 녹화 세션 디렉토리"""
+    os.makedirs(os.path.join(session_dir, FRAMES_DIR))
+    events = [{"call": "session", "session_id": "rec"}]
+    for call in calls:
+        if call[0] == "shot":
+            with open(os.path.join(session_dir, FRAMES_DIR, f"{call[1]}.png"), "wb") as f:
+                f.write(call[1].encode())
+            events.append({"call": "screenshot", "frame": call[1]})
+        elif call[0] == "tap":
+            events.append({"call": "execute", "command": Command.W3C_ACTIONS, "params": _tap(*call[1:]),
+                           "kind": "tap", "points": [list(call[1:])]})
+        elif call[0] == "find":
+            events.append({"call": "find_element", "by": "id", "value": call[1], "found": call[2]})
+        else:
+            events.append({"call": "window_size", "response": {"width": 1080, "height": 2340}})
+    with open(os.path.join(session_dir, SESSION_FILE), "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(e) + "\n" for e in events)
+    return session_dir
+
+
+@pytest.fixture
+def session(tmp_path):
+    return _write_session(str(tmp_path / "rec"), [
+        ("size",), ("shot", "home"),
+        ("tap", 100, 100), ("shot", "nav_moving"), ("shot", "nav"), ("find", "allow", False),
+        ("tap", 200, 200), ("shot", "chat1"),
+        ("tap", 300, 300), ("shot", "chat2"), ("find", "send", True),
+    ])
+
+
+def _shot(driver):
+    return driver.get_screenshot_as_png().decode()
+
+
+def _do_tap(driver, x, y):
+    driver.execute(Command.W3C_ACTIONS, _tap(x, y))
+
+
+def test_in_order_replay_returns_recorded_frames(session):
+    driver = FakeDriver(session)
+    assert driver.get_window_size() == {"width": 1080, "height": 2340}
+    assert _shot(driver) == "home"
+    _do_tap(driver, 105, 95)                    # POINT_TOLERANCE 안의 좌표
+    assert [_shot(driver) for _ in range(3)] == ["nav_moving", "nav", "nav"]
+    _do_tap(driver, 200, 200)
+    assert _shot(driver) == "chat1"
+    _do_tap(driver, 300, 300)
+    assert _shot(driver) == "chat2"
+    assert driver.stats()["skipped_recorded_actions"] == 0 and driver.unmatched == 0
+
+
+def test_settle_returns_last_frame_of_segment(session):
+    driver = FakeDriver(session, settle=True)
+    _do_tap(driver, 100, 100)
+    assert _shot(driver) == "nav"
+
+
+def test_skipped_action_realigns_forward(session):
+    driver = FakeDriver(session)
+    _do_tap(driver, 200, 200)                   # 색인으로 네비 스크롤(100,100)을 생략한 경우
+    assert _shot(driver) == "chat1"
+    assert driver.skipped == 1 and driver.unmatched == 0
+
+
+def test_extra_action_realigns_on_next_recorded_action(session):
+    driver = FakeDriver(session)
+    _do_tap(driver, 100, 100)
+    _do_tap(driver, 900, 900)                   # 녹화에 없는 추가 탭 → 다음 구간으로 추정 진행
+    assert driver.unmatched == 1 and _shot(driver) == "chat1"
+    _do_tap(driver, 200, 200)                   # 원래 동작이 오면 그 구간에 다시 맞춤
+    assert driver.position == 2 and _shot(driver) == "chat1"
+    _do_tap(driver, 300, 300)
+    assert _shot(driver) == "chat2" and driver.unmatched == 1
+
+
+def test_extra_action_raises_in_strict_mode(session):
+    driver = FakeDriver(session, strict=True)
+    with pytest.raises(ReplayMismatch):
+        _do_tap(driver, 900, 900)
+
+
+def test_action_beyond_lookahead_is_unmatched(tmp_path):
+    calls = [("shot", "start")]
+    for i in range(LOOKAHEAD + 2):
+        calls += [("tap", 50, 100 * (i + 1)), ("shot", f"s{i}")]
+    driver = FakeDriver(_write_session(str(tmp_path / "long"), calls))
+    _do_tap(driver, 50, 100 * LOOKAHEAD)        # LOOKAHEAD번째 녹화 동작까지는 찾음
+    assert _shot(driver) == f"s{LOOKAHEAD - 1}" and driver.skipped == LOOKAHEAD - 1
+    driver = FakeDriver(os.path.join(str(tmp_path), "long"))
+    _do_tap(driver, 50, 100 * (LOOKAHEAD + 1))
+    assert driver.unmatched == 1 and driver.position == 1
+
+
+def test_running_past_end_repeats_last_frame(session):
+    driver = FakeDriver(session)
+    for x in (100, 200, 300):
+        _do_tap(driver, x, x)
+    _do_tap(driver, 100, 100)                   # 녹화가 끝난 뒤의 동작
+    assert driver.unmatched == 1 and driver.position == len(driver.segments) - 1
+    assert [_shot(driver) for _ in range(2)] == ["chat2", "chat2"]
+    with pytest.raises(ReplayMismatch):
+        FakeDriver(session, strict=True)._act({"call": "click", "by": "id", "value": "missing"})
+
+
+def test_find_element_uses_recorded_lookups(session):
+    driver = FakeDriver(session)
+    _do_tap(driver, 100, 100)
+    with pytest.raises(NoSuchElementException):
+        driver.find_element("id", "allow")
+    driver.find_element("id", "send").click()   # 다음 구간의 조회 기록 + 클릭은 녹화에 없는 동작
+    assert driver.unmatched == 1
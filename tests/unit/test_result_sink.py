@@ -0,0 +1,97 @@
+import csv
+import sqlite3
+import threading
+
+from utils.result_sink import HEADER, CsvBackend, ResultSink, SqliteBackend
+
+
+class _ListBackend:
+    """write 호출을 기록하는 백엔드. fail_next만큼 기록 실패"""
+
+    def __init__(self, fail_next=0):
+        self.batches = []
+        self.fail_next = fail_next
+        self.written = threading.Event()
+
+    def write(self, rows):
+        if self.fail_next:
+            self.fail_next -= 1
+            raise IOError("network down")
+        self.batches.append([list(r) for r in rows])
+        self.written.set()
+
+    def close(self):
+        pass
+
+
+def _names(rows):
+    return [r[1] for r in rows]
+
+
+def test_batch_size_triggers_background_write():
+    backend = _ListBackend()
+    sink = ResultSink(backend, batch_size=3)
+    sink.add("a", "PASS")
+    sink.add("b", "PASS")
+    assert not backend.written.wait(0.2)        # batch_size 미만은 대기
+    sink.add("c", "FAIL", "boom")
+    assert backend.written.wait(5)
+    assert _names(backend.batches[0]) == ["a", "b", "c"]
+    assert backend.batches[0][2][3] == "boom"
+    assert sink.pending() == 0
+    sink.close()
+
+
+def test_failed_write_keeps_rows_for_next_flush():
+    backend = _ListBackend(fail_next=1)
+    sink = ResultSink(backend, batch_size=10)
+    sink.add("a", "PASS")
+    sink.add("b", "FAIL")
+    assert sink.flush(5) is False
+    assert sink.pending() == 2 and isinstance(sink.last_error, IOError)
+    assert sink.flush(5) is True
+    assert _names(backend.batches[0]) == ["a", "b"]
+    assert sink.written == 2
+    sink.close()
+
+
+def test_close_writes_remaining_rows_to_csv(tmp_path):
+    path = tmp_path / "out" / "results.csv"
+    sink = ResultSink(CsvBackend(str(path)), batch_size=2)
+    for name in ["a", "b", "c"]:
+        sink.add(name, "PASS", screenshot_path=f"{name}.png")
+    sink.close()
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == HEADER
+    assert _names(rows[1:]) == ["a", "b", "c"]
+    assert rows[3][4] == "c.png"
+
+
+def test_close_writes_remaining_rows_to_sqlite(tmp_path):
+    path = tmp_path / "results.db"
+    sink = ResultSink(SqliteBackend(str(path)), batch_size=50)
+    sink.add("a", "PASS")
+    sink.add("b", "ERROR", "timeout")
+    sink.close()
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT test_name, status, error_message FROM results ORDER BY rowid").fetchall()
+    assert rows == [("a", "PASS", ""), ("b", "ERROR", "timeout")]
+
+
+def test_spooled_rows_survive_into_new_sink(tmp_path):
+    spool = str(tmp_path / "spool.db")
+    sink = ResultSink(_ListBackend(fail_next=100), batch_size=50, spool_path=spool)
+    sink.add("a", "PASS")
+    sink.add("b", "FAIL")
+    sink.close(timeout=5)                       # 기록 실패 → 스풀 파일에 남음
+
+    backend = _ListBackend()
+    resumed = ResultSink(backend, batch_size=50, spool_path=spool)
+    assert resumed.pending() == 2
+    assert resumed.flush(5) is True
+    assert _names(backend.batches[0]) == ["a", "b"]
+    resumed.close()
+    again = ResultSink(_ListBackend(), spool_path=spool)
+    assert again.pending() == 0
+    again.close()
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from utils.scroll_stitch import estimate_shift
+
+
+def _long_list(height=3000, width=400, seed=3):
+    """채널 목록처럼 밝은 배경 위에 어두운 글자 줄이 불규칙 간격으로 있는 긴 캔버스"""
+    rng = np.random.default_rng(seed)
+    canvas = np.full((height, width), 240, np.uint8)
+    y = 10
+    while y < height - 40:
+        h = int(rng.integers(18, 30))
+        x0, x1 = sorted(rng.integers(10, width - 10, size=2))
+        canvas[y:y + h, x0:x1] = rng.integers(0, 80, size=(h, x1 - x0))
+        y += h + int(rng.integers(20, 70))
+    return canvas
+
+
+VIEW = 1200
+
+
+@pytest.mark.parametrize("dy", [0, 37, 250, 600, -120, -540])
+def test_estimate_shift_recovers_synthetic_scroll(dy):
+    canvas = _long_list()
+    top = 900
+    prev = canvas[top:top + VIEW]
+    cur = canvas[top + dy:top + dy + VIEW]
+    shift, err = estimate_shift(prev, cur)
+    assert shift == dy
+    assert err < 0.05
+
+
+def test_estimate_shift_rejects_mismatched_frames():
+    prev = _long_list(seed=1)[:VIEW]
+    assert estimate_shift(prev, prev[:-1]) == (0, 1.0)
+    _, err = estimate_shift(prev, _long_list(seed=2)[:VIEW])
+    assert err > 0.1
+
+
+def test_estimate_shift_blank_frames():
+    blank = np.full((VIEW, 400), 240, np.uint8)
+    assert estimate_shift(blank, blank) == (0, 0.0)
+    assert estimate_shift(blank, blank + 1)[1] == 1.0
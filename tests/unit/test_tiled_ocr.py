@@ -0,0 +1,107 @@
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+import utils.ocr_engine as ocr_engine
+import utils.ocr_service as ocr_service
+import utils.tiled_ocr as tiled_ocr
+from utils.ocr_cache import OCRCache
+from utils.tiled_ocr import TiledOCR, merge_tile_results, tile_bounds
+
+
+def _read_tile(boxes, top, bottom):
+    """가짜 readtext: 타일과 겹치는 박스를 타일 좌표로 잘라 반환 (잘린 박스는 글자 일부·낮은 신뢰도)"""
+    results = []
+    for x0, y0, x1, y1, text in boxes:
+        if y1 <= top or y0 >= bottom:
+            continue
+        cy0, cy1 = max(y0, top) - top, min(y1, bottom) - top
+        whole = top <= y0 and y1 <= bottom
+        results.append(([[x0, cy0], [x1, cy0], [x1, cy1], [x0, cy1]],
+                        text if whole else text[:-1], 0.9 if whole else 0.5))
+    return results
+
+
+def _run_tiles(boxes, height, tiles, overlap):
+    bounds = tile_bounds(height, tiles, overlap)
+    return merge_tile_results([_read_tile(boxes, top, bottom) for top, bottom in bounds], bounds)
+
+
+def _rects(results):
+    return sorted((bbox[0][0], bbox[0][1], bbox[2][0], bbox[2][1]) for bbox, _, _ in results)
+
+
+@pytest.mark.parametrize("height,tiles,overlap", [(2340, 4, 96), (2340, 8, 96), (1300, 3, 128), (500, 4, 0)])
+def test_tile_bounds_cover_image_with_overlap(height, tiles, overlap):
+    bounds = tile_bounds(height, tiles, overlap)
+    assert bounds[0][0] == 0 and bounds[-1][1] == height
+    for (top, bottom), (next_top, _) in zip(bounds, bounds[1:]):
+        assert top < next_top and bottom - next_top >= overlap
+
+
+def test_tile_bounds_reduce_tile_count_for_short_images():
+    assert len(tile_bounds(2340, 4, 96)) == 4
+    assert len(tile_bounds(600, 8, 96)) == 2          # 띠 높이 >= 겹침 x 3
+    assert tile_bounds(200, 4, 96) == [(0, 200)]
+
+
+@pytest.mark.parametrize("tiles", [1, 2, 4, 8])
+def test_merge_matches_single_pass(tiles):
+    boxes = [(40, y, 40 + 30 * (i % 7 + 3), y + 40, f"line{i}") for i, y in enumerate(range(20, 2300, 55))]
+    boxes.append((600, 1170, 900, 1220, "right"))
+    merged = _run_tiles(boxes, 2340, tiles, 96)
+    truth = _read_tile(boxes, 0, 2340)
+    assert sorted(text for _, text, _ in merged) == sorted(text for _, text, _ in truth)
+    assert _rects(merged) == _rects(truth)
+
+
+def test_box_taller_than_overlap_is_merged_into_one():
+    boxes = [(100, 500, 700, 650, "big"), (100, 700, 400, 740, "small")]
+    bounds = [(0, 600), (504, 1200)]
+    merged = merge_tile_results([_read_tile(boxes, top, bottom) for top, bottom in bounds], bounds)
+    assert _rects(merged) == [(100, 500, 700, 650), (100, 700, 400, 740)]
+    assert [text for _, text, _ in merged] == ["bi", "small"]
+
+
+def test_overlapping_boxes_in_same_tile_are_kept():
+    tile = [([[0, 0], [200, 0], [200, 40], [0, 40]], "A", 0.9),
+            ([[10, 5], [190, 5], [190, 35], [10, 35]], "B", 0.8)]
+    merged = merge_tile_results([tile, []], [(0, 600), (504, 1200)])
+    assert sorted(text for _, text, _ in merged) == ["A", "B"]
+
+
+class _FakeService:
+    def __init__(self):
+        self.calls = 0
+
+    def submit(self, image, **kwargs):
+        self.calls += 1
+        future = Future()
+        future.set_result([([[0, 0], [10, 0], [10, 10], [0, 10]], "tile", 0.9)])
+        return future
+
+
+class _FakeEngine:
+    langs, gpu = ["ko", "en"], False
+
+    def readtext(self, image, **kwargs):
+        return [([[0, 0], [10, 0], [10, 10], [0, 10]], "whole", 0.9)]
+
+
+def test_tiled_and_untiled_results_use_separate_cache_keys(monkeypatch):
+    cache = OCRCache(max_entries=8)
+    tiler = TiledOCR(tiles=2, overlap=96, min_height=1200, service=_FakeService())
+    monkeypatch.setattr(ocr_service, "get_ocr_cache", lambda: cache)
+    monkeypatch.setattr(ocr_service, "get_ocr_service", lambda: None)
+    monkeypatch.setattr(ocr_engine, "get_ocr_engine", lambda: _FakeEngine())
+    image = np.zeros((1600, 100), np.uint8)
+
+    monkeypatch.setattr(tiled_ocr, "get_tiled_ocr", lambda: None)
+    assert ocr_service.submit_readtext(image, detail=1, paragraph=False).result()[0][1] == "whole"
+
+    monkeypatch.setattr(tiled_ocr, "get_tiled_ocr", lambda: tiler)
+    first = ocr_service.submit_readtext(image, detail=1, paragraph=False)
+    assert not first.cache_hit and first.result()[0][1] == "tile"
+    second = ocr_service.submit_readtext(image, detail=1, paragraph=False)
+    assert second.cache_hit and tiler.service.calls == 2
@@ -0,0 +1,81 @@
+from concurrent.futures import Future
+
+import pytest
+
+import utils.frame_buffer as frame_buffer
+import utils.verifier as verifier_mod
+from utils.artifact_store import ArtifactStore
+from utils.frame_buffer import FrameRing, dump_failure_frames
+from utils.screen_text import ScreenText
+from utils.verifier import Verifier, check_log, failed_checks
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ArtifactStore(str(tmp_path))
+    monkeypatch.setattr(frame_buffer, "_ring", FrameRing())
+    monkeypatch.setattr(frame_buffer, "get_artifact_store", lambda: store)
+    return store
+
+
+@pytest.fixture
+def pending_ocr(monkeypatch):
+    """OCR 대신 테스트가 직접 완료시키는 Future"""
+    futures = []
+
+    def _read_screen_async(image, crop_area=None, region=None):
+        futures.append(Future())
+        return futures[-1]
+    monkeypatch.setattr(verifier_mod, "read_screen_async", _read_screen_async)
+    return futures
+
+
+def _labels(store, reason):
+    return [e["label"] for e in store.manifest()["steps"].get(reason, [])]
+
+
+def test_deferred_failure_dumps_frames_from_submit_time(store, pending_ocr):
+    ring = frame_buffer.get_frame_buffer()
+    verifier = Verifier(batch_size=0)
+
+    def check(screen):
+        dump_failure_frames("chat_2_fail")
+        return False
+
+    ring.push(b"chat2-screen", "chat2_check")
+    verifier.submit("CHAT_2", None, check)
+    ring.push(b"back", "chat_back")             # 판정 전에 다음 채널로 이동
+    ring.push(b"chat3-screen", "chat3_check")
+    pending_ocr[0].set_result(ScreenText())
+    verifier.drain()
+
+    assert _labels(store, "chat_2_fail") == ["chat2_check"]
+    dump_failure_frames("live")                 # 판정 밖에서는 현재 버퍼 중 아직 저장 안 된 프레임
+    assert _labels(store, "live") == ["chat_back", "chat3_check"]
+
+
+def test_check_exception_dumps_snapshot_and_fails(store, pending_ocr):
+    ring = frame_buffer.get_frame_buffer()
+    before = len(check_log())
+    verifier = Verifier(batch_size=0)
+    ring.push(b"forum1", "forum_1_landing")
+    verifier.submit("FORUM_1", None, lambda screen: 1 / 0)
+    ring.push(b"forum2", "forum_2_landing")
+    pending_ocr[0].set_result(ScreenText())
+    verifier.drain()
+
+    assert verifier.results["FORUM_1"] is None
+    assert failed_checks(before) == ["FORUM_1"]
+    assert _labels(store, "FORUM_1_verify_error") == ["forum_1_landing"]
+
+
+def test_results_are_run_in_submit_order(store, pending_ocr):
+    verifier = Verifier(batch_size=0)
+    order = []
+    verifier.submit("A", None, lambda s: order.append("A") or True)
+    verifier.submit("B", None, lambda s: order.append("B") or True)
+    pending_ocr[1].set_result(ScreenText())
+    assert verifier.poll() == 0                 # 앞 판정(A)이 안 끝났으면 B도 대기
+    pending_ocr[0].set_result(ScreenText())
+    assert verifier.poll() == 2
+    assert order == ["A", "B"]
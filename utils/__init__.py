@@ -4,10 +4,13 @@ from .helpers import (
     wait_for_element,
     is_element_present
 )
+from .ocr_engine import get_ocr_engine, configure_ocr
 
 __all__ = [
     'take_screenshot',
     'log_result_to_sheet',
     'wait_for_element',
-    'is_element_present'
+    'is_element_present',
+    'get_ocr_engine',
+    'configure_ocr'
 ] 
\ No newline at end of file
@@ -0,0 +1,278 @@
+# utils/artifact_store.py
+"""
+스크린샷 산출물 저장소.
+
+- 백그라운드 스레드 1개에서 저장 (테스트 스레드는 해시 계산만 하고 바로 진행)
+- 내용 주소 파일명(objects/<sha1 앞 16자>.<ext>): 같은 화면은 저장 방식과 관계없이 한 번만 저장
+- 일반 프레임은 손실 압축(jpg/webp) / 축소 저장 가능, 실패 증거(keep=True)는 항상 원본 PNG
+  (objects/<sha1>.keep.png). 일반으로 저장된 화면이 나중에 keep으로 저장되면 원본 PNG로 승격
+- 용량 상한: 넘으면 오래 참조되지 않은 일반 프레임부터 삭제 (keep 프레임은 삭제하지 않음)
+- 실행별 manifest(runs/<run_id>.json): 스텝 이름 → 파일 목록 (트레이싱 단계/채널 포함)
+
+환경변수:
+  ARTIFACT_DIR=./reports/screenshots
+  ARTIFACT_FORMAT=png        # 일반 프레임 형식: png | jpg | webp
+  ARTIFACT_QUALITY=80        # jpg/webp 품질
+  ARTIFACT_SCALE=1.0         # 일반 프레임 축소 배율
+  ARTIFACT_MAX_MB=500        # 저장소 용량 상한 (0이면 무제한)
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import atexit
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from utils.tracing import current_step
+
+OBJECTS_DIR = "objects"
+RUNS_DIR = "runs"
+KEEP_SUFFIX = ".keep"
+_EXTENSIONS = (".png", ".jpg", ".webp")
+
+
+@dataclass
+class _Object:
+    path: str
+    size: int
+    last_used: float
+    keep: bool          # False → True로만 바뀜 (승격)
+
+
+class ArtifactStore:
+    """
+    :param root: 저장 루트 디렉토리
+    :param fmt: 일반 프레임 저장 형식 (png | jpg | webp)
+    :param quality: jpg/webp 품질 (0~100)
+    :param scale: 일반 프레임 축소 배율 (1.0이면 원본 크기)
+    :param max_bytes: 용량 상한 (0 또는 None이면 무제한)
+    """
+
+    def __init__(self, root: str = "./reports/screenshots", fmt: str = "png", quality: int = 80,
+                 scale: float = 1.0, max_bytes: Optional[int] = None, run_id: Optional[str] = None):
+        if fmt not in ("png", "jpg", "webp"):
+            raise ValueError(f"지원하지 않는 형식: {fmt} (png | jpg | webp)")
+        self.root = root
+        self.fmt = fmt
+        self.quality = quality
+        self.scale = scale
+        self.max_bytes = max_bytes or 0
+        self.run_id = run_id or f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self._objects: Dict[str, _Object] = {}
+        self._total = 0
+        self._entries: Dict[str, List[dict]] = {}
+        self._lock = threading.Lock()
+        # 저장 예약 ↔ flush 직렬화용 (쓰기 스레드는 잡지 않으므로 flush가 잡은 채로 대기해도 교착 없음)
+        self._writer_lock = threading.Lock()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Future] = {}
+        self.dedup_hits = 0
+        self.evicted = 0
+        os.makedirs(os.path.join(root, OBJECTS_DIR), exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        """이전 실행이 남긴 객체도 용량 계산/중복 제거 대상에 포함"""
+        directory = os.path.join(self.root, OBJECTS_DIR)
+        # keep 파일을 먼저 보고, 같은 화면의 일반 파일(승격 도중 종료로 남은 것)은 지움
+        for filename in sorted(os.listdir(directory), key=lambda f: KEEP_SUFFIX not in f):
+            stem, ext = os.path.splitext(filename)
+            if ext not in _EXTENSIONS:
+                continue
+            key, keep = stem.split(".")[0], stem.endswith(KEEP_SUFFIX)
+            path = os.path.join(directory, filename)
+            if key in self._objects:
+                os.remove(path)
+                continue
+            stat = os.stat(path)
+            self._objects[key] = _Object(path, stat.st_size, stat.st_mtime, keep)
+            self._total += stat.st_size
+
+    def _object_path(self, key: str, keep: bool, lossless: bool) -> str:
+        name = f"{key}{KEEP_SUFFIX}.png" if keep else f"{key}.{'png' if lossless else self.fmt}"
+        return os.path.join(self.root, OBJECTS_DIR, name)
+
+    def _get_writer(self) -> ThreadPoolExecutor:
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+        return self._writer
+
+    # ---------- 저장 ----------
+    def save_png(self, png_bytes: bytes, name: str, keep: bool = False, meta: Optional[dict] = None,
+                 wait: bool = False) -> str:
+        """
+        PNG 바이트를 저장 예약하고 최종 경로를 반환 (실제 쓰기는 백그라운드).
+        :param name: 스텝 이름 (manifest 키)
+        :param keep: True면 원본 PNG 그대로 저장하고 용량 상한으로 삭제하지 않음 (실패 증거용)
+        :param meta: manifest 항목에 덧붙일 정보 (버퍼 프레임의 캡처 시각/단계 등, 같은 키는 덮어씀)
+        :param wait: True면 파일 쓰기가 끝난 뒤 반환 (반환 경로를 바로 열거나 OCR하는 호출부용)
+        """
+        key = hashlib.sha1(png_bytes).hexdigest()[:16]
+        lossless = keep or (self.fmt == "png" and self.scale >= 1.0)
+        now = time.time()
+        with self._writer_lock:
+            with self._lock:
+                obj = self._objects.get(key)
+                if obj is None:
+                    # 크기는 쓰기 후 갱신. 중복 예약을 막기 위해 먼저 등록
+                    obj = self._objects[key] = _Object(self._object_path(key, keep, lossless), 0, now, keep)
+                    task = (key, obj.path, png_bytes, lossless)
+                elif keep and not obj.keep:
+                    # 일반 프레임으로 저장된 화면 → 원본 PNG keep 객체로 승격 (기존 파일은 쓰기 후 삭제)
+                    replaces, obj.path, obj.keep = obj.path, self._object_path(key, True, True), True
+                    obj.last_used = now
+                    task = (key, obj.path, png_bytes, True, replaces)
+                else:
+                    obj.last_used = now
+                    self.dedup_hits += 1
+                    task = None
+                step, channel = current_step()
+                entry = {
+                    "file": os.path.relpath(obj.path, self.root), "object": key, "time": time.strftime("%H:%M:%S"),
+                    "keep": keep, "dedup": task is None, "step": step, "channel": channel,
+                }
+                entry.update(meta or {})
+                self._entries.setdefault(name, []).append(entry)
+                path = obj.path
+            if task is not None:
+                self._pending[key] = self._get_writer().submit(self._write, *task)
+            future = self._pending.get(key)
+        if wait and future is not None:
+            future.result()
+        return path
+
+    def _encode(self, png_bytes: bytes) -> bytes:
+        image = cv2.imdecode(np.frombuffer(png_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise ValueError("스크린샷 PNG 디코딩 실패")
+        if self.scale < 1.0:
+            h, w = image.shape[:2]
+            image = cv2.resize(image, (max(1, int(w * self.scale)), max(1, int(h * self.scale))),
+                               interpolation=cv2.INTER_AREA)
+        if self.fmt == "jpg":
+            params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+        elif self.fmt == "webp":
+            params = [cv2.IMWRITE_WEBP_QUALITY, self.quality]
+        else:
+            params = []
+        ok, buf = cv2.imencode(f".{self.fmt}", image, params)
+        if not ok:
+            raise ValueError(f"{self.fmt} 인코딩 실패")
+        return buf.tobytes()
+
+    def _write(self, key: str, path: str, png_bytes: bytes, lossless: bool, replaces: Optional[str] = None):
+        try:
+            data = png_bytes if lossless else self._encode(png_bytes)
+            with open(path, "wb") as f:
+                f.write(data)
+        except Exception as e:
+            print(f"⚠️ 스크린샷 저장 실패 ({path}): {e}")
+            with self._lock:
+                if replaces is None:
+                    self._objects.pop(key, None)
+                elif key in self._objects:
+                    self._objects[key].path = replaces    # 승격 실패: 기존 파일 유지 (keep 표시는 유지)
+            return
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None:
+                if replaces is not None and replaces != path:
+                    try:
+                        os.remove(replaces)
+                    except OSError:
+                        pass
+                    self._total -= obj.size
+                obj.size = len(data)
+                self._total += len(data)
+            self._evict()
+
+    def _evict(self):
+        """용량 상한 초과 시 오래 참조되지 않은 일반 프레임부터 삭제 (lock 보유 상태에서 호출)"""
+        if not self.max_bytes or self._total <= self.max_bytes:
+            return
+        candidates = sorted((o.last_used, key) for key, o in self._objects.items() if not o.keep and o.size)
+        for _, key in candidates:
+            if self._total <= self.max_bytes:
+                break
+            obj = self._objects.pop(key)
+            try:
+                os.remove(obj.path)
+            except OSError:
+                pass
+            self._total -= obj.size
+            self.evicted += 1
+
+    # ---------- manifest ----------
+    def _entry_file(self, entry: dict) -> str:
+        """항목의 현재 파일 (승격으로 경로가 바뀌었으면 새 경로, 삭제된 객체면 기록 당시 경로). lock 보유 상태에서 호출"""
+        obj = self._objects.get(entry["object"])
+        return os.path.relpath(obj.path, self.root) if obj is not None else entry["file"]
+
+    def manifest(self) -> dict:
+        with self._lock:
+            steps = {}
+            for name, entries in self._entries.items():
+                steps[name] = []
+                for e in entries:
+                    file = self._entry_file(e)
+                    steps[name].append(dict(e, file=file, evicted=not os.path.exists(os.path.join(self.root, file))))
+            return {
+                "run_id": self.run_id,
+                "format": self.fmt, "quality": self.quality, "scale": self.scale,
+                "total_bytes": self._total, "dedup_hits": self.dedup_hits, "evicted": self.evicted,
+                "steps": steps,
+            }
+
+    def write_manifest(self) -> Optional[str]:
+        if not self._entries:
+            return None
+        directory = os.path.join(self.root, RUNS_DIR)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.run_id}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def path_for(self, name: str) -> Optional[str]:
+        """스텝 이름으로 마지막 저장 파일 경로 조회"""
+        with self._lock:
+            entries = self._entries.get(name)
+            return os.path.join(self.root, self._entry_file(entries[-1])) if entries else None
+
+    def flush(self):
+        """대기 중인 저장이 끝날 때까지 대기하고 manifest 갱신 (그동안 들어온 저장 예약은 flush 뒤로 밀림)"""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                writer.shutdown(wait=True)
+            self._pending.clear()
+            self.write_manifest()
+
+
+_store: Optional[ArtifactStore] = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """프로세스 전역 ArtifactStore (종료 시 flush + manifest 기록)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                max_mb = float(os.environ.get("ARTIFACT_MAX_MB", "500"))
+                _store = ArtifactStore(
+                    root=os.environ.get("ARTIFACT_DIR", "./reports/screenshots"),
+                    fmt=os.environ.get("ARTIFACT_FORMAT", "png").lower(),
+                    quality=int(os.environ.get("ARTIFACT_QUALITY", "80")),
+                    scale=float(os.environ.get("ARTIFACT_SCALE", "1.0")),
+                    max_bytes=int(max_mb * 1024 * 1024),
+                )
+                atexit.register(_store.flush)
+    return _store
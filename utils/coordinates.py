@@ -1,14 +1,24 @@
 from __future__ import annotations
-import os, json
+import os, json, time, threading
 from typing import Dict, Tuple, Optional, Any
 
 Json = Dict[str, Any]
+Rect = Tuple[int, int, int, int]  # (left, top, right, bottom) px
 
-def get_device_resolution(driver) -> Tuple[int, int]:
-    """Appium Driver에서 현재 디바이스 해상도(px)를 가져옴"""
+# 세션별 해상도 캐시 (get_window_size는 Appium HTTP 왕복이므로 세션당 1회만)
+_window_sizes: Dict[Any, Tuple[int, int]] = {}
+
+def _session_key(driver) -> Any:
+    return getattr(driver, "session_id", None) or id(driver)
+
+def get_device_resolution(driver, refresh: bool = False) -> Tuple[int, int]:
+    """Appium Driver에서 현재 디바이스 해상도(px)를 가져옴 (세션별 캐시, refresh=True면 재조회)"""
+    key = _session_key(driver)
+    if not refresh and key in _window_sizes:
+        return _window_sizes[key]
     size = driver.get_window_size()
-    
-    return int(size["width"]), int(size["height"])
+    _window_sizes[key] = (int(size["width"]), int(size["height"]))
+    return _window_sizes[key]
 
 def _load_json(path: str) -> Json:
     if not os.path.exists(path):
@@ -32,7 +42,7 @@ def _extract_points_and_ref(data: Json) -> Tuple[Dict[str, Dict[str, float]], Tu
 
     source_points = data.get("points") if isinstance(data.get("points"), dict) else {
         k: v for k, v in data.items()
-        if k not in ("reference", "_reference") and isinstance(v, (dict, list, tuple))
+        if k not in ("reference", "_reference", "regions") and isinstance(v, (dict, list, tuple))
     }
 
     valid: Dict[str, Dict[str, float]] = {}
@@ -48,6 +58,20 @@ def _extract_points_and_ref(data: Json) -> Tuple[Dict[str, Dict[str, float]], Tu
 
     return valid, (ref_w, ref_h)
 
+def _extract_regions(data: Json) -> Dict[str, Tuple[float, float, float, float]]:
+    """
+    rel_position.json의 'regions'에서 OCR 관심 영역 추출.
+    - 값 형태: [left, top, right, bottom] 또는 {"left":..,"top":..,"right":..,"bottom":..}
+    - 0~1 비율 또는 reference 해상도 기준 px
+    """
+    regions: Dict[str, Tuple[float, float, float, float]] = {}
+    for name, val in (data.get("regions") or {}).items():
+        if isinstance(val, dict) and all(k in val for k in ("left", "top", "right", "bottom")):
+            regions[name] = (float(val["left"]), float(val["top"]), float(val["right"]), float(val["bottom"]))
+        elif isinstance(val, (list, tuple)) and len(val) == 4:
+            regions[name] = tuple(float(v) for v in val)
+    return regions
+
 def rel_to_abs(
     rel_x: float,
     rel_y: float,
@@ -78,6 +102,123 @@ def rel_to_abs(
         abs_y = max(1, min(cur_h - 1, abs_y))
     return abs_x, abs_y
 
+def rel_rect_to_abs(
+    rect: Tuple[float, float, float, float],
+    current_size: Tuple[int, int],
+    reference_size: Optional[Tuple[int, int]] = None,
+) -> Rect:
+    """상대 사각형 → 절대 사각형(px). 화면 경계로 잘라냄"""
+    cur_w, cur_h = current_size
+    left, top = rel_to_abs(rect[0], rect[1], current_size, reference_size, clamp=False)
+    right, bottom = rel_to_abs(rect[2], rect[3], current_size, reference_size, clamp=False)
+    return (max(0, min(cur_w, left)), max(0, min(cur_h, top)),
+            max(0, min(cur_w, right)), max(0, min(cur_h, bottom)))
+
+class CoordinateMap:
+    """
+    rel_position.json을 한 번만 파싱해 두고, 해상도별로 모든 키를 절대좌표로 미리 변환해 보관.
+    - 파일 mtime이 바뀌면 다시 읽음 (mtime 확인은 check_interval초에 한 번)
+    - 이후 조회는 dict 조회만 (파일 I/O, Appium 호출 없음)
+    """
+
+    def __init__(self, json_path: str = "utils/rel_position.json", check_interval: float = 1.0):
+        self.json_path = json_path
+        self.check_interval = check_interval
+        self._mtime: Optional[float] = None
+        self._last_check = 0.0
+        self._points: Dict[str, Dict[str, float]] = {}
+        self._reference: Tuple[int, int] = (0, 0)
+        self._regions: Dict[str, Tuple[float, float, float, float]] = {}
+        self._resolved: Dict[Tuple[int, int], Dict[str, Tuple[int, int]]] = {}
+        self._resolved_regions: Dict[Tuple[int, int], Dict[str, Rect]] = {}
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        now = time.monotonic()
+        if self._mtime is not None and now - self._last_check < self.check_interval:
+            return
+        with self._lock:
+            self._last_check = now
+            try:
+                mtime = os.path.getmtime(self.json_path)
+            except OSError:
+                raise FileNotFoundError(f"JSON not found: {self.json_path}")
+            if mtime == self._mtime:
+                return
+            data = _load_json(self.json_path)
+            points, ref = _extract_points_and_ref(data)
+            self._points, self._reference = points, ref
+            self._regions = _extract_regions(data)
+            self._resolved = {}
+            self._resolved_regions = {}
+            self._mtime = mtime
+
+    @property
+    def points(self) -> Dict[str, Dict[str, float]]:
+        self._ensure_loaded()
+        return self._points
+
+    @property
+    def reference(self) -> Tuple[int, int]:
+        self._ensure_loaded()
+        return self._reference
+
+    def resolve_all(self, current_size: Tuple[int, int]) -> Dict[str, Tuple[int, int]]:
+        """현재 해상도 기준 모든 키의 절대좌표 (해상도별 1회 계산)"""
+        self._ensure_loaded()
+        resolved = self._resolved.get(current_size)
+        if resolved is None:
+            resolved = {
+                name: rel_to_abs(rel["x"], rel["y"], current_size=current_size, reference_size=self._reference)
+                for name, rel in self._points.items()
+            }
+            self._resolved[current_size] = resolved
+        return resolved
+
+    def point(self, key: str, *, driver=None, current_size: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        if current_size is None:
+            if driver is None:
+                raise ValueError("driver 또는 current_size 둘 중 하나는 필요합니다.")
+            current_size = get_device_resolution(driver)
+        resolved = self.resolve_all(tuple(current_size))
+        if key not in resolved:
+            raise KeyError(f"'{key}'가 {self.json_path}에 없습니다. 존재 키 예: {list(resolved.keys())[:10]}")
+        return resolved[key]
+
+    @property
+    def regions(self) -> Dict[str, Tuple[float, float, float, float]]:
+        self._ensure_loaded()
+        return self._regions
+
+    def region(self, name: str, *, driver=None, current_size: Optional[Tuple[int, int]] = None) -> Rect:
+        """이름 있는 OCR 영역을 현재 해상도 절대 사각형(left, top, right, bottom)으로 반환"""
+        if current_size is None:
+            if driver is None:
+                raise ValueError("driver 또는 current_size 둘 중 하나는 필요합니다.")
+            current_size = get_device_resolution(driver)
+        self._ensure_loaded()
+        current_size = tuple(current_size)
+        resolved = self._resolved_regions.get(current_size)
+        if resolved is None:
+            resolved = {
+                name: rel_rect_to_abs(rect, current_size, reference_size=self._reference)
+                for name, rect in self._regions.items()
+            }
+            self._resolved_regions[current_size] = resolved
+        if name not in resolved:
+            raise KeyError(f"영역 '{name}'가 {self.json_path}의 regions에 없습니다. 존재 영역: {list(resolved.keys())}")
+        return resolved[name]
+
+
+_coordinate_maps: Dict[str, CoordinateMap] = {}
+
+def get_coordinate_map(json_path: str = "utils/rel_position.json") -> CoordinateMap:
+    """경로별 CoordinateMap 싱글턴"""
+    key = os.path.abspath(json_path)
+    if key not in _coordinate_maps:
+        _coordinate_maps[key] = CoordinateMap(json_path)
+    return _coordinate_maps[key]
+
 def get_abs_point(
     key: str,
     *,
@@ -87,16 +228,23 @@ def get_abs_point(
 ) -> Tuple[int, int]:
     """
     rel_position.json에서 key를 찾아 현재 디바이스 절대좌표(px)로 반환.
+    (CoordinateMap 캐시 사용: JSON 파싱/해상도 조회는 처음 한 번만)
     """
-    data = _load_json(json_path)
-    points, (ref_w, ref_h) = _extract_points_and_ref(data)
-    if key not in points:
-        raise KeyError(f"'{key}'가 {json_path}에 없습니다. 존재 키 예: {list(points.keys())[:10]}")
-
-    rel = points[key]
-    if current_size is None:
-        if driver is None:
-            raise ValueError("driver 또는 current_size 둘 중 하나는 필요합니다.")
-        current_size = get_device_resolution(driver)
-
-    return rel_to_abs(rel["x"], rel["y"], current_size=current_size, reference_size=(ref_w, ref_h))
\ No newline at end of file
+    return get_coordinate_map(json_path).point(key, driver=driver, current_size=current_size)
+
+
+def get_abs_region(
+    name: str,
+    *,
+    driver=None,
+    current_size: Optional[Tuple[int, int]] = None,
+    json_path: str = "utils/rel_position.json",
+) -> Rect:
+    """rel_position.json의 regions에서 name을 찾아 현재 디바이스 절대 사각형(px)으로 반환"""
+    return get_coordinate_map(json_path).region(name, driver=driver, current_size=current_size)
+
+def resolve_region(region, current_size: Tuple[int, int], json_path: str = "utils/rel_position.json") -> Optional[Rect]:
+    """영역 이름이면 절대 사각형으로 변환, 사각형/None이면 그대로 반환"""
+    if region is None or not isinstance(region, str):
+        return region
+    return get_abs_region(region, current_size=current_size, json_path=json_path)
@@ -0,0 +1,303 @@
+# utils/device_runner.py
+"""
+다중 기기 병렬 실행기.
+
+config/devices.json 의 "devices" 목록에서 기기마다 워커 프로세스 하나를 띄운다.
+- 워커마다 자체 Appium 세션(udid, systemPort, 서버 주소)과 산출물 디렉토리(reports/runs/<run_id>/<기기>/)
+- 테스트 케이스는 공유 큐에 넣고, 먼저 끝난 기기가 다음 케이스를 가져감 → 기기 수만큼 전체 시간이 줄어듦
+- 소요 시간 추정(duration_store)을 주면 긴 케이스부터 큐에 넣는다 (LPT: longest processing time first).
+  기기 배정은 고정하지 않으므로 예상보다 일찍 끝난 기기가 남은 케이스를 가져가 자동으로 재분배됨
+- 결과는 부모 프로세스에서 하나의 리포트(report.json + 결과 기록 버퍼)로 병합. 예상/실제 makespan 포함
+
+devices.json 항목:
+  {"name": "device1", "udid": "${APPIUM_UDID}", "systemPort": 8200, "serverUrl": "http://localhost:4723"}
+  - ${ENV} 는 환경변수로 치환. udid가 비어 있는 항목은 건너뜀
+  - systemPort 는 같은 Appium 서버를 쓰는 기기끼리 겹치면 안 됨 (serverUrl 생략 시 APPIUM_SERVER_URL)
+
+케이스 판정: 예외 없이 끝나고 FAIL 판정(verifier.check_log)이 없으면 PASS,
+FAIL 판정이 기록되면 FAIL, 예외가 빠져나가면 ERROR, 실행되지 못한 케이스는 SKIPPED.
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import heapq
+import queue as queue_mod
+import multiprocessing
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEVICES_PATH = "config/devices.json"
+RUNS_DIR = "./reports/runs"
+
+
+@dataclass
+class Device:
+    name: str
+    udid: str
+    system_port: Optional[int] = None
+    server_url: Optional[str] = None
+
+
+@dataclass
+class CaseResult:
+    case: str
+    device: str
+    status: str                     # PASS | FAIL | ERROR | SKIPPED
+    seconds: float = 0.0
+    failures: List[str] = field(default_factory=list)
+    error: str = ""
+    estimate: float = 0.0
+    steps: List[list] = field(default_factory=list)     # [단계, 채널, 초] (set_step 구간)
+
+
+def _expand(value) -> str:
+    """'${VAR}' 치환. 정의되지 않은 변수는 빈 문자열"""
+    if not isinstance(value, str):
+        return value
+    expanded = os.path.expandvars(value)
+    return "" if "${" in expanded else expanded
+
+
+def load_devices(path: str = DEVICES_PATH, only: Optional[Sequence[str]] = None) -> List[Device]:
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f).get("devices", [])
+    devices = []
+    for entry in entries:
+        name = entry.get("name") or entry.get("udid")
+        if only and name not in only:
+            continue
+        udid = _expand(entry.get("udid", ""))
+        if not udid:
+            print(f"⚠️ udid 없음, 건너뜀: {name}")
+            continue
+        port = _expand(entry.get("systemPort"))
+        devices.append(Device(name, udid, int(port) if port else None, _expand(entry.get("serverUrl")) or None))
+    ports = [d.system_port for d in devices if d.system_port]
+    if len(ports) != len(set(ports)):
+        raise ValueError(f"systemPort가 겹치는 기기가 있습니다: {ports}")
+    return devices
+
+
+def _device_env(device: Device, device_dir: str):
+    """워커 프로세스의 전역 저장소들이 기기별 경로를 쓰도록 환경변수 지정 (get_X() 첫 호출 전에)"""
+    os.environ["ARTIFACT_DIR"] = os.path.join(device_dir, "screenshots")
+    kind = (os.environ.get("RESULT_SINK") or ("sheets" if os.getenv("GOOGLE_SHEET_ID") else "csv")).lower()
+    if kind != "sheets":
+        # 로컬 파일에 여러 프로세스가 동시에 이어 쓰지 않도록 기기별 파일
+        os.environ["RESULT_SINK_PATH"] = os.path.join(device_dir, f"results.{'db' if kind == 'sqlite' else 'csv'}")
+    if os.environ.get("RESULT_SPOOL_PATH"):
+        os.environ["RESULT_SPOOL_PATH"] = os.path.join(device_dir, "result_spool.db")
+    if os.environ.get("APPIUM_RECORD_SESSION"):
+        os.environ["APPIUM_RECORD_SESSION"] = f"{os.environ['APPIUM_RECORD_SESSION']}_{device.name}"
+
+
+def _worker(device: Device, cases, results, run_dir: str):
+    """기기 하나를 맡는 프로세스: 세션 1개로 큐가 빌 때까지 케이스 실행"""
+    device_dir = os.path.join(run_dir, device.name)
+    os.makedirs(device_dir, exist_ok=True)
+    _device_env(device, device_dir)
+
+    from tests.common import load_scenario
+    from utils.driver_setup import setup_android_driver
+    from utils.frame_buffer import dump_frames_on_error, get_frame_buffer
+    from utils.screen_capture import flush_pending_writes
+    from utils.result_sink import close_result_sink
+    from utils.tracing import end_step, export_chrome_trace, reset_trace, trace_spans
+    from utils.verifier import check_log, failed_checks
+
+    try:
+        driver = setup_android_driver(udid=device.udid, device_name=device.name,
+                                      system_port=device.system_port, server_url=device.server_url)
+    except Exception as e:
+        # 케이스를 가져가지 않고 종료 → 남은 기기가 처리
+        results.put(("device_error", device.name, str(e)))
+        return
+    results.put(("device_ready", device.name, ""))
+
+    try:
+        while True:
+            case = cases.get()
+            if case is None:
+                break
+            case, estimate = case
+            before = len(check_log())
+            result = CaseResult(case, device.name, "PASS", estimate=estimate)
+            reset_trace()
+            get_frame_buffer().clear()      # 이전 케이스 프레임이 이 케이스 실패에 섞이지 않게
+            start = time.perf_counter()
+            try:
+                with dump_frames_on_error(f"{case}_exception"):
+                    load_scenario(case)(driver)
+            except Exception as e:
+                result.status, result.error = "ERROR", f"{type(e).__name__}: {e}"
+            finally:
+                result.seconds = round(time.perf_counter() - start, 2)
+                end_step()
+                export_chrome_trace(case, trace_dir=os.path.join(device_dir, "traces"))
+            result.steps = [[s.args.get("step"), s.args.get("channel"), round(s.duration, 2)]
+                            for s in trace_spans() if s.cat == "step"]
+            result.failures = failed_checks(before)
+            if result.status == "PASS" and result.failures:
+                result.status = "FAIL"
+            results.put(("case", device.name, asdict(result)))
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        # 자식 프로세스는 atexit가 돌지 않으므로 직접 flush
+        flush_pending_writes()
+        close_result_sink()
+
+
+def lpt_plan(estimates: Dict[str, float], slots: int) -> Tuple[List[str], List[List[str]], float]:
+    """
+    LPT 배정 시뮬레이션: 긴 케이스부터 현재 누적 시간이 가장 짧은 기기에 배정.
+    :return: (큐 순서, 기기 슬롯별 예상 배정, 예상 makespan)
+    """
+    order = sorted(estimates, key=lambda name: -estimates[name])
+    slots = max(1, slots)
+    loads = [(0.0, i) for i in range(slots)]
+    assignment: List[List[str]] = [[] for _ in range(slots)]
+    for name in order:
+        load, i = heapq.heappop(loads)
+        assignment[i].append(name)
+        heapq.heappush(loads, (load + estimates[name], i))
+    return order, assignment, max(load for load, _ in loads)
+
+
+def _start_shared_ocr():
+    """OCR_WORKERS>0 이면 기기 워커들이 공유할 OCR 풀 서버 시작 (주소/인증키는 환경변수로 자식에 전달)"""
+    workers = int(os.environ.get("OCR_WORKERS", "0"))
+    if workers <= 0 or os.environ.get("OCR_SERVICE_ADDRESS"):
+        return None
+    from utils.ocr_service import start_ocr_server
+
+    manager, address, authkey = start_ocr_server(workers, int(os.environ.get("OCR_QUEUE_SIZE", "0")) or None)
+    os.environ["OCR_SERVICE_ADDRESS"] = address
+    os.environ["OCR_SERVICE_AUTHKEY"] = authkey
+    return manager
+
+
+def _collect(ctx, devices: Sequence[Device], cases, results, run_dir: str) -> Tuple[List[dict], Dict[str, str]]:
+    """기기 워커 시작 → 모두 끝날 때까지 진행 메시지 수집"""
+    procs = [ctx.Process(target=_worker, args=(d, cases, results, run_dir), name=f"device-{d.name}")
+             for d in devices]
+    for p in procs:
+        p.start()
+    print(f"▶️ {len(devices)}대 기기에서 케이스 실행: {', '.join(d.name for d in devices)}")
+
+    case_results: List[dict] = []
+    device_errors: Dict[str, str] = {}
+    while True:
+        try:
+            kind, device_name, payload = results.get(timeout=1.0)
+        except queue_mod.Empty:
+            if not any(p.is_alive() for p in procs):
+                break
+            continue
+        if kind == "device_error":
+            device_errors[device_name] = payload
+            print(f"❌ [{device_name}] 세션 생성 실패: {payload}")
+        elif kind == "device_ready":
+            print(f"📱 [{device_name}] 세션 시작")
+        elif kind == "case":
+            case_results.append(payload)
+            icon = "✅" if payload["status"] == "PASS" else "❌"
+            print(f"{icon} [{device_name}] {payload['case']} {payload['status']} ({payload['seconds']:.1f}s)")
+    for p in procs:
+        p.join()
+    return case_results, device_errors
+
+
+def run_on_devices(case_names: Sequence[str], devices: Sequence[Device],
+                   runs_dir: str = RUNS_DIR, run_id: Optional[str] = None,
+                   estimates: Optional[Dict[str, float]] = None) -> dict:
+    """
+    케이스를 기기들에 나눠 병렬 실행하고 병합 리포트를 반환 (run_dir/report.json 에도 저장)
+    :param estimates: 케이스 → 예상 소요 초. 주면 LPT 순서로 큐에 넣고 예상 makespan을 리포트에 포함
+    """
+    if not devices:
+        raise ValueError("실행할 기기가 없습니다. config/devices.json 의 devices 와 udid 환경변수를 확인하세요.")
+    run_id = run_id or time.strftime("%Y%m%d_%H%M%S")
+    run_dir = os.path.join(runs_dir, run_id)
+    os.makedirs(run_dir, exist_ok=True)
+
+    # spawn: 워커가 부모의 드라이버/스레드/전역 저장소를 물려받지 않도록
+    ctx = multiprocessing.get_context("spawn")
+    cases, results = ctx.Queue(), ctx.Queue()
+    expected, plan = None, None
+    order = list(case_names)
+    if estimates:
+        order, plan, expected = lpt_plan({name: estimates.get(name, 0.0) for name in case_names}, len(devices))
+        print(f"🗂️ LPT 순서: {', '.join(f'{n}({estimates.get(n, 0.0):.0f}s)' for n in order)} "
+              f"→ 예상 makespan {expected:.0f}s")
+    for name in order:
+        cases.put((name, round((estimates or {}).get(name, 0.0), 2)))
+    for _ in devices:
+        cases.put(None)
+
+    start = time.perf_counter()
+    ocr_server = _start_shared_ocr()
+    try:
+        case_results, device_errors = _collect(ctx, devices, cases, results, run_dir)
+    finally:
+        if ocr_server is not None:
+            from utils.ocr_service import stop_ocr_server
+            stop_ocr_server(ocr_server)
+            os.environ.pop("OCR_SERVICE_ADDRESS", None)
+            os.environ.pop("OCR_SERVICE_AUTHKEY", None)
+    wall = time.perf_counter() - start
+
+    # 워커가 도중에 죽으면 큐에 남은 케이스는 실행되지 않음
+    done = {r["case"] for r in case_results}
+    for name in case_names:
+        if name not in done:
+            case_results.append(asdict(CaseResult(name, "", "SKIPPED", error="실행 가능한 기기 없음")))
+
+    busy: Dict[str, float] = {d.name: 0.0 for d in devices}
+    for r in case_results:
+        if r["device"]:
+            busy[r["device"]] += r["seconds"]
+    serial = sum(busy.values())
+    # 실제 makespan: 기기별 케이스 실행 시간 합의 최댓값 (프로세스/세션 시작 시간 제외 → 예상과 같은 기준)
+    actual = max(busy.values()) if busy else 0.0
+    report = {
+        "run_id": run_id,
+        "devices": [dict(asdict(d), error=device_errors.get(d.name, "")) for d in devices],
+        "cases": case_results,
+        "wall_seconds": round(wall, 2),
+        "serial_seconds": round(serial, 2),
+        "speedup": round(serial / wall, 2) if wall else 0.0,
+        "device_busy_seconds": {k: round(v, 2) for k, v in busy.items()},
+        "expected_makespan": round(expected, 2) if expected is not None else None,
+        "actual_makespan": round(actual, 2),
+        "plan": plan,
+    }
+    with open(os.path.join(run_dir, "report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return report
+
+
+def print_run_report(report: dict):
+    counts: Dict[str, int] = {}
+    for r in report["cases"]:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    print(f"📊 다중 기기 실행 결과 ({report['run_id']}): "
+          + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+    print(f"{'케이스':<24}{'기기':<12}{'결과':<9}{'시간(s)':>9}  비고")
+    for r in report["cases"]:
+        note = r["error"] or ", ".join(r["failures"])
+        print(f"{r['case']:<24}{r['device']:<12}{r['status']:<9}{r['seconds']:>9.1f}  {note}")
+    print(f"⏱️ 전체 {report['wall_seconds']:.1f}s (순차 실행 합계 {report['serial_seconds']:.1f}s, "
+          f"x{report['speedup']:.2f}) — 기기별 "
+          + ", ".join(f"{k} {v:.1f}s" for k, v in report["device_busy_seconds"].items()))
+    if report.get("expected_makespan") is not None:
+        expected, actual = report["expected_makespan"], report["actual_makespan"]
+        diff = (actual - expected) / expected * 100 if expected else 0.0
+        print(f"🗂️ makespan 예상 {expected:.1f}s / 실제 {actual:.1f}s ({diff:+.0f}%)")
+        misses = [r for r in report["cases"] if r["status"] != "SKIPPED" and r["estimate"]
+                  and abs(r["seconds"] - r["estimate"]) > 0.25 * r["estimate"]]
+        for r in sorted(misses, key=lambda r: -abs(r["seconds"] - r["estimate"]))[:5]:
+            print(f"   ↳ {r['case']}: 예상 {r['estimate']:.1f}s → 실제 {r['seconds']:.1f}s")
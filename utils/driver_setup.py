@@ -7,18 +7,31 @@ from appium.options.android import UiAutomator2Options
 load_dotenv()
 
 # 안드로이드 드라이버 설정
-def setup_android_driver():
+def setup_android_driver(udid=None, device_name=None, system_port=None, server_url=None):
+    """
+    환경변수 기준으로 드라이버 생성. 인자를 주면 해당 값만 덮어씀 (다중 기기 실행기용)
+    :param system_port: UiAutomator2 systemPort. 한 Appium 서버에 여러 기기를 붙일 때 기기마다 달라야 함
+    """
     desired_caps = {
         'platformName': os.environ.get('APPIUM_PLATFORM_NAME', 'Android'),
         'automationName': os.environ.get('APPIUM_AUTOMATION_NAME', 'UiAutomator2'),
-        'deviceName': os.environ.get('APPIUM_DEVICE_NAME', 'Test Device'),
-        'udid': os.environ.get('APPIUM_UDID'),
+        'deviceName': device_name or os.environ.get('APPIUM_DEVICE_NAME', 'Test Device'),
+        'udid': udid or os.environ.get('APPIUM_UDID'),
         'appPackage': os.environ.get('APPIUM_APP_PACKAGE'),
         'appActivity': os.environ.get('APPIUM_APP_ACTIVITY'),
         'noReset': os.environ.get('APPIUM_NO_RESET', 'false').lower() == 'true'
     }
+    if system_port:
+        desired_caps['systemPort'] = int(system_port)
 
-    return webdriver.Remote(
-        command_executor=os.environ.get('APPIUM_SERVER_URL', 'http://localhost:4723'),
+    driver = webdriver.Remote(
+        command_executor=server_url or os.environ.get('APPIUM_SERVER_URL', 'http://localhost:4723'),
         options=UiAutomator2Options().load_capabilities(desired_caps)
-    )
\ No newline at end of file
+    )
+
+    # APPIUM_RECORD_SESSION=이름 이면 드라이버 호출을 reports/sessions/ 에 녹화 (기기 없이 재생용)
+    record_name = os.environ.get('APPIUM_RECORD_SESSION')
+    if record_name:
+        from utils.replay import record_session
+        return record_session(driver, record_name)
+    return driver
\ No newline at end of file
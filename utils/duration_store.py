@@ -0,0 +1,123 @@
+# utils/duration_store.py
+"""
+테스트 소요 시간 기록소 (로컬 SQLite).
+
+다중 기기 실행 결과에서 케이스별 소요 시간과 단계/채널별(set_step) 소요 시간을 쌓아 두고,
+스케줄러가 다음 실행의 케이스 소요 시간을 추정할 때 사용한다.
+추정 순서: 케이스 자체 기록(최근 N회 중앙값) → 단계 기록의 합(CASE_STEPS) → 알려진 케이스 평균 → 기본값
+
+환경변수:
+  DURATION_STORE_PATH=./reports/durations.db
+  DURATION_WINDOW=5          # 중앙값을 낼 최근 기록 수
+"""
+from __future__ import annotations
+import os
+import time
+import sqlite3
+import statistics
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_SECONDS = 120.0
+
+
+class DurationStore:
+    """
+    :param path: SQLite 파일 경로
+    :param window: 추정에 쓰는 최근 기록 수
+    """
+
+    def __init__(self, path: str = "./reports/durations.db", window: int = 5):
+        self.path = path
+        self.window = max(1, window)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cases "
+                         "(id INTEGER PRIMARY KEY AUTOINCREMENT, ts REAL, run_id TEXT, name TEXT, "
+                         "device TEXT, status TEXT, seconds REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS steps "
+                         "(id INTEGER PRIMARY KEY AUTOINCREMENT, ts REAL, run_id TEXT, name TEXT, "
+                         "step TEXT, channel TEXT, seconds REAL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    # ---------- 기록 ----------
+    def record_case(self, name: str, seconds: float, status: str, device: str = "", run_id: str = "",
+                    steps: Iterable[Sequence] = ()):
+        """
+        케이스 1회 실행 기록. ERROR(중간 예외)는 소요 시간이 잘린 값이므로 단계 기록도 남기지 않는다.
+        :param steps: (단계, 채널, 초) 목록. 같은 단계/채널이 여러 번 나오면 합산
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT INTO cases (ts, run_id, name, device, status, seconds) VALUES (?, ?, ?, ?, ?, ?)",
+                         (now, run_id, name, device, status, seconds))
+            if status == "ERROR":
+                return
+            totals: Dict[Tuple[str, str], float] = {}
+            for step, channel, sec in steps:
+                key = (step, channel or "")
+                totals[key] = totals.get(key, 0.0) + sec
+            conn.executemany("INSERT INTO steps (ts, run_id, name, step, channel, seconds) VALUES (?, ?, ?, ?, ?, ?)",
+                             [(now, run_id, name, step, channel, sec) for (step, channel), sec in totals.items()])
+
+    def record_report(self, report: dict):
+        """device_runner.run_on_devices 리포트의 케이스 결과를 한 번에 기록 (SKIPPED 제외)"""
+        for r in report["cases"]:
+            if r["status"] != "SKIPPED":
+                self.record_case(r["case"], r["seconds"], r["status"], r["device"], report["run_id"],
+                                 r.get("steps", ()))
+
+    # ---------- 추정 ----------
+    def case_estimate(self, name: str) -> Optional[float]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT seconds FROM cases WHERE name = ? AND status != 'ERROR' "
+                                "ORDER BY id DESC LIMIT ?", (name, self.window)).fetchall()
+        return statistics.median(r[0] for r in rows) if rows else None
+
+    def step_estimate(self, step: str) -> Optional[float]:
+        """단계 전체 추정 = 채널별 최근 중앙값의 합 (어느 케이스에서 기록됐든 같은 단계면 공유)"""
+        with self._connect() as conn:
+            channels = [r[0] for r in conn.execute("SELECT DISTINCT channel FROM steps WHERE step = ?", (step,))]
+            if not channels:
+                return None
+            total = 0.0
+            for channel in channels:
+                rows = conn.execute("SELECT seconds FROM steps WHERE step = ? AND channel = ? "
+                                    "ORDER BY id DESC LIMIT ?", (step, channel, self.window)).fetchall()
+                total += statistics.median(r[0] for r in rows)
+        return total
+
+    def estimate(self, name: str, steps: Optional[Sequence[str]] = None) -> Tuple[Optional[float], str]:
+        """:return: (추정 초 또는 None, 근거 'case' | 'steps' | '')"""
+        seconds = self.case_estimate(name)
+        if seconds is not None:
+            return seconds, "case"
+        if steps:
+            parts = [self.step_estimate(s) for s in steps]
+            if all(p is not None for p in parts):
+                return sum(parts), "steps"
+        return None, ""
+
+    def estimates(self, names: Sequence[str], case_steps: Optional[Dict[str, List[str]]] = None,
+                  default: float = DEFAULT_SECONDS) -> Dict[str, Tuple[float, str]]:
+        """케이스 목록 전체 추정. 기록이 전혀 없는 케이스는 알려진 추정의 평균(없으면 default)"""
+        case_steps = case_steps or {}
+        found = {name: self.estimate(name, case_steps.get(name)) for name in names}
+        known = [sec for sec, _ in found.values() if sec is not None]
+        fallback = statistics.mean(known) if known else default
+        return {name: (sec, source) if sec is not None else (fallback, "default")
+                for name, (sec, source) in found.items()}
+
+
+_store: Optional[DurationStore] = None
+
+
+def get_duration_store() -> DurationStore:
+    global _store
+    if _store is None:
+        _store = DurationStore(
+            path=os.environ.get("DURATION_STORE_PATH", "./reports/durations.db"),
+            window=int(os.environ.get("DURATION_WINDOW", "5")),
+        )
+    return _store
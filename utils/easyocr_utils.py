@@ -1,18 +1,40 @@
 # utils/ocr_utils.py
 
-import easyocr
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
-import os
 import time
 import cv2
 import numpy as np
 import re
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import List, Optional
 
-# EasyOCR Reader 초기화 (한국어 + 영어)
-reader = easyocr.Reader(['ko', 'en'], gpu=False)
+from utils.ocr_service import chain, submit_readtext, submit_readtext_batched
+from utils.screen_capture import capture_frame, save_png_sync
+from utils.preprocess import PreprocessConfig, preprocess_array
+from utils.screen_text import OCRBox, ScreenText
+from utils.keyword_matcher import KeywordQuery, _norm_ocr
+from utils.fuzzy_index import substring_distance
+from utils.coordinates import resolve_region
+from utils.scroll_stitch import ScrollStitcher
+from utils.waits import wait_until_stable, record_wait, frame_diff
+from utils.tracing import span, traced
 
+
+def _readtext(np_image, **kwargs):
+    """해시 캐시 + (OCR_WORKERS 설정 시) 프로세스 풀을 거친 readtext. 같은 화면이면 OCR 생략"""
+    with span("ocr.readtext", "ocr") as record:
+        future = submit_readtext(np_image, **kwargs)
+        result, hit = future.result(), future.cache_hit
+        if record is not None:
+            record.args["cache_hit"] = hit
+    if hit:
+        print("♻️ OCR 캐시 적중 (동일 화면)")
+    return result
+
+@traced("tap", "appium")
 def tap_coordinates(driver, x, y):
     finger = PointerInput("touch", "finger")
     actions = ActionBuilder(driver, mouse=finger)
@@ -22,37 +44,105 @@ def tap_coordinates(driver, x, y):
     actions.pointer_action.pointer_up()
     actions.perform()
 
+@traced("take_screenshot", "io")
 def take_screenshot(driver, name):
-    path = f"./reports/screenshots/{name}.png"
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    driver.save_screenshot(path)
-    print(f"📸 스크린샷 저장됨: {path}")
+    """증거용 스크린샷: 원본 PNG로 저장 후 경로 반환 (바로 열거나 OCR해도 됨, 이름 → 파일은 실행 manifest에 기록)"""
+    path = save_png_sync(driver.get_screenshot_as_png(), name, keep=True)
+    print(f"📸 스크린샷 저장됨: {path} ({name})")
     return path
 
 
-def preprocess_image(image_path):
-    """이미지를 흑백 및 대비 보정 등으로 전처리"""
-    image = Image.open(image_path)
-    image = image.convert("L")  # 흑백
-    image = image.filter(ImageFilter.SHARPEN)  # 선명하게
-    enhancer = ImageEnhance.Contrast(image)
-    image = enhancer.enhance(2.0)  # 대비 증가
-    return image
+def _to_gray_array(image):
+    """경로/PIL 이미지/numpy 배열을 흑백 numpy 배열로 통일"""
+    if isinstance(image, np.ndarray):
+        if image.ndim == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return image
+    if isinstance(image, Image.Image):
+        return np.asarray(image.convert("L"))
+    return np.asarray(Image.open(image).convert("L"))
 
-import numpy as np
 
-def extract_text_easyocr(image_path, crop_area=None):
+def preprocess_image(image, config: Optional[PreprocessConfig] = None) -> np.ndarray:
     """
-    EasyOCR로 텍스트 추출 (PIL → numpy로 변환)
+    이미지를 흑백 및 선명화/대비 보정 등으로 전처리 (경로/PIL/numpy 입력 → numpy 배열).
+    축소 배율을 돌려주지 않으므로 config가 없으면 OCR_PREPROCESS_* 설정과 무관하게 원본 해상도(scale 1.0)
     """
-    image = preprocess_image(image_path)
+    return preprocess_array(_to_gray_array(image), config or PreprocessConfig())[0]
+
+
+@traced("preprocess", "ocr")
+def _prepare_for_ocr(image, crop_area=None):
+    """입력 이미지를 (필요 시 잘라낸 뒤) 전처리된 numpy 배열로 변환 → (배열, 축소 배율)"""
+    gray = _to_gray_array(image)
     if crop_area:
-        image = image.crop(crop_area)
-    
-    np_image = np.array(image)  # ✅ numpy로 변환
+        left, top, right, bottom = crop_area
+        gray = gray[top:bottom, left:right]
+    return preprocess_array(gray)
+
+
+def _prepare_screen(image, crop_area=None, region=None):
+    """영역 자르기 + 전처리 → (OCR 입력 배열, ScreenText.from_readtext 좌표 환산 인자)"""
+    gray = _to_gray_array(image)
+    size = (gray.shape[1], gray.shape[0])
+    crop_area = crop_area or resolve_region(region, size)
+    np_image, scale = _prepare_for_ocr(gray, crop_area)
+    offset = (crop_area[0], crop_area[1]) if crop_area else (0, 0)
+    return np_image, {"offset": offset, "size": size, "scale": scale}
+
+
+@traced("read_screen", "ocr")
+def read_screen(image, crop_area=None, region=None) -> ScreenText:
+    """
+    검출+인식 1회로 화면의 텍스트/박스/신뢰도를 모두 얻음
+    :param image: 스크린샷 경로 또는 capture_frame()으로 얻은 numpy 배열
+    :param crop_area: (left, top, right, bottom) 픽셀 영역. 박스 좌표는 전체 화면 기준으로 환산됨
+    :param region: rel_position.json의 영역 이름(예: 'dialog_body') 또는 픽셀 사각형. 이 영역만 OCR
+    """
+    np_image, placement = _prepare_screen(image, crop_area, region)
+    results = _readtext(np_image, detail=1, paragraph=False)
+    return ScreenText.from_readtext(results, **placement)
+
+
+def read_screen_async(image, crop_area=None, region=None) -> "Future[ScreenText]":
+    """
+    read_screen의 비동기 버전: 전처리까지만 호출 스레드에서 하고 OCR은 풀에 제출, Future[ScreenText] 반환.
+    OCR_WORKERS가 0이면 바로 OCR해서 완료된 Future를 돌려줌
+    """
+    np_image, placement = _prepare_screen(image, crop_area, region)
+    return chain(submit_readtext(np_image, detail=1, paragraph=False),
+                 lambda results: ScreenText.from_readtext(results, **placement))
 
-    result = reader.readtext(np_image, detail=0, paragraph=True)
-    return "\n".join(result).strip()
+
+def read_screens_batched(frames, max_images: int = 8, batch_size: int = 16) -> "List[Future[ScreenText]]":
+    """
+    여러 화면을 EasyOCR readtext_batched로 한 번에 인식. 같은 크기(같은 영역)끼리 묶어 돌린다.
+    :param frames: (이미지, crop_area, region) 목록
+    :param max_images: 한 번의 readtext_batched에 넣을 최대 화면 수
+    :param batch_size: EasyOCR 인식기 배치 크기 (텍스트 줄 단위)
+    :return: 입력 순서대로 Future[ScreenText]
+    """
+    prepared = [_prepare_screen(image, crop_area, region) for image, crop_area, region in frames]
+    futures = submit_readtext_batched([np_image for np_image, _ in prepared], max_images=max_images,
+                                      batch_size=batch_size, detail=1, paragraph=False)
+    return [chain(future, lambda results, placement=placement: ScreenText.from_readtext(results, **placement))
+            for future, (_, placement) in zip(futures, prepared)]
+
+
+@traced("extract_text_easyocr", "ocr")
+def extract_text_easyocr(image, crop_area=None, region=None):
+    """
+    EasyOCR로 텍스트 추출 (read_screen 결과의 전체 텍스트)
+    :param image: 스크린샷 경로 또는 capture_frame()으로 얻은 numpy 배열
+    :param crop_area: (left, top, right, bottom) 픽셀 영역
+    :param region: rel_position.json의 영역 이름 (crop_area 대신 사용)
+    """
+    return read_screen(image, crop_area, region).text
+
+
+def extract_text_easyocr_async(image, crop_area=None, region=None) -> "Future[str]":
+    """extract_text_easyocr의 비동기 버전 (Future[전체 텍스트])"""
+    return chain(read_screen_async(image, crop_area, region), lambda screen: screen.text)
 
 def is_home_screen_text(text):
     text = text.replace(" ", "").lower()
@@ -61,8 +151,7 @@ def is_home_screen_text(text):
 
 
 def ocr_contains_keyword(driver, keyword, shot_name="scroll_step"):
-    screenshot_path = take_screenshot(driver, shot_name)
-    text = extract_text_easyocr(screenshot_path)
+    text = extract_text_easyocr(capture_frame(driver, shot_name))
     print(f"📖 OCR 텍스트 추출 결과: {text}")
     return keyword in text
 
@@ -81,78 +170,234 @@ def ocr_contains_keyword(driver, keyword, shot_name="scroll_step"):
 #         actions.perform()
 #         time.sleep(1.5)
 
-def _norm_ocr(s: str) -> str:
-    # 공백/구두점 제거 + 정규화(필요 시 추가)
-    s = re.sub(r'[\s\u200b\u2060]+', '', s)            # 모든 공백/보이는-안보이는 스페이스 제거
-    s = re.sub(r'[^\w가-힣]', '', s)                   # 구두점 제거
-    # 흔오타 정규화: 켓 -> 겠 (원하면 더 추가)
-    s = s.replace("켓", "겠").replace("겟", "겠")
-    return s
-
 # "로그인이 필요합니다 ... 로그인하시겠습니까" 느슨 매칭
 LOGIN_HALF1_RE = re.compile(r"로그인이?필요합니다")  # '로그인이 필요합니다'에서 '이'와 공백 변형 허용
 LOGIN_HALF2_RE = re.compile(r"로그인하?시?겠?습?니까")  # 하/시/겠/습 사이 공백/누락 일부 허용
 
+# 정규식으로 못 잡는 오인식은 편집거리로 한 번 더 확인 (문구 길이의 20%까지 허용)
+LOGIN_DIALOG_PHRASES = ("로그인이필요합니다", "로그인하시겠습니까")
+LOGIN_FUZZY_RATIO = 0.2
+
 def contains_login_dialog(text: str) -> bool:
     t = _norm_ocr(text)
-    return bool(LOGIN_HALF1_RE.search(t)) and bool(LOGIN_HALF2_RE.search(t))
+    if LOGIN_HALF1_RE.search(t) and LOGIN_HALF2_RE.search(t):
+        return True
+    return all(substring_distance(p, t) <= LOGIN_FUZZY_RATIO * len(p) for p in LOGIN_DIALOG_PHRASES)
 
 
-def scroll_down_w3c(driver, scroll_count=5):
-    print(f"📥 사용자 지정 스크롤 좌표로 {scroll_count}회 스크롤 수행")
+def login_dialog_boxes(screen: ScreenText):
+    """로그인 다이얼로그가 보이면 화면의 박스 목록(닫기 버튼 탐색용), 아니면 빈 목록 (wait_for_text용 매처)"""
+    return list(screen.boxes) if contains_login_dialog(screen.text) else []
+
+
+@dataclass
+class TextMatch:
+    boxes: List[OCRBox]     # 매처가 돌려준 박스
+    screen: ScreenText      # 적중한 화면 전체 OCR 결과
+    elapsed: float
+    attempts: int
+
+
+def _match_screen(matcher, screen: ScreenText, region=None) -> List[OCRBox]:
+    if isinstance(matcher, KeywordQuery):
+        hit = matcher.locate(screen, region)
+        return [hit.box] if hit else []
+    if callable(matcher):
+        found = matcher(screen)
+        if isinstance(found, bool):
+            return list(screen.boxes) if found else []
+        return list(found or [])
+    return screen.find(matcher, region)
+
+
+def wait_for_text(driver, matcher, timeout: float = 5.0, region=None, *,
+                  baseline: float = 0.0, min_delay: float = 0.05, max_delay: float = 1.0,
+                  backoff: float = 1.5, label: str = "wait_for_text") -> Optional[TextMatch]:
+    """
+    텍스트가 나타날 때까지 캡처→(영역만)OCR을 반복, 적중하는 즉시 반환.
+    :param matcher: 키워드 리스트 / KeywordQuery / ScreenText를 받아 박스 목록(또는 bool)을 돌려주는 함수
+    :param region: rel_position.json의 영역 이름(예: 'dialog_body') 또는 픽셀 사각형. 이 영역만 OCR
+    :param baseline: 이 대기가 대체하는 기존 고정 sleep 시간(초). 절약 시간 보고에 사용
+    :return: TextMatch (타임아웃이면 None)
+
+    재시도 간격은 직전 OCR 소요 시간에 비례해 시작하고 실패할 때마다 backoff배로 늘린다.
+    OCR이 빠르면 촘촘히, 느리면 드물게 폴링해서 CPU를 OCR에만 쓰지 않게 한다.
+    """
+    with span(f"wait:{label}", "wait", baseline=baseline):
+        start = time.monotonic()
+        deadline = start + timeout
+        attempts = 0
+        delay = min_delay
+        while True:
+            attempts += 1
+            ocr_start = time.monotonic()
+            screen = read_screen(capture_frame(driver, label, save=False), region=region)
+            ocr_seconds = time.monotonic() - ocr_start
+            boxes = _match_screen(matcher, screen)
+            if boxes:
+                elapsed = time.monotonic() - start
+                record_wait(label, baseline, elapsed, True)
+                print(f"🔎 텍스트 감지 ({label}): {attempts}회 시도, {elapsed:.2f}s")
+                return TextMatch(boxes, screen, elapsed, attempts)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            delay = min(max_delay, max(delay * backoff, min_delay, ocr_seconds * 0.5))
+            time.sleep(min(delay, remaining))
+
+        elapsed = time.monotonic() - start
+        record_wait(label, baseline, elapsed, False)
+        print(f"⌛ 텍스트 미감지 ({label}): {attempts}회 시도, {elapsed:.2f}s")
+        return None
+
+
+# 직접 지정한 안정 스크롤 좌표 (아래쪽 → 위쪽으로 끌어 올리면 목록이 아래로 스크롤됨)
+SCROLL_START = (403, 1953)
+SCROLL_END = (361, 412)
+
+
+@traced("swipe", "appium")
+def swipe_w3c(driver, start, end):
     finger = PointerInput("touch", "finger")
+    actions = ActionBuilder(driver, mouse=finger)
+    actions.pointer_action.move_to_location(*start)
+    actions.pointer_action.pointer_down()
+    actions.pointer_action.pause(0.4)  # 탭 오인 방지
+    actions.pointer_action.move_to_location(*end)
+    actions.pointer_action.pause(0.4)  # 이동 후 안정성 확보
+    actions.pointer_action.release()
+    actions.perform()
+
 
-    # 직접 지정한 안정 좌표
-    start_x, start_y = 403, 1953
-    end_x, end_y = 361, 412
+@traced("scroll_down_w3c")
+def scroll_down_w3c(driver, scroll_count=5):
+    print(f"📥 사용자 지정 스크롤 좌표로 {scroll_count}회 스크롤 수행")
+    (start_x, start_y), (end_x, end_y) = SCROLL_START, SCROLL_END
 
     for i in range(scroll_count):
         print(f"↕️ W3C 스크롤 {i+1}/{scroll_count}: ({start_x},{start_y}) → ({end_x},{end_y})")
+        swipe_w3c(driver, SCROLL_START, SCROLL_END)
+        wait_until_stable(driver, 2.0, label="scroll")  # 렌더링 여유 (멈추면 바로 진행)
 
-        actions = ActionBuilder(driver, mouse=finger)
-        actions.pointer_action.move_to_location(start_x, start_y)
-        actions.pointer_action.pointer_down()
-        actions.pointer_action.pause(0.4)  # 탭 오인 방지
-        actions.pointer_action.move_to_location(end_x, end_y)
-        actions.pointer_action.pause(0.4)  # 이동 후 안정성 확보
-        actions.pointer_action.release()
-        actions.perform()
 
-        time.sleep(2.0)  # 렌더링 여유
+def _thumbnail(gray: np.ndarray, region_rect=None) -> np.ndarray:
+    """목록 끝 감지용 축소 프레임 (영역만)"""
+    if region_rect:
+        left, top, right, bottom = region_rect
+        gray = gray[top:bottom, left:right]
+    h, w = gray.shape[:2]
+    return cv2.resize(gray, (max(1, w // 8), max(1, h // 8)), interpolation=cv2.INTER_AREA)
 
 
-def tap_text_by_ocr(driver, keywords, screenshot_name="ocr_target_search"):
+@traced("scroll_until_text")
+def scroll_until_text(driver, matcher, max_scrolls: int = 9, region="side_nav_list",
+                      directions=("down", "up"), end_threshold: float = 1.0,
+                      screenshot_name: Optional[str] = None, observer=None,
+                      stitch: bool = True) -> Optional[TextMatch]:
+    """
+    스와이프할 때마다 OCR해서 대상이 보이면 즉시 멈춤.
+    - 스와이프 후 화면이 그대로면 목록 끝으로 보고 다음 방향으로 전환
+    - directions 기본값: 먼저 아래로 찾고, 없으면 위로 되돌아가며 찾음 (뷰포트 위로 지나간 항목 대응)
+    :param matcher: 키워드 리스트 / KeywordQuery / ScreenText → 박스 목록 함수 (wait_for_text와 동일)
+    :param observer: observe(frame, screen) / moved(step) 를 가진 객체 (NavIndex 등). OCR한 화면과
+                     스크롤 위치 변화(+1 아래, -1 위)를 전달받음
+    :param stitch: True면 ScrollStitcher로 스크롤 후 새로 드러난 띠만 OCR (region 필요)
+    :return: TextMatch (못 찾으면 None)
+    """
+    start = time.monotonic()
+    attempts = 0
+    stitcher = None
+    for direction in directions:
+        swipe = (SCROLL_START, SCROLL_END) if direction == "down" else (SCROLL_END, SCROLL_START)
+        step = 1 if direction == "down" else -1
+        prev_thumb = None
+        for i in range(max_scrolls + 1):
+            attempts += 1
+            frame = capture_frame(driver, screenshot_name)
+            if stitch and region:
+                if stitcher is None:
+                    stitcher = ScrollStitcher(resolve_region(region, (frame.shape[1], frame.shape[0])),
+                                              read_screen)
+                screen = stitcher.feed(frame)
+            else:
+                screen = read_screen(frame, region=region)
+            thumb = _thumbnail(frame, screen.rect(region))
+            at_end = prev_thumb is not None and frame_diff(prev_thumb, thumb) <= end_threshold
+            if at_end and observer is not None:
+                observer.moved(-step)  # 직전 스와이프는 실제로 움직이지 않음
+            if observer is not None:
+                observer.observe(frame, screen)
+            boxes = _match_screen(matcher, screen)
+            if boxes:
+                elapsed = time.monotonic() - start
+                print(f"🔎 스크롤 탐색 적중: {attempts}회 캡처 ({direction} {i}회 스크롤), {elapsed:.2f}s"
+                      + (f", OCR {stitcher.ocr_rows}행" if stitcher else ""))
+                return TextMatch(boxes, screen, elapsed, attempts)
+
+            if at_end:
+                print(f"🧱 목록 끝 도달 ({direction})")
+                break
+            prev_thumb = thumb
+            if i == max_scrolls:
+                break
+            print(f"↕️ W3C 스크롤 {direction} {i + 1}/{max_scrolls}")
+            swipe_w3c(driver, *swipe)
+            if observer is not None:
+                observer.moved(step)
+            wait_until_stable(driver, 2.0, label="scroll")
+
+    print(f"❌ 스크롤 탐색 실패: {attempts}회 캡처, {time.monotonic() - start:.2f}s"
+          + (f", OCR {stitcher.ocr_rows}행" if stitcher else ""))
+    return None
+
+
+def tap_text_on_screen(driver, screen: ScreenText, keywords, region=None):
+    """
+    이미 OCR한 화면(ScreenText)에서 키워드 박스를 찾아 탭. 추가 OCR 없음
+    :param region: 영역 이름 또는 픽셀 사각형 (해당 영역 안의 박스만)
+    :return: 탭한 OCRBox (못 찾으면 None)
+    """
+    region = screen.rect(region)
+    if isinstance(keywords, KeywordQuery):
+        hit = keywords.locate(screen, region)
+        candidates = [(hit.box, hit.pattern)] if hit else []
+    else:
+        candidates = (
+            (box, next((k for k in keywords if k in box.text), None))
+            for box in screen.boxes if box.within(region)
+        )
+    for box, keyword in candidates:
+        if keyword is None:
+            continue
+        center_x, center_y = box.center
+        print(f"✅ '{box.text}' (정답 후보 중 '{keyword}' 포함) 위치: ({center_x}, {center_y}) → 클릭 시도")
+        tap_coordinates(driver, center_x, center_y)
+        return box
+    return None
+
+
+@traced("tap_text_by_ocr")
+def tap_text_by_ocr(driver, keywords, screenshot_name="ocr_target_search", image=None, screen=None,
+                    region=None):
     """
     화면에서 OCR로 여러 후보 키워드 중 하나를 찾아 해당 위치를 탭함
     :param driver: Appium driver
-    :param keywords: ['BLOCK_1', 'BLOCK1', 'BLOCL_1'] 등 리스트
+    :param keywords: ['BLOCK_1', 'BLOCK1', 'BLOCL_1'] 등 리스트 또는 KeywordMatcher.query() 결과
     :param screenshot_name: 저장할 스크린샷 이름
+    :param image: 이미 캡처한 numpy 배열(또는 경로). 없으면 새로 캡처
+    :param screen: 이미 OCR한 ScreenText. 주어지면 OCR을 다시 돌리지 않음
+    :param region: 영역 이름(예: 'side_nav_list') 또는 픽셀 사각형. 이 영역만 OCR/탐색
     :return: (탭 성공 여부, OCR 전체 텍스트)
     """
-    path = take_screenshot(driver, screenshot_name)
-    image = preprocess_image(path)
-    np_image = np.array(image)
-
-    results = reader.readtext(np_image, detail=1, paragraph=False)  # 좌표 포함 결과
-    all_texts = []
-
-    for (bbox, text, prob) in results:
-        all_texts.append(text)
-        for keyword in keywords:
-            if keyword in text:
-                # 중심 좌표 계산
-                (x1, y1), (x2, y2), (x3, y3), (x4, y4) = bbox
-                center_x = int((x1 + x3) / 2)
-                center_y = int((y1 + y3) / 2)
-                print(f"✅ '{text}' (정답 후보 중 '{keyword}' 포함) 위치: ({center_x}, {center_y}) → 클릭 시도")
-                tap_coordinates(driver, center_x, center_y)
-
-                full_text = "\n".join(all_texts)
-                print("📝 OCR 전체 추출 텍스트:\n" + full_text)
-                return True, full_text
-
-    full_text = "\n".join(all_texts)
-    print("❌ 어떤 정답 키워드도 OCR에서 찾지 못함")
+    if screen is None:
+        if image is None:
+            image = capture_frame(driver, screenshot_name)
+        screen = read_screen(image, region=region)
+
+    box = tap_text_on_screen(driver, screen, keywords, region=region)
+    full_text = "\n".join(screen.texts)
+    if box is None:
+        print("❌ 어떤 정답 키워드도 OCR에서 찾지 못함")
     print("📝 OCR 전체 추출 텍스트:\n" + full_text)
-    return False, full_text
-    
\ No newline at end of file
+    return box is not None, full_text
@@ -0,0 +1,159 @@
+# utils/frame_buffer.py
+"""
+실패 시에만 저장하는 최근 프레임 링 버퍼.
+
+capture_frame()으로 캡처한 이름 있는 프레임(PNG 바이트)을 단계 라벨과 함께 메모리에 최근 N장만 보관한다.
+검증이 실패하거나 예외가 빠져나갈 때 dump_failure_frames()로 버퍼 프레임을 ArtifactStore에
+원본 PNG로 저장한다 → 통과한 실행은 단계별 디스크 I/O가 없고, 실패 직전 화면이 그대로 남는다
+(실패 후 다시 캡처하면 이미 다른 화면일 수 있음).
+판정을 나중에 하는 경우(Verifier)는 제출 시점의 버퍼 스냅샷을 failure_frames()로 지정해 그 프레임을 저장한다.
+- 이미 저장한 프레임은 다시 저장하지 않음 (같은 케이스의 두 번째 실패는 그 뒤에 캡처된 프레임만)
+- 케이스/그룹 시작 시 clear()로 비워 이전 케이스 프레임이 섞이지 않게 함
+
+환경변수:
+  FRAME_BUFFER_MB=64       # 버퍼 최대 크기
+  FRAME_BUFFER_FRAMES=30   # 버퍼 최대 장수
+"""
+from __future__ import annotations
+import os
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Deque, List, Optional
+
+from utils.tracing import current_step
+from utils.artifact_store import get_artifact_store
+
+
+@dataclass
+class BufferedFrame:
+    label: str
+    png: bytes
+    captured_at: float
+    step: Optional[str]
+    channel: Optional[str]
+    seq: int = 0
+
+
+class FrameRing:
+    """바이트 크기/장수 상한이 있는 프레임 링 버퍼"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_frames: int = 30):
+        self.max_bytes = max_bytes
+        self.max_frames = max_frames
+        self._frames: Deque[BufferedFrame] = deque()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._dumped_seq = 0        # 이 번호 이하의 프레임은 이미 저장됨
+        self.dropped = 0
+
+    def push(self, png: bytes, label: str):
+        step, channel = current_step()
+        with self._lock:
+            self._seq += 1
+            frame = BufferedFrame(label, png, time.time(), step, channel, self._seq)
+            self._frames.append(frame)
+            self._bytes += len(png)
+            while self._frames and (self._bytes > self.max_bytes or len(self._frames) > self.max_frames):
+                old = self._frames.popleft()
+                self._bytes -= len(old.png)
+                self.dropped += 1
+
+    def frames(self) -> List[BufferedFrame]:
+        with self._lock:
+            return list(self._frames)
+
+    def clear(self):
+        """버퍼 비우기 (케이스/그룹 경계에서 호출)"""
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+            self._dumped_seq = self._seq
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def dump(self, reason: str, frames: Optional[List[BufferedFrame]] = None) -> List[str]:
+        """
+        아직 저장하지 않은 프레임을 오래된 순으로 저장 (manifest 스텝 이름 = reason). 저장 경로 목록 반환
+        :param frames: 현재 버퍼 대신 저장할 프레임 목록 (frames()로 떠 둔 스냅샷)
+        """
+        store = get_artifact_store()
+        with self._lock:
+            frames = [f for f in (self._frames if frames is None else frames) if f.seq > self._dumped_seq]
+            if frames:
+                self._dumped_seq = max(self._dumped_seq, frames[-1].seq)
+        paths = []
+        for frame in frames:
+            paths.append(store.save_png(frame.png, reason, keep=True, meta={
+                "label": frame.label,
+                "captured_at": time.strftime("%H:%M:%S", time.localtime(frame.captured_at)),
+                "step": frame.step, "channel": frame.channel,
+            }))
+        return paths
+
+
+_ring: Optional[FrameRing] = None
+_ring_lock = threading.Lock()
+
+
+def get_frame_buffer() -> FrameRing:
+    global _ring
+    if _ring is None:
+        with _ring_lock:
+            if _ring is None:
+                _ring = FrameRing(
+                    max_bytes=int(float(os.environ.get("FRAME_BUFFER_MB", "64")) * 1024 * 1024),
+                    max_frames=int(os.environ.get("FRAME_BUFFER_FRAMES", "30")),
+                )
+    return _ring
+
+
+_local = threading.local()
+
+
+@contextmanager
+def failure_frames(frames: List[BufferedFrame]):
+    """블록 안의 dump_failure_frames가 현재 버퍼 대신 frames(판정 제출 시점 스냅샷)를 저장하도록 지정"""
+    previous = getattr(_local, "frames", None)
+    _local.frames = frames
+    try:
+        yield
+    finally:
+        _local.frames = previous
+
+
+def dump_failure_frames(reason: str, frames: Optional[List[BufferedFrame]] = None) -> List[str]:
+    """
+    검증 실패/예외 시 호출: 실패에 이르기까지 캡처된 프레임 중 아직 저장하지 않은 것을 저장
+    :param frames: 저장할 프레임 목록. 없으면 failure_frames()로 지정된 스냅샷, 그것도 없으면 현재 버퍼
+    """
+    ring = get_frame_buffer()
+    if frames is None:
+        frames = getattr(_local, "frames", None)
+    if frames is None:
+        frames = ring.frames()
+    paths = ring.dump(reason, frames)
+    if paths:
+        labels = ", ".join(f.label for f in frames[-min(3, len(paths)):])     # 새로 저장된 프레임은 뒤쪽
+        print(f"📸 실패 프레임 {len(paths)}장 저장 ({reason}, 최근: {labels}) → {os.path.dirname(paths[-1])}")
+    else:
+        print(f"⚠️ 새로 저장할 버퍼 프레임 없음 ({reason})")
+    return paths
+
+
+@contextmanager
+def dump_frames_on_error(reason: str):
+    """블록 안에서 예외가 빠져나가면 버퍼 프레임을 저장하고 예외는 그대로 전달"""
+    try:
+        yield
+    except Exception:
+        dump_failure_frames(reason)
+        raise
@@ -0,0 +1,190 @@
+# utils/fuzzy_index.py
+"""
+OCR 오인식을 흡수하는 편집거리 기반 퍼지 조회.
+
+- 가중치 편집거리: I/1/l/|, O/0, 4/A, 켓/겠 처럼 OCR이 자주 혼동하는 글자는 치환 비용을 낮게,
+  '_' '-' '.' 같은 구두점은 삽입/삭제 비용을 낮게 둔다.
+- BK-tree로 정규 채널명/문구 목록에서 가장 가까운 항목을 찾는다 (수십 개 항목 기준 1ms 미만).
+
+NAV_NAME_VARIANTS에 오타를 손으로 추가하지 않아도 새 오인식이 대부분 정규 이름으로 매핑된다.
+"""
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+# OCR 혼동 그룹 (같은 그룹 내 치환 비용 = CONFUSION_COST)
+CONFUSION_GROUPS = [
+    "I1l|!iⅠ",
+    "O0oDQ",
+    "4A",
+    "5S",
+    "8B",
+    "2Z",
+    "LK",
+    "겠켓겟",
+]
+CONFUSION_COST = 0.25
+PUNCT_COST = 0.25       # '_', '-', '.' 등 삽입/삭제 비용
+DEFAULT_COST = 1.0
+# 대소문자 무시 + 혼동 그룹이 겹치면(l↔L↔K) 삼각부등식이 약간 깨지므로 BK-tree 탐색 범위에 여유를 둠
+SEARCH_SLACK = DEFAULT_COST - 2 * CONFUSION_COST
+
+_ROMAN = {"Ⅰ": "I", "Ⅱ": "II", "Ⅲ": "III", "Ⅳ": "IV", "Ⅴ": "V"}
+_DIGIT_TO_ROMAN = {"1": "I", "2": "II", "3": "III", "4": "IV", "5": "V"}
+
+_confusable: Dict[str, int] = {}
+for _gid, _group in enumerate(CONFUSION_GROUPS):
+    for _ch in _group:
+        _confusable.setdefault(_ch, _gid)
+
+
+def fold(s: str) -> str:
+    """비교용 정규화: 공백 제거, 로마 숫자 문자(Ⅱ 등)를 알파벳으로 풀어씀"""
+    s = re.sub(r"[\s\u200b\u2060]+", "", s)
+    return "".join(_ROMAN.get(ch, ch) for ch in s)
+
+
+def _sub_cost(a: str, b: str) -> float:
+    if a == b:
+        return 0.0
+    if a.upper() == b.upper():
+        return CONFUSION_COST
+    ga, gb = _confusable.get(a), _confusable.get(b)
+    if ga is not None and ga == gb:
+        return CONFUSION_COST
+    return DEFAULT_COST
+
+
+def _indel_cost(ch: str) -> float:
+    return PUNCT_COST if not ch.isalnum() else DEFAULT_COST
+
+
+def weighted_distance(a: str, b: str) -> float:
+    """혼동 가중치를 반영한 편집거리 (a, b는 fold된 문자열)"""
+    if a == b:
+        return 0.0
+    prev = [0.0]
+    for ch in b:
+        prev.append(prev[-1] + _indel_cost(ch))
+    for ca in a:
+        cur = [prev[0] + _indel_cost(ca)]
+        for j, cb in enumerate(b, start=1):
+            cur.append(min(
+                prev[j] + _indel_cost(ca),
+                cur[j - 1] + _indel_cost(cb),
+                prev[j - 1] + _sub_cost(ca, cb),
+            ))
+        prev = cur
+    return prev[-1]
+
+
+def substring_distance(pattern: str, text: str) -> float:
+    """text 안의 임의 구간과 pattern 사이 최소 편집거리 (긴 OCR 줄에서 문구 찾기용)"""
+    if not pattern:
+        return 0.0
+    prev = [0.0] * (len(text) + 1)  # text 앞부분 건너뛰기 무료
+    for cp in pattern:
+        cur = [prev[0] + _indel_cost(cp)]
+        for j, ct in enumerate(text, start=1):
+            cur.append(min(
+                prev[j] + _indel_cost(cp),
+                cur[j - 1] + _indel_cost(ct),
+                prev[j - 1] + _sub_cost(cp, ct),
+            ))
+        prev = cur
+    return min(prev)  # text 뒷부분 건너뛰기 무료
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    canonical: str
+    form: str          # 실제로 가장 가까웠던 색인 문자열
+    distance: float
+
+
+class _Node:
+    __slots__ = ("form", "canonicals", "children")
+
+    def __init__(self, form: str, canonical: str):
+        self.form = form
+        self.canonicals = [canonical]
+        self.children: Dict[float, "_Node"] = {}
+
+
+class FuzzyIndex:
+    """정규 이름 목록에 대한 BK-tree"""
+
+    def __init__(self, canonicals: Iterable[str] = (), roman_aliases: bool = True):
+        self.roman_aliases = roman_aliases
+        self._root: Optional[_Node] = None
+        self._size = 0
+        for name in canonicals:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, canonical: str, aliases: Iterable[str] = ()):
+        """정규 이름(+별칭) 색인. 끝자리 숫자는 로마 숫자 별칭도 함께 등록 (CHAT_2 → CHAT_II)"""
+        forms = [canonical, *aliases]
+        if self.roman_aliases:
+            m = re.match(r"^(.*?)([1-5])$", canonical)
+            if m:
+                forms.append(m.group(1) + _DIGIT_TO_ROMAN[m.group(2)])
+        for form in forms:
+            self._insert(fold(form), canonical)
+
+    def _insert(self, form: str, canonical: str):
+        if self._root is None:
+            self._root = _Node(form, canonical)
+            self._size += 1
+            return
+        node = self._root
+        while True:
+            d = round(weighted_distance(form, node.form), 4)
+            if d == 0:
+                if canonical not in node.canonicals:
+                    node.canonicals.append(canonical)
+                return
+            child = node.children.get(d)
+            if child is None:
+                node.children[d] = _Node(form, canonical)
+                self._size += 1
+                return
+            node = child
+
+    def search(self, token: str, max_distance: float) -> List[FuzzyMatch]:
+        """max_distance 이내의 모든 후보 (거리 오름차순)"""
+        if self._root is None:
+            return []
+        query = fold(token)
+        found: List[FuzzyMatch] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            d = weighted_distance(query, node.form)
+            if d <= max_distance:
+                found.extend(FuzzyMatch(c, node.form, d) for c in node.canonicals)
+            lo, hi = d - max_distance - SEARCH_SLACK, d + max_distance + SEARCH_SLACK
+            stack.extend(child for k, child in node.children.items() if lo <= k <= hi)
+        found.sort(key=lambda m: m.distance)
+        return found
+
+    def lookup(self, token: str, max_distance: Optional[float] = None) -> Optional[FuzzyMatch]:
+        """
+        가장 가까운 정규 이름. 1등과 2등(다른 정규 이름)의 거리가 같으면 모호하므로 None.
+        max_distance 기본값은 토큰 길이의 25% (최소 1.0)
+        """
+        if max_distance is None:
+            max_distance = max(1.0, 0.25 * len(fold(token)))
+        best: Dict[str, FuzzyMatch] = {}
+        for m in self.search(token, max_distance):
+            if m.canonical not in best:
+                best[m.canonical] = m
+        ranked = sorted(best.values(), key=lambda m: m.distance)
+        if not ranked:
+            return None
+        if len(ranked) > 1 and ranked[1].distance - ranked[0].distance < 1e-6:
+            return None
+        return ranked[0]
@@ -1,12 +1,8 @@
-import os
 import time
-from datetime import datetime
-from PIL import Image
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-import pickle
+
+from utils.tracing import traced
+from utils.result_sink import get_result_sink
+from utils.screen_capture import save_png_sync
 
 def login_as_user(driver, email):
     # 로그인 페이지 이동 + 입력
@@ -17,35 +13,28 @@ def open_block_channel(driver, block_name):
     # return (채널 접근 성공 여부, 블록 읽기 가능 여부)
     pass
 
+@traced("take_screenshot", "io")
 def take_screenshot(driver, test_name):
     """
     테스트 실행 중 스크린샷을 찍고 저장합니다.
+    같은 화면은 한 번만 저장되고 (utils/artifact_store.py), 파일 쓰기가 끝난 뒤 경로를 반환합니다.
     
     Args:
         driver: Appium WebDriver 인스턴스
-        test_name: 테스트 이름 (파일명으로 사용)
+        test_name: 테스트 이름 (실행 manifest의 스텝 이름으로 사용)
     
     Returns:
         str: 저장된 스크린샷의 파일 경로
     """
-    # reports/screenshots 디렉토리가 없으면 생성
-    screenshot_dir = os.path.join('reports', 'screenshots')
-    os.makedirs(screenshot_dir, exist_ok=True)
-    
-    # 파일명 생성 (테스트명_타임스탬프.png)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"{test_name}_{timestamp}.png"
-    filepath = os.path.join(screenshot_dir, filename)
-    
-    # 스크린샷 촬영 및 저장
-    driver.get_screenshot_as_file(filepath)
+    filepath = save_png_sync(driver.get_screenshot_as_png(), test_name, keep=True)
     print(f"스크린샷 저장됨: {filepath}")
     
     return filepath
 
 def log_result_to_sheet(test_name, status, error_message=None, screenshot_path=None):
     """
-    테스트 결과를 Google Sheets에 기록합니다.
+    테스트 결과를 Google Sheets(또는 RESULT_SINK로 지정한 로컬 CSV/SQLite)에 기록합니다.
+    행은 버퍼에 쌓였다가 백그라운드에서 묶음으로 기록되고, 종료 시 남은 행이 기록됩니다.
     
     Args:
         test_name: 테스트 이름
@@ -53,47 +42,7 @@ def log_result_to_sheet(test_name, status, error_message=None, screenshot_path=N
         error_message: 실패 시 에러 메시지 (선택사항)
         screenshot_path: 스크린샷 파일 경로 (선택사항)
     """
-    # Google Sheets API 인증
-    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-    SPREADSHEET_ID = os.getenv('GOOGLE_SHEET_ID')
-    RANGE_NAME = 'Test Results!A:E'
-    
-    creds = None
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
-    
-    service = build('sheets', 'v4', credentials=creds)
-    
-    # 테스트 결과 데이터 준비
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    values = [[timestamp, test_name, status, error_message or '', screenshot_path or '']]
-    
-    body = {
-        'values': values
-    }
-    
-    # Google Sheets에 데이터 추가
-    try:
-        result = service.spreadsheets().values().append(
-            spreadsheetId=SPREADSHEET_ID,
-            range=RANGE_NAME,
-            valueInputOption='RAW',
-            body=body
-        ).execute()
-        print(f"테스트 결과가 Google Sheets에 기록되었습니다: {test_name}")
-    except Exception as e:
-        print(f"Google Sheets 기록 중 오류 발생: {str(e)}")
+    get_result_sink().add(test_name, status, error_message, screenshot_path)
 
 def wait_for_element(driver, by, value, timeout=10):
     """
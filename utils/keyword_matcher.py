@@ -0,0 +1,197 @@
+# utils/keyword_matcher.py
+"""
+여러 카테고리의 키워드를 한 번에 찾는 Aho-Corasick 매처.
+
+NAV_NAME_VARIANTS / FORUM_KEYS 같은 {카테고리: [키워드...]} 사전으로 한 번만 만들어 두고,
+OCR 텍스트(_norm_ocr 정규화)를 한 번 훑어서 모든 카테고리 적중과 해당 박스를 돌려준다.
+"""
+from __future__ import annotations
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from utils.screen_text import OCRBox, Region, ScreenText
+from utils.fuzzy_index import FuzzyIndex
+
+
+def _norm_ocr(s: str) -> str:
+    # 공백/구두점 제거 + 정규화(필요 시 추가)
+    s = re.sub(r'[\s\u200b\u2060]+', '', s)            # 모든 공백/보이는-안보이는 스페이스 제거
+    s = s.replace("|", "I")                            # 세로줄은 I로 (구두점으로 지우면 'CHAT|' → 'CHAT'가 됨)
+    s = re.sub(r'[^\w가-힣]', '', s)                   # 구두점 제거
+    # 흔오타 정규화: 켓 -> 겠 (원하면 더 추가)
+    s = s.replace("켓", "겠").replace("겟", "겠")
+    return s
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    category: str
+    pattern: str        # 정규화된 키워드
+    box: Optional[OCRBox] = None
+
+
+class KeywordMatcher:
+    """{카테고리: 키워드 목록} → Aho-Corasick 오토마톤"""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]],
+                 normalize: Callable[[str], str] = _norm_ocr, fuzzy: bool = False):
+        """
+        :param fuzzy: True면 카테고리 이름(정규 채널명)으로 FuzzyIndex를 만들어
+                      정확히 일치하는 키워드가 없을 때 편집거리로 한 번 더 찾음
+        :raises ValueError: 정규화한 키워드가 다른 카테고리 이름의 앞부분이면
+                            ('CHAT' → CHAT_1/CHAT_2 모두, 'CHATTING' 같은 박스까지 적중)
+        """
+        self.normalize = normalize
+        self.categories: Dict[str, List[str]] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, str]]] = [[]]
+
+        for category, keywords in categories.items():
+            patterns = []
+            for keyword in keywords:
+                pattern = normalize(keyword)
+                if pattern and pattern not in patterns:
+                    patterns.append(pattern)
+                    self._add(pattern, category)
+            self.categories[category] = patterns
+        self._check_prefix_collisions()
+        self._build_fail_links()
+        self.fuzzy: Optional[FuzzyIndex] = FuzzyIndex(self.categories) if fuzzy else None
+
+    def _check_prefix_collisions(self):
+        canonical = {category: self.normalize(category) for category in self.categories}
+        for category, patterns in self.categories.items():
+            for pattern in patterns:
+                clashes = [other for other, name in canonical.items()
+                           if other != category and name.startswith(pattern)]
+                if clashes:
+                    raise ValueError(f"'{category}' 키워드 '{pattern}'가 다른 카테고리 이름의 앞부분과 같습니다: "
+                                     f"{', '.join(clashes)}")
+
+    # ---------- 오토마톤 구성 ----------
+    def _add(self, pattern: str, category: str):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((category, pattern))
+
+    def _build_fail_links(self):
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    # ---------- 검색 ----------
+    def iter_matches(self, text: str, normalized: bool = False) -> Iterator[Tuple[str, str]]:
+        """텍스트에서 (카테고리, 키워드) 적중을 순서대로 반환"""
+        t = text if normalized else self.normalize(text)
+        node = 0
+        for ch in t:
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            yield from self._out[node]
+
+    def categories_in(self, text: str) -> Set[str]:
+        """텍스트(줄 단위로 검사)에 등장하는 카테고리 집합"""
+        found: Set[str] = set()
+        for line in text.splitlines():
+            found.update(category for category, _ in self.iter_matches(line))
+        return found
+
+    def box_hits(self, box: OCRBox, exclusive: bool = False) -> List[KeywordHit]:
+        """
+        박스 하나의 적중 목록.
+        exclusive=True면 가장 긴 키워드를 가진 카테고리만 남김
+        (예: 'CHATII' 박스는 CHAT_1의 'CHATI'가 아니라 CHAT_2로 판정)
+        """
+        best: Dict[str, str] = {}
+        for category, pattern in self.iter_matches(box.text):
+            if len(pattern) > len(best.get(category, "")):
+                best[category] = pattern
+        if exclusive and best:
+            longest = max(len(p) for p in best.values())
+            best = {c: p for c, p in best.items() if len(p) == longest}
+        return [KeywordHit(c, p, box) for c, p in best.items()]
+
+    def scan_screen(self, screen: ScreenText, region: Region = None,
+                    exclusive: bool = False) -> Dict[str, List[KeywordHit]]:
+        """화면 전체를 한 번 훑어 {카테고리: [박스 적중...]} 반환"""
+        hits: Dict[str, List[KeywordHit]] = {}
+        rect = screen.rect(region)
+        for box in screen.boxes:
+            if not box.within(rect):
+                continue
+            for hit in self.box_hits(box, exclusive=exclusive):
+                hits.setdefault(hit.category, []).append(hit)
+        return hits
+
+    def screen_categories(self, screen: ScreenText, region: Region = None) -> Set[str]:
+        """박스 단위 + 줄 단위(박스가 나뉜 문구 대비) 카테고리 적중 집합"""
+        found = set(self.scan_screen(screen, region))
+        target = screen.in_region(region) if region else screen
+        return found | self.categories_in(target.text)
+
+    def query(self, category: str, fuzzy: bool = True) -> "KeywordQuery":
+        """
+        :param fuzzy: False면 퍼지 색인이 있어도 정확히 일치하는 키워드만 (안 보여야 PASS인 검증용)
+        """
+        if category not in self.categories:
+            raise KeyError(f"'{category}' 카테고리가 매처에 없습니다.")
+        return KeywordQuery(self, category, fuzzy)
+
+
+@dataclass(frozen=True)
+class KeywordQuery:
+    """매처 + 카테고리 하나 (tap_text_by_ocr 등에 키워드 목록 대신 전달)"""
+    matcher: KeywordMatcher
+    category: str
+    fuzzy: bool = True
+
+    def locate(self, screen: ScreenText, region: Region = None,
+               fuzzy: Optional[bool] = None) -> Optional[KeywordHit]:
+        """
+        이 카테고리로 판정된 첫 박스 (다른 카테고리와 겹치면 더 긴 키워드 쪽 우선).
+        정확히 일치하는 박스가 없고 매처에 퍼지 색인이 있으면 편집거리가 가장 가까운 박스
+        :param fuzzy: 퍼지 조회 여부 (None이면 query() 때 지정한 값)
+        """
+        rect = screen.rect(region)
+        boxes = [b for b in screen.boxes if b.within(rect)]
+        for box in boxes:
+            for hit in self.matcher.box_hits(box, exclusive=True):
+                if hit.category == self.category:
+                    return hit
+        if self.matcher.fuzzy is None or not (self.fuzzy if fuzzy is None else fuzzy):
+            return None
+        best = None
+        for box in boxes:
+            m = self.matcher.fuzzy.lookup(box.text)
+            if m and m.canonical == self.category and (best is None or m.distance < best[0].distance):
+                best = (m, box)
+        if best is None:
+            return None
+        m, box = best
+        print(f"🔎 퍼지 매칭: '{box.text}' → {m.canonical} (거리 {m.distance:.2f})")
+        return KeywordHit(self.category, m.form, box)
+
+    def __str__(self) -> str:
+        return self.category
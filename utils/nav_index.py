@@ -0,0 +1,140 @@
+# utils/nav_index.py
+"""
+세션 단위 사이드 네비 위치 색인.
+
+네비 목록을 처음 OCR할 때 보이는 모든 채널 이름의 (스크롤 위치, 박스)를 기록해 두고,
+다음 방문 때는 그 위치로 바로 이동 → 박스 주변만 OCR로 확인 → 탭한다.
+기록 당시 목록 지문(dHash)과 현재 화면이 다르면 색인 전체를 버리고 전체 탐색으로 돌아간다.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from utils.ocr_cache import dhash
+from utils.coordinates import resolve_region
+from utils.screen_text import OCRBox, ScreenText
+from utils.keyword_matcher import KeywordMatcher
+from utils.easyocr_utils import (
+    capture_frame, read_screen, scroll_until_text, swipe_w3c, tap_coordinates,
+    SCROLL_START, SCROLL_END,
+)
+from utils.waits import wait_until_stable
+from utils.tracing import traced
+
+CONFIRM_PADDING = 24  # 확인용 OCR 영역을 박스 주변으로 넓히는 여백(px)
+
+
+@dataclass
+class NavEntry:
+    name: str
+    offset: int     # 네비를 연 시점 기준 스크롤 단계 (+1 = 아래로 한 번)
+    box: OCRBox
+
+
+class NavIndex:
+    def __init__(self, matcher: KeywordMatcher, region: str = "side_nav_list"):
+        self.matcher = matcher
+        self.region = region
+        self.offset = 0
+        self.entries: Dict[str, NavEntry] = {}
+        self.fingerprints: Dict[int, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # ---------- scroll_until_text observer ----------
+    def moved(self, step: int):
+        self.offset += step
+
+    def observe(self, frame: np.ndarray, screen: ScreenText):
+        """OCR한 네비 화면의 채널 이름을 현재 스크롤 위치로 기록"""
+        fp = self.fingerprint(frame, screen.rect(self.region))
+        known = self.fingerprints.get(self.offset)
+        if known is not None and known != fp:
+            print(f"🔄 네비 목록 지문 변경 (offset={self.offset}) → 위치 색인 초기화")
+            self.invalidate()
+        self.fingerprints[self.offset] = fp
+        for category, hits in self.matcher.scan_screen(screen, exclusive=True).items():
+            if category not in self.entries:
+                self.entries[category] = NavEntry(category, self.offset, hits[0].box)
+
+    # ---------- 색인 ----------
+    @staticmethod
+    def fingerprint(frame: np.ndarray, rect: Optional[Tuple[int, int, int, int]]) -> str:
+        if rect:
+            left, top, right, bottom = rect
+            frame = frame[top:bottom, left:right]
+        return dhash(frame, size=16)
+
+    def invalidate(self):
+        self.entries.clear()
+        self.fingerprints.clear()
+
+    def get(self, name: str) -> Optional[NavEntry]:
+        return self.entries.get(name)
+
+    def scroll_to(self, driver, offset: int):
+        while self.offset != offset:
+            down = offset > self.offset
+            swipe_w3c(driver, *((SCROLL_START, SCROLL_END) if down else (SCROLL_END, SCROLL_START)))
+            self.moved(1 if down else -1)
+            wait_until_stable(driver, 2.0, label="scroll")
+
+    def confirm(self, driver, entry: NavEntry, screenshot_name: Optional[str] = None,
+                fuzzy: bool = True) -> Optional[OCRBox]:
+        """기록된 위치로 이동 후, 지문 비교 + 박스 주변만 OCR해서 이름이 그대로 있는지 확인"""
+        self.scroll_to(driver, entry.offset)
+        frame = capture_frame(driver, screenshot_name)
+        h, w = frame.shape[:2]
+        fp = self.fingerprint(frame, resolve_region(self.region, (w, h)))
+        if self.fingerprints.get(entry.offset) != fp:
+            print(f"🔄 네비 목록 지문 불일치 ({entry.name}) → 위치 색인 초기화")
+            self.invalidate()
+            return None
+        box = entry.box
+        crop = (max(0, box.left - CONFIRM_PADDING), max(0, box.top - CONFIRM_PADDING),
+                min(w, box.right + CONFIRM_PADDING), min(h, box.bottom + CONFIRM_PADDING))
+        hit = self.matcher.query(entry.name, fuzzy).locate(read_screen(frame, crop_area=crop))
+        return hit.box if hit else None
+
+
+_indexes: Dict[Tuple[object, int], NavIndex] = {}
+
+
+def get_nav_index(driver, matcher: KeywordMatcher, region: str = "side_nav_list") -> NavIndex:
+    """드라이버 세션 + 매처별 NavIndex (세션이 바뀌면 새 색인)"""
+    key = (getattr(driver, "session_id", None) or id(driver), id(matcher))
+    if key not in _indexes:
+        _indexes[key] = NavIndex(matcher, region)
+    return _indexes[key]
+
+
+@traced("tap_nav_item")
+def tap_nav_item(driver, matcher: KeywordMatcher, name: str, *, max_scrolls: int = 9,
+                 region: str = "side_nav_list", screenshot_name: Optional[str] = None, fuzzy: bool = True):
+    """
+    사이드 네비에서 name 채널을 탭.
+    색인에 있으면 기록된 위치로 이동해 좁은 영역만 확인하고 탭, 없거나 확인 실패 시 스크롤 탐색.
+    :param fuzzy: False면 정확히 일치하는 이름만 인정 (채널이 안 보여야 PASS인 검증에서 오인식으로 FAIL 방지)
+    :return: (탭 성공 여부, 탭한 OCRBox 또는 None)
+    """
+    index = get_nav_index(driver, matcher, region)
+    entry = index.get(name)
+    if entry is not None:
+        box = index.confirm(driver, entry, screenshot_name, fuzzy)
+        if box is not None:
+            index.hits += 1
+            print(f"📇 네비 색인 적중: {name} (offset={entry.offset}) → {box.center}")
+            tap_coordinates(driver, *box.center)
+            return True, box
+        index.misses += 1
+
+    hit = scroll_until_text(driver, matcher.query(name, fuzzy), max_scrolls=max_scrolls, region=region,
+                            screenshot_name=screenshot_name, observer=index)
+    if hit is None:
+        return False, None
+    box = hit.boxes[0]
+    print(f"✅ '{box.text}' ({name}) 위치: {box.center} → 클릭 시도")
+    tap_coordinates(driver, *box.center)
+    return True, box
@@ -0,0 +1,164 @@
+# utils/ocr_cache.py
+"""
+전처리된 이미지 해시 기반 OCR 결과 캐시.
+
+- 같은 화면(픽셀 동일)을 다시 OCR하면 해시 1회 비용으로 결과 재사용
+- 한 이미지에 대해 readtext 옵션별 결과(텍스트/좌표 포함)를 함께 보관
+- 메모리 LRU + 선택적 디스크 계층(OCR_CACHE_DIR)
+- 옵션 키에 엔진 모델 설정(언어/GPU)을 포함 → 디스크 계층이 실행 간 공유돼도 OCR_LANGS/OCR_GPU를 바꾸면 다른 키
+"""
+from __future__ import annotations
+import os
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+_MISS = object()
+
+
+def content_hash(np_image: np.ndarray) -> str:
+    """픽셀 내용 그대로의 해시 (shape/dtype 포함)"""
+    arr = np.ascontiguousarray(np_image)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{arr.shape}|{arr.dtype}".encode())
+    h.update(memoryview(arr).cast("B"))
+    return h.hexdigest()
+
+
+def dhash(np_image: np.ndarray, size: int = 32) -> str:
+    """
+    difference hash (지각 해시). 상태바 시계 등 미세한 차이는 무시하고 같은 화면으로 취급.
+    size가 작을수록 관대해지므로 화면 구분이 필요한 곳에서는 content_hash를 쓴다.
+    """
+    import cv2
+
+    gray = np_image if np_image.ndim == 2 else cv2.cvtColor(np_image, cv2.COLOR_RGB2GRAY)
+    small = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return f"d{size}_{gray.shape[0]}x{gray.shape[1]}_" + np.packbits(bits).tobytes().hex()
+
+
+class OCRCache:
+    """이미지 해시 → {옵션 키: readtext 결과} LRU 캐시"""
+
+    def __init__(self, max_entries: int = 64, disk_dir: Optional[str] = None, hash_mode: str = "content"):
+        if hash_mode not in ("content", "dhash"):
+            raise ValueError(f"지원하지 않는 hash_mode: {hash_mode}")
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.hash_mode = hash_mode
+        self._mem: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def image_key(self, np_image: np.ndarray) -> str:
+        return dhash(np_image) if self.hash_mode == "dhash" else content_hash(np_image)
+
+    @staticmethod
+    def option_key(kwargs: Dict[str, Any], engine=None) -> str:
+        """readtext 옵션 + 엔진 모델 설정 키 (engine 기본: get_ocr_engine())"""
+        if engine is None:
+            from utils.ocr_engine import get_ocr_engine
+            engine = get_ocr_engine()
+        kwargs = dict(kwargs, _model=("+".join(engine.langs), engine.gpu))
+        return "&".join(f"{k}={kwargs[k]!r}" for k in sorted(kwargs))
+
+    # ---------- 디스크 계층 ----------
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def _disk_load(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def _disk_store(self, key: str, entry: Dict[str, Any]):
+        if not self.disk_dir:
+            return
+        tmp = self._disk_path(key) + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._disk_path(key))
+        except Exception as e:
+            print(f"⚠️ OCR 캐시 디스크 저장 실패: {e}")
+
+    # ---------- 조회/저장 ----------
+    def get(self, image_key: str, option_key: str) -> Any:
+        with self._lock:
+            entry = self._mem.get(image_key)
+            if entry is not None:
+                self._mem.move_to_end(image_key)
+        if entry is None:
+            entry = self._disk_load(image_key)
+            if entry is not None:
+                self._remember(image_key, entry)
+        with self._lock:       # 타일/ocr-client 스레드에서 동시에 호출됨
+            if entry is not None and option_key in entry:
+                self.hits += 1
+                return entry[option_key]
+            self.misses += 1
+        return _MISS
+
+    def put(self, image_key: str, option_key: str, result: Any):
+        with self._lock:
+            entry = self._mem.get(image_key)
+            if entry is None:
+                entry = self._disk_load(image_key) or {}
+            entry[option_key] = result
+        self._remember(image_key, entry)
+        self._disk_store(image_key, entry)
+
+    def _remember(self, image_key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._mem[image_key] = entry
+            self._mem.move_to_end(image_key)
+            while len(self._mem) > self.max_entries:
+                self._mem.popitem(last=False)
+
+    def readtext(self, engine, np_image: np.ndarray, **kwargs) -> Tuple[Any, bool]:
+        """캐시를 거쳐 engine.readtext 실행. (결과, 캐시 적중 여부) 반환"""
+        ikey, okey = self.image_key(np_image), self.option_key(kwargs, engine)
+        cached = self.get(ikey, okey)
+        if cached is not _MISS:
+            return cached, True
+        result = engine.readtext(np_image, **kwargs)
+        self.put(ikey, okey, result)
+        return result, False
+
+    def clear(self):
+        with self._lock:
+            self._mem.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._mem), "hits": self.hits, "misses": self.misses,
+                "disk_dir": self.disk_dir, "hash_mode": self.hash_mode}
+
+
+_cache: Optional[OCRCache] = None
+
+
+def get_ocr_cache() -> OCRCache:
+    """전역 OCR 캐시. OCR_CACHE_SIZE, OCR_CACHE_DIR, OCR_CACHE_HASH(content|dhash)로 설정"""
+    global _cache
+    if _cache is None:
+        _cache = OCRCache(
+            max_entries=int(os.environ.get("OCR_CACHE_SIZE", "64")),
+            disk_dir=os.environ.get("OCR_CACHE_DIR") or None,
+            hash_mode=os.environ.get("OCR_CACHE_HASH", "content"),
+        )
+    return _cache
@@ -0,0 +1,162 @@
+# utils/ocr_engine.py
+"""
+프로세스 전역에서 하나만 쓰는 EasyOCR 엔진.
+
+- import 시점에는 모델을 로드하지 않고, 첫 OCR 호출 때 한 번만 로드 (lazy)
+- 언어/스레드 수/GPU 여부는 configure()로 로드 전에 변경 가능
+- 로드 시간과 메모리 사용량(RSS 증가분)을 stats()로 확인 가능
+"""
+from __future__ import annotations
+import os
+import sys
+import time
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_LANGS = ("ko", "en")
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """현재 프로세스 RSS(byte). psutil → /proc → resource 순으로 시도"""
+    try:
+        import psutil  # 선택 의존성
+        return int(psutil.Process(os.getpid()).memory_info().rss)
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 byte, Linux는 KB 단위
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+    except Exception:
+        return None
+
+
+class OCREngine:
+    """EasyOCR Reader 래퍼. 실제 Reader는 첫 사용 시 생성된다."""
+
+    def __init__(self, langs: Sequence[str] = DEFAULT_LANGS, gpu: bool = False,
+                 threads: Optional[int] = None):
+        self.langs: List[str] = list(langs)
+        self.gpu = gpu
+        self.threads = threads
+        self._reader = None
+        self._lock = threading.Lock()
+        self.load_seconds: Optional[float] = None
+        self.rss_delta_bytes: Optional[int] = None
+        self.rss_after_bytes: Optional[int] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._reader is not None
+
+    def configure(self, *, langs: Optional[Sequence[str]] = None, gpu: Optional[bool] = None,
+                  threads: Optional[int] = None) -> "OCREngine":
+        """모델 로드 전 설정 변경. 이미 로드된 뒤 언어/GPU를 바꾸면 다음 호출 때 재로드한다."""
+        with self._lock:
+            reload_needed = False
+            if langs is not None and list(langs) != self.langs:
+                self.langs = list(langs)
+                reload_needed = True
+            if gpu is not None and gpu != self.gpu:
+                self.gpu = gpu
+                reload_needed = True
+            if threads is not None:
+                self.threads = threads
+                if self.loaded:
+                    self._apply_threads()
+            if reload_needed:
+                self._reader = None
+        return self
+
+    def _apply_threads(self):
+        if not self.threads:
+            return
+        try:
+            import torch
+            torch.set_num_threads(int(self.threads))
+        except Exception as e:
+            print(f"⚠️ OCR 스레드 수 설정 실패: {e}")
+
+    @property
+    def reader(self):
+        """EasyOCR Reader (최초 접근 시 로드)"""
+        if self._reader is None:
+            with self._lock:
+                if self._reader is None:
+                    self._load()
+        return self._reader
+
+    def _load(self):
+        import easyocr
+
+        self._apply_threads()
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+        self._reader = easyocr.Reader(self.langs, gpu=self.gpu)
+        self.load_seconds = time.perf_counter() - start
+        self.rss_after_bytes = _current_rss_bytes()
+        if rss_before is not None and self.rss_after_bytes is not None:
+            self.rss_delta_bytes = self.rss_after_bytes - rss_before
+        mem = f"{self.rss_delta_bytes / 1024 / 1024:.1f}MB" if self.rss_delta_bytes is not None else "?"
+        print(f"🧠 EasyOCR 모델 로드 완료 ({'+'.join(self.langs)}, gpu={self.gpu}, "
+              f"threads={self.threads or 'default'}): {self.load_seconds:.2f}s, RSS +{mem}")
+
+    def readtext(self, image, **kwargs):
+        return self.reader.readtext(image, **kwargs)
+
+    def readtext_batched(self, images, **kwargs):
+        """같은 크기 이미지 여러 장을 한 번에 인식 (EasyOCR readtext_batched). 이미지별 readtext 결과 목록"""
+        return self.reader.readtext_batched(images, **kwargs)
+
+    def detect(self, image, **kwargs):
+        """검출 단계만 실행 (readtext의 앞 절반). 단일 이미지 기준 (horizontal_list, free_list)"""
+        horizontal, free = self.reader.detect(image, **kwargs)
+        return horizontal[0], free[0]
+
+    def recognize(self, image, horizontal_list, free_list, **kwargs):
+        """인식 단계만 실행. detect() 결과를 넘기면 readtext와 같은 형식의 결과"""
+        return self.reader.recognize(image, horizontal_list, free_list, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "langs": list(self.langs),
+            "gpu": self.gpu,
+            "threads": self.threads,
+            "load_seconds": self.load_seconds,
+            "rss_delta_bytes": self.rss_delta_bytes,
+            "rss_after_bytes": self.rss_after_bytes,
+        }
+
+
+_engine: Optional[OCREngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_ocr_engine() -> OCREngine:
+    """프로세스 전역 OCR 엔진. 환경변수 OCR_LANGS(예: 'ko,en'), OCR_THREADS, OCR_GPU로 초기값 지정 가능"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                langs = [s.strip() for s in os.environ.get("OCR_LANGS", ",".join(DEFAULT_LANGS)).split(",") if s.strip()]
+                threads = os.environ.get("OCR_THREADS")
+                _engine = OCREngine(
+                    langs=langs,
+                    gpu=os.environ.get("OCR_GPU", "false").lower() == "true",
+                    threads=int(threads) if threads else None,
+                )
+    return _engine
+
+
+def configure_ocr(*, langs: Optional[Sequence[str]] = None, gpu: Optional[bool] = None,
+                  threads: Optional[int] = None) -> OCREngine:
+    """전역 OCR 엔진 설정 (get_ocr_engine().configure 단축)"""
+    return get_ocr_engine().configure(langs=langs, gpu=gpu, threads=threads)
@@ -0,0 +1,316 @@
+# utils/ocr_service.py
+"""
+프로세스 풀 OCR 서비스.
+
+기기를 조작하는 스레드에서 OCR을 동기로 돌리면, OCR 중에는 기기가 놀고 화면 대기 중에는 CPU가 논다.
+OCR을 별도 프로세스 풀에 넘기고 Future로 결과를 받으면 다음 채널로 이동하는 동안 직전 화면의 검증 OCR이 돈다.
+
+- 워커 프로세스마다 EasyOCR 모델을 한 번만 로드 (풀 시작 시 미리 로드)
+- 대기 작업 수 상한(OCR_QUEUE_SIZE): 가득 차면 submit이 빈자리가 날 때까지 대기 (메모리 폭주 방지)
+- OCR 캐시(ocr_cache)는 호출 프로세스 쪽에서 먼저 확인 → 같은 화면은 풀로 보내지 않음
+- 다중 기기 실행(device_runner)에서는 부모가 풀 하나를 서버(multiprocessing manager)로 띄우고
+  기기 워커들이 주소로 접속해 같은 풀을 공유 → 기기 수만큼 모델을 중복 로드하지 않음
+
+환경변수:
+  OCR_WORKERS=0                # 풀 워커 수. 0이면 지금처럼 호출 스레드에서 바로 OCR
+  OCR_QUEUE_SIZE=              # 대기 작업 상한 (기본: 워커 수 x 2)
+  OCR_SERVICE_ADDRESS=host:port  # 공유 풀 서버 주소 (다중 기기 실행기가 자동 지정)
+  OCR_SERVICE_AUTHKEY=         # 공유 풀 서버 인증키 (hex)
+"""
+from __future__ import annotations
+import os
+import time
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.managers import BaseManager
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.ocr_cache import _MISS, get_ocr_cache
+
+
+# ---------- 풀 워커 프로세스 ----------
+def _init_worker(langs: Sequence[str], gpu: bool, threads: Optional[int]):
+    from utils.ocr_engine import configure_ocr
+
+    engine = configure_ocr(langs=langs, gpu=gpu, threads=threads)
+    engine.reader  # 첫 작업을 기다리지 않고 모델 로드
+
+
+def _worker_readtext(np_image: np.ndarray, kwargs: Dict[str, Any]):
+    from utils.ocr_engine import get_ocr_engine
+
+    return get_ocr_engine().readtext(np_image, **kwargs)
+
+
+def _worker_readtext_batched(images: List[np.ndarray], kwargs: Dict[str, Any]):
+    from utils.ocr_engine import get_ocr_engine
+
+    return get_ocr_engine().readtext_batched(images, **kwargs)
+
+
+class OCRService:
+    """
+    :param workers: 워커 프로세스 수 (각자 모델 1개)
+    :param queue_size: 실행 중 + 대기 작업 상한
+    :param threads: 워커당 torch 스레드 수 (기본: CPU 코어 / 워커 수)
+    """
+
+    def __init__(self, workers: int = 2, queue_size: Optional[int] = None,
+                 langs: Optional[Sequence[str]] = None, gpu: Optional[bool] = None,
+                 threads: Optional[int] = None):
+        from utils.ocr_engine import get_ocr_engine
+
+        engine = get_ocr_engine()
+        self.workers = max(1, workers)
+        self.queue_size = max(self.workers, queue_size or self.workers * 2)
+        threads = threads or max(1, (os.cpu_count() or 1) // self.workers)
+        # spawn: 부모의 torch 스레드/드라이버 상태를 물려받지 않음
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(list(langs or engine.langs), engine.gpu if gpu is None else gpu, threads),
+        )
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.blocked_seconds = 0.0      # 대기열이 가득 차 submit이 기다린 시간
+
+    def submit(self, np_image: np.ndarray, **kwargs) -> Future:
+        """readtext 작업 제출 (대기열이 가득 차면 빈자리가 날 때까지 대기)"""
+        return self._submit(_worker_readtext, np_image, kwargs)
+
+    def submit_batch(self, images: List[np.ndarray], **kwargs) -> Future:
+        """같은 크기 이미지 묶음의 readtext_batched 작업 제출 (대기열 한 칸 차지). Future[결과 목록]"""
+        return self._submit(_worker_readtext_batched, images, kwargs)
+
+    def _submit(self, fn, payload, kwargs: Dict[str, Any]) -> Future:
+        start = time.perf_counter()
+        self._slots.acquire()
+        waited = time.perf_counter() - start
+        try:
+            future = self._pool.submit(fn, payload, kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.submitted += 1
+            self.blocked_seconds += waited
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, _future: Future):
+        with self._lock:
+            self.completed += 1
+        self._slots.release()
+
+    def readtext(self, np_image: np.ndarray, kwargs: Dict[str, Any]):
+        """동기 호출 (공유 서버에서 기기 워커 요청을 처리할 때 사용)"""
+        return self.submit(np_image, **kwargs).result()
+
+    def readtext_batched(self, images: List[np.ndarray], kwargs: Dict[str, Any]):
+        return self.submit_batch(images, **kwargs).result()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"workers": self.workers, "queue_size": self.queue_size,
+                    "submitted": self.submitted, "completed": self.completed,
+                    "in_flight": self.submitted - self.completed,
+                    "blocked_seconds": round(self.blocked_seconds, 3)}
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+# ---------- 다중 기기 공유 ----------
+class _OCRManager(BaseManager):
+    pass
+
+
+_served: Optional[OCRService] = None
+
+
+def _serve_init(workers: int, queue_size: Optional[int]):
+    global _served
+    _served = OCRService(workers, queue_size)
+
+
+def _served_service() -> OCRService:
+    return _served
+
+
+_OCRManager.register("service", callable=_served_service, exposed=("readtext", "readtext_batched", "stats", "shutdown"))
+
+
+def start_ocr_server(workers: int, queue_size: Optional[int] = None) -> Tuple[BaseManager, str, str]:
+    """
+    공유 OCR 풀 서버를 별도 프로세스로 시작.
+    :return: (manager, 'host:port', authkey hex) — 자식 프로세스에는 OCR_SERVICE_ADDRESS/AUTHKEY로 전달
+    """
+    authkey = os.urandom(16)
+    manager = _OCRManager(address=("127.0.0.1", 0), authkey=authkey,
+                          ctx=multiprocessing.get_context("spawn"))
+    manager.start(_serve_init, (workers, queue_size))
+    host, port = manager.address
+    print(f"🧠 공유 OCR 풀 시작: 워커 {workers}개 ({host}:{port})")
+    return manager, f"{host}:{port}", authkey.hex()
+
+
+def stop_ocr_server(manager: BaseManager):
+    """풀 워커를 먼저 정리한 뒤 서버 종료 (서버만 끄면 워커 프로세스가 남음)"""
+    service = manager.service()
+    print(f"🧠 공유 OCR 풀 종료: {service.stats()}")
+    service.shutdown()
+    manager.shutdown()
+
+
+class RemoteOCRService:
+    """공유 OCR 풀 서버 클라이언트. 요청마다 로컬 스레드에서 동기 호출해 Future로 돌려줌"""
+
+    def __init__(self, address: str, authkey: str, max_pending: int = 4):
+        host, port = address.rsplit(":", 1)
+        manager = _OCRManager(address=(host, int(port)), authkey=bytes.fromhex(authkey))
+        manager.connect()
+        self._proxy = manager.service()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_pending), thread_name_prefix="ocr-client")
+
+    def submit(self, np_image: np.ndarray, **kwargs) -> Future:
+        return self._pool.submit(self._proxy.readtext, np_image, kwargs)
+
+    def submit_batch(self, images: List[np.ndarray], **kwargs) -> Future:
+        return self._pool.submit(self._proxy.readtext_batched, images, kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self._proxy.stats(), remote=True)
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+_service = None
+_service_lock = threading.Lock()
+_service_checked = False
+
+
+def get_ocr_service():
+    """
+    전역 OCR 서비스. OCR_SERVICE_ADDRESS가 있으면 공유 풀 클라이언트, OCR_WORKERS>0이면 로컬 풀,
+    둘 다 없으면 None (호출 스레드에서 바로 OCR)
+    """
+    global _service, _service_checked
+    if not _service_checked:
+        with _service_lock:
+            if not _service_checked:
+                workers = int(os.environ.get("OCR_WORKERS", "0"))
+                queue_size = int(os.environ.get("OCR_QUEUE_SIZE", "0")) or None
+                address = os.environ.get("OCR_SERVICE_ADDRESS")
+                if address:
+                    _service = RemoteOCRService(address, os.environ.get("OCR_SERVICE_AUTHKEY", ""),
+                                                max_pending=queue_size or 4)
+                elif workers > 0:
+                    _service = OCRService(workers, queue_size)
+                _service_checked = True
+    return _service
+
+
+def _completed(result=None, error: Optional[BaseException] = None) -> Future:
+    future: Future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def chain(future: Future, fn: Callable[[Any], Any]) -> Future:
+    """future 결과에 fn을 적용한 새 Future (fn 예외도 전달)"""
+    out: Future = Future()
+
+    def _apply(done: Future):
+        try:
+            out.set_result(fn(done.result()))
+        except BaseException as e:
+            out.set_exception(e)
+    future.add_done_callback(_apply)
+    return out
+
+
+def submit_readtext(np_image: np.ndarray, **kwargs) -> Future:
+    """
+    캐시 → (OCR_TILES>1이고 긴 화면이면) 타일 병렬 OCR / (서비스가 있으면) 풀 제출 / (없으면) 바로 OCR.
+    항상 Future 반환. 반환 Future의 cache_hit 속성으로 캐시 적중 여부 확인
+    """
+    from utils.tiled_ocr import get_tiled_ocr
+    tiler = get_tiled_ocr()
+    tiled = tiler is not None and tiler.applies(np_image, kwargs)
+    cache = get_ocr_cache()
+    # 타일 병합 결과는 전체 readtext 결과와 다를 수 있음 → 타일 설정을 캐시 키에 포함 (디스크 계층은 실행 간 공유)
+    okey = cache.option_key(dict(kwargs, _tiles=(tiler.tiles, tiler.overlap)) if tiled else kwargs)
+    ikey = cache.image_key(np_image)
+    cached = cache.get(ikey, okey)
+    service = get_ocr_service()
+    if cached is not _MISS:
+        future = _completed(cached)
+    elif service is None and not tiled:
+        from utils.ocr_engine import get_ocr_engine
+        try:
+            result = get_ocr_engine().readtext(np_image, **kwargs)
+        except Exception as e:
+            return _completed(error=e)
+        cache.put(ikey, okey, result)
+        future = _completed(result)
+    else:
+        def _remember(done: Future):
+            if done.exception() is None:
+                cache.put(ikey, okey, done.result())
+
+        future = tiler.submit(np_image, **kwargs) if tiled else service.submit(np_image, **kwargs)
+        future.add_done_callback(_remember)
+    future.cache_hit = cached is not _MISS
+    return future
+
+
+def submit_readtext_batched(images: Sequence[np.ndarray], max_images: int = 8, **kwargs) -> List[Future]:
+    """
+    여러 이미지를 readtext_batched로 묶어 인식. 캐시 적중은 건너뛰고, 나머지는 같은 크기끼리 max_images장씩 묶는다.
+    kwargs의 batch_size는 EasyOCR 인식기 배치 크기 (캐시 키에는 포함하지 않음 — 결과에 영향 없음)
+    :return: 입력 순서대로 Future[readtext 결과]
+    """
+    cache = get_ocr_cache()
+    okey = cache.option_key({k: v for k, v in kwargs.items() if k != "batch_size"})
+    keys = [cache.image_key(image) for image in images]
+    futures: List[Optional[Future]] = [None] * len(images)
+    groups: Dict[Tuple[int, ...], List[int]] = {}
+    for i, ikey in enumerate(keys):
+        cached = cache.get(ikey, okey)
+        if cached is not _MISS:
+            futures[i] = _completed(cached)
+            futures[i].cache_hit = True
+        else:
+            groups.setdefault(tuple(images[i].shape), []).append(i)
+
+    def _pick(results, pos: int, ikey: str):
+        cache.put(ikey, okey, results[pos])
+        return results[pos]
+
+    service = get_ocr_service()
+    for indices in groups.values():
+        for start in range(0, len(indices), max(1, max_images)):
+            chunk = indices[start:start + max(1, max_images)]
+            batch = [images[i] for i in chunk]
+            if service is None:
+                from utils.ocr_engine import get_ocr_engine
+                try:
+                    batch_future = _completed(get_ocr_engine().readtext_batched(batch, **kwargs))
+                except Exception as e:
+                    batch_future = _completed(error=e)
+            else:
+                batch_future = service.submit_batch(batch, **kwargs)
+            for pos, i in enumerate(chunk):
+                futures[i] = chain(batch_future, functools.partial(_pick, pos=pos, ikey=keys[i]))
+                futures[i].cache_hit = False
+    return futures
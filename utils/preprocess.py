@@ -0,0 +1,102 @@
+# utils/preprocess.py
+"""
+OCR 입력 전처리 (OpenCV/NumPy).
+
+기존 PIL 경로(convert("L") → ImageFilter.SHARPEN → ImageEnhance.Contrast(2.0) → np.array)와
+같은 결과를 배열 그대로 만든다.
+- 흑백: 이미 흑백이면 그대로 사용 (capture_frame은 디코딩 단계에서 흑백)
+- 선명화: PIL SHARPEN과 같은 3x3 커널을 cv2.filter2D로 적용
+- 대비: 평균 밝기 기준 LUT 1회 적용 (PIL Contrast와 같은 식)
+- 축소(선택): scale 또는 max_side. OCR 결과 좌표는 1/scale로 되돌려야 함 (read_screen이 처리)
+"""
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# PIL ImageFilter.SHARPEN 과 동일 (scale 16, offset 0)
+SHARPEN_KERNEL = np.array([[-2, -2, -2],
+                           [-2, 32, -2],
+                           [-2, -2, -2]], dtype=np.float32) / 16.0
+
+
+@dataclass
+class PreprocessConfig:
+    sharpen: bool = True
+    contrast: float = 2.0             # 1.0이면 대비 보정 생략
+    scale: float = 1.0                # 축소 배율 (예: 0.5)
+    max_side: Optional[int] = None    # 긴 변 최대 길이(px). scale과 함께 쓰면 더 작은 쪽 적용
+
+    def scale_for(self, shape: Tuple[int, ...]) -> float:
+        scale = self.scale
+        if self.max_side:
+            scale = min(scale, self.max_side / max(shape[0], shape[1]))
+        return min(1.0, scale)
+
+
+def to_gray(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 3:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return image
+
+
+def contrast_lut(mean: float, factor: float) -> np.ndarray:
+    """PIL ImageEnhance.Contrast: out = mean + factor * (in - mean), 0~255로 자름"""
+    levels = np.arange(256, dtype=np.float32)
+    return np.clip(mean + factor * (levels - mean) + 0.5, 0, 255).astype(np.uint8)
+
+
+def preprocess_array(image: np.ndarray, config: Optional[PreprocessConfig] = None) -> Tuple[np.ndarray, float]:
+    """
+    흑백 → (축소) → 선명화 → 대비 보정.
+    입력 배열은 수정하지 않고, 중간 단계는 한 버퍼에서 처리한다.
+    :return: (전처리된 uint8 배열, 적용된 축소 배율)
+    """
+    config = config or get_preprocess_config()
+    gray = to_gray(image)
+
+    scale = config.scale_for(gray.shape)
+    if scale < 1.0:
+        h, w = gray.shape[:2]
+        out = cv2.resize(gray, (max(1, round(w * scale)), max(1, round(h * scale))),
+                         interpolation=cv2.INTER_AREA)
+    else:
+        out = None
+
+    if config.sharpen:
+        src = gray if out is None else out
+        out = cv2.filter2D(src, -1, SHARPEN_KERNEL, dst=out, borderType=cv2.BORDER_REPLICATE)
+    elif out is None:
+        out = gray.copy()
+
+    if config.contrast != 1.0:
+        cv2.LUT(out, contrast_lut(int(out.mean() + 0.5), config.contrast), dst=out)
+    return out, scale
+
+
+_config: Optional[PreprocessConfig] = None
+
+
+def get_preprocess_config() -> PreprocessConfig:
+    """전역 전처리 설정. OCR_PREPROCESS_SCALE, OCR_PREPROCESS_MAX_SIDE로 축소 지정 가능 (기본: 원본 해상도)"""
+    global _config
+    if _config is None:
+        max_side = os.environ.get("OCR_PREPROCESS_MAX_SIDE")
+        _config = PreprocessConfig(
+            scale=float(os.environ.get("OCR_PREPROCESS_SCALE", "1.0")),
+            max_side=int(max_side) if max_side else None,
+        )
+    return _config
+
+
+def configure_preprocess(**kwargs) -> PreprocessConfig:
+    """전역 전처리 설정 변경 (예: configure_preprocess(max_side=1600))"""
+    config = get_preprocess_config()
+    for key, value in kwargs.items():
+        if not hasattr(config, key):
+            raise TypeError(f"알 수 없는 전처리 설정: {key}")
+        setattr(config, key, value)
+    return config
@@ -0,0 +1,340 @@
+# utils/replay.py
+"""
+드라이버 호출 녹화 / 재생.
+
+- RecordingDriver: 실제 Appium 드라이버를 감싸서 헬퍼가 부르는 호출(스크린샷, get_window_size,
+  W3C 탭/스와이프, find_element + click)을 응답과 함께 세션 디렉토리에 기록한다.
+  스크린샷은 내용 해시(sha1) 이름으로 한 번만 저장한다.
+- FakeDriver: 녹화된 세션을 기기 없이 재생한다. 녹화를 동작(탭/스와이프/클릭) 단위 구간으로 나누고,
+  재생 중 동작이 실행될 때마다 다음 구간의 화면을 돌려준다.
+  코드가 바뀌어 동작 순서가 달라지면(예: 색인으로 스크롤 생략) 같은 종류·좌표의 녹화 동작을 앞에서 찾아 맞춘다.
+  녹화에 없는 추가 동작은 다음 구간으로 추정 진행하고, 이어지는 동작이 그 구간의 녹화 동작이면 다시 맞춘다.
+
+세션 디렉토리 구성:
+  session.jsonl      호출 1건당 1줄
+  frames/<sha1>.png  스크린샷
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+
+SESSION_FILE = "session.jsonl"
+FRAMES_DIR = "frames"
+SESSIONS_ROOT = "./reports/sessions"
+POINT_TOLERANCE = 40    # 동작 좌표 비교 허용 오차(px)
+LOOKAHEAD = 30          # 어긋난 동작을 맞출 때 앞으로 찾아볼 녹화 동작 수
+
+
+class ReplayMismatch(Exception):
+    """strict 재생에서 녹화와 다른 동작이 실행됨"""
+
+
+def describe_actions(params: Dict[str, Any]) -> Tuple[str, List[Tuple[int, int]]]:
+    """W3C actions 파라미터 → ('tap' | 'swipe' | 'other', 이동 좌표 목록)"""
+    try:
+        steps = params["actions"][0]["actions"]
+    except (KeyError, IndexError, TypeError):
+        return "other", []
+    points = [(int(s["x"]), int(s["y"])) for s in steps if s.get("type") == "pointerMove"]
+    if not points:
+        return "other", []
+    if len(points) == 1 or all(p == points[0] for p in points):
+        return "tap", points[:1]
+    return "swipe", [points[0], points[-1]]
+
+
+def _close(a, b, tolerance: int = POINT_TOLERANCE) -> bool:
+    return len(a) == len(b) and all(abs(p[0] - q[0]) <= tolerance and abs(p[1] - q[1]) <= tolerance
+                                    for p, q in zip(a, b))
+
+
+# ---------- 녹화 ----------
+class RecordingElement:
+    """find_element 결과를 감싸서 click/send_keys 등을 동작으로 기록"""
+
+    def __init__(self, recorder: "RecordingDriver", element, locator: Tuple[str, str]):
+        self._recorder = recorder
+        self._element = element
+        self._locator = locator
+
+    def click(self):
+        self._recorder._log({"call": "click", "by": self._locator[0], "value": self._locator[1]})
+        return self._element.click()
+
+    def send_keys(self, *value):
+        self._recorder._log({"call": "send_keys", "by": self._locator[0], "value": self._locator[1],
+                             "text": "".join(map(str, value))})
+        return self._element.send_keys(*value)
+
+    def __getattr__(self, name):
+        return getattr(self._element, name)
+
+
+class RecordingDriver:
+    """
+    실제 드라이버 프록시. 기록하지 않는 속성/메서드는 그대로 위임한다.
+    :param session_dir: 기록할 디렉토리 (없으면 생성)
+    """
+
+    def __init__(self, driver, session_dir: str):
+        self._driver = driver
+        self.session_dir = session_dir
+        os.makedirs(os.path.join(session_dir, FRAMES_DIR), exist_ok=True)
+        self._file = open(os.path.join(session_dir, SESSION_FILE), "w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._seq = 0
+        self._log({"call": "session", "session_id": getattr(driver, "session_id", None)})
+
+    def _log(self, event: Dict[str, Any]):
+        with self._lock:
+            event = {"seq": self._seq, "t": round(time.monotonic() - self._start, 3), **event}
+            self._seq += 1
+            self._file.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+            self._file.flush()
+
+    def _save_frame(self, png: bytes) -> str:
+        digest = hashlib.sha1(png).hexdigest()
+        path = os.path.join(self.session_dir, FRAMES_DIR, f"{digest}.png")
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(png)
+        return digest
+
+    # ---------- 기록 대상 ----------
+    @property
+    def session_id(self):
+        return self._driver.session_id
+
+    def get_screenshot_as_png(self) -> bytes:
+        png = self._driver.get_screenshot_as_png()
+        self._log({"call": "screenshot", "frame": self._save_frame(png)})
+        return png
+
+    def save_screenshot(self, filename: str) -> bool:
+        return self.get_screenshot_as_file(filename)
+
+    def get_screenshot_as_file(self, filename: str) -> bool:
+        png = self.get_screenshot_as_png()
+        with open(filename, "wb") as f:
+            f.write(png)
+        return True
+
+    def get_window_size(self, *args, **kwargs):
+        size = self._driver.get_window_size(*args, **kwargs)
+        self._log({"call": "window_size", "response": size})
+        return size
+
+    def execute(self, driver_command: str, params: Optional[Dict[str, Any]] = None):
+        response = self._driver.execute(driver_command, params)
+        event = {"call": "execute", "command": driver_command, "params": params,
+                 "response": (response or {}).get("value")}
+        if driver_command == Command.W3C_ACTIONS:
+            event["kind"], event["points"] = describe_actions(params)
+        self._log(event)
+        return response
+
+    def find_element(self, by: str, value: Optional[str] = None):
+        try:
+            element = self._driver.find_element(by, value)
+        except Exception as e:
+            self._log({"call": "find_element", "by": by, "value": value, "found": False,
+                       "error": type(e).__name__})
+            raise
+        self._log({"call": "find_element", "by": by, "value": value, "found": True})
+        return RecordingElement(self, element, (by, value))
+
+    def quit(self):
+        try:
+            self._driver.quit()
+        finally:
+            self._log({"call": "quit"})
+            self._file.close()
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def record_session(driver, name: str, root: str = SESSIONS_ROOT) -> RecordingDriver:
+    """reports/sessions/{name}_{시각}/ 에 녹화하는 RecordingDriver"""
+    session_dir = os.path.join(root, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}")
+    print(f"⏺️ 드라이버 호출 녹화: {session_dir}")
+    return RecordingDriver(driver, session_dir)
+
+
+# ---------- 재생 ----------
+def load_session(session_dir: str) -> List[Dict[str, Any]]:
+    with open(os.path.join(session_dir, SESSION_FILE), "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class _Segment:
+    """동작 하나와 그 직후(다음 동작 전까지) 녹화된 화면/요소 조회"""
+
+    def __init__(self, action: Optional[Dict[str, Any]]):
+        self.action = action
+        self.frames: List[str] = []
+        self.finds: Dict[Tuple[str, str], bool] = {}
+
+
+class FakeElement:
+    def __init__(self, driver: "FakeDriver", by: str, value: str):
+        self._driver = driver
+        self.locator = (by, value)
+
+    def click(self):
+        self._driver._act({"call": "click", "by": self.locator[0], "value": self.locator[1]})
+
+    def send_keys(self, *value):
+        self._driver._act({"call": "send_keys", "by": self.locator[0], "value": self.locator[1]})
+
+    def is_displayed(self) -> bool:
+        return True
+
+
+class FakeDriver:
+    """
+    녹화 세션 재생용 드라이버.
+    :param strict: True면 녹화에서 찾을 수 없는 동작 시 ReplayMismatch
+    :param settle: True면 각 구간의 마지막(안정된) 화면만 돌려줌. False면 녹화 순서대로 돌려주고 끝나면 마지막 화면 반복
+    """
+
+    def __init__(self, session_dir: str, strict: bool = False, settle: bool = False):
+        self.session_dir = session_dir
+        self.strict = strict
+        self.settle = settle
+        self.events = load_session(session_dir)
+        self.session_id = f"replay:{os.path.basename(os.path.normpath(session_dir))}"
+        self._window_size = next((e["response"] for e in self.events if e["call"] == "window_size"), None)
+        self.segments = self._split(self.events)
+        self.position = 0       # 현재 구간
+        self._cursor = 0        # 구간 안에서 다음에 돌려줄 화면
+        self._guessed = False   # 현재 구간이 매칭 없이 추정으로 넘어온 것(그 구간의 동작은 아직 안 맞춤)
+        self._png_cache: Dict[str, bytes] = {}
+        self.actions = 0
+        self.skipped = 0
+        self.unmatched = 0
+
+    @staticmethod
+    def _is_action(event: Dict[str, Any]) -> bool:
+        return (event["call"] == "execute" and event.get("kind") in ("tap", "swipe")) \
+            or event["call"] in ("click", "send_keys")
+
+    def _split(self, events) -> List[_Segment]:
+        segments = [_Segment(None)]
+        for e in events:
+            if self._is_action(e):
+                segments.append(_Segment(e))
+            elif e["call"] == "screenshot":
+                segments[-1].frames.append(e["frame"])
+            elif e["call"] == "find_element":
+                segments[-1].finds.setdefault((e["by"], e["value"]), e["found"])
+        # 화면이 없는 구간은 직전 화면을 이어 받음
+        last: List[str] = []
+        for seg in segments:
+            if not seg.frames:
+                seg.frames = last[-1:]
+            last = seg.frames
+        return segments
+
+    # ---------- 동작 정렬 ----------
+    @staticmethod
+    def _matches(recorded: Dict[str, Any], performed: Dict[str, Any]) -> bool:
+        if recorded["call"] != performed["call"]:
+            return False
+        if recorded["call"] == "execute":
+            return recorded["kind"] == performed["kind"] and _close(recorded["points"], performed["points"])
+        return recorded["by"] == performed["by"] and recorded["value"] == performed["value"]
+
+    def _act(self, performed: Dict[str, Any]):
+        self.actions += 1
+        # 추정으로 넘어온 구간이면 그 구간의 동작부터 비교 (추가 동작 뒤에 원래 동작이 오면 다시 맞춰짐)
+        first = 0 if self._guessed else 1
+        for step in range(first, LOOKAHEAD + 1):
+            index = self.position + step
+            if index >= len(self.segments):
+                break
+            if self._matches(self.segments[index].action, performed):
+                self.skipped += max(0, step - 1)
+                self._move(index)
+                return
+        self.unmatched += 1
+        message = f"녹화에 없는 동작: {performed.get('kind', performed['call'])} {performed.get('points', '')}"
+        if self.strict:
+            raise ReplayMismatch(message)
+        print(f"⚠️ 재생 {message} → 다음 구간으로 진행")
+        if self.position + 1 < len(self.segments):
+            self._move(self.position + 1, guessed=True)
+
+    def _move(self, index: int, guessed: bool = False):
+        self.position = index
+        self._cursor = 0
+        self._guessed = guessed
+
+    # ---------- 드라이버 API ----------
+    def _frame_png(self, digest: str) -> bytes:
+        if digest not in self._png_cache:
+            with open(os.path.join(self.session_dir, FRAMES_DIR, f"{digest}.png"), "rb") as f:
+                self._png_cache[digest] = f.read()
+        return self._png_cache[digest]
+
+    def get_screenshot_as_png(self) -> bytes:
+        frames = self.segments[self.position].frames
+        if not frames:
+            raise ReplayMismatch("녹화된 화면이 없습니다")
+        index = len(frames) - 1 if self.settle else min(self._cursor, len(frames) - 1)
+        self._cursor += 1
+        return self._frame_png(frames[index])
+
+    def get_screenshot_as_file(self, filename: str) -> bool:
+        with open(filename, "wb") as f:
+            f.write(self.get_screenshot_as_png())
+        return True
+
+    save_screenshot = get_screenshot_as_file
+
+    def get_window_size(self, *args, **kwargs):
+        if self._window_size is None:
+            raise ReplayMismatch("녹화에 get_window_size 응답이 없습니다")
+        return dict(self._window_size)
+
+    def execute(self, driver_command: str, params: Optional[Dict[str, Any]] = None):
+        if driver_command == Command.W3C_ACTIONS:
+            kind, points = describe_actions(params)
+            if kind in ("tap", "swipe"):
+                self._act({"call": "execute", "kind": kind, "points": points})
+        return {"value": None}
+
+    def find_element(self, by: str, value: Optional[str] = None):
+        # 현재 구간 → 이전 구간 → (동작 순서가 달라진 경우) 다음 구간 순으로 같은 조회 기록을 찾음
+        behind = range(self.position, -1, -1)
+        ahead = range(self.position + 1, min(len(self.segments), self.position + LOOKAHEAD + 1))
+        for index in (*behind, *ahead):
+            found = self.segments[index].finds.get((by, value))
+            if found is not None:
+                if found:
+                    return FakeElement(self, by, value)
+                break
+        raise NoSuchElementException(f"재생: 요소 없음 ({by}={value})")
+
+    def implicitly_wait(self, time_to_wait: float):
+        pass
+
+    def quit(self):
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "segments": len(self.segments),
+            "position": self.position,
+            "actions": self.actions,
+            "skipped_recorded_actions": self.skipped,
+            "unmatched_actions": self.unmatched,
+        }
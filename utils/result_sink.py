@@ -0,0 +1,285 @@
+# utils/result_sink.py
+"""
+테스트 결과 기록 버퍼.
+
+결과 한 줄마다 인증 + Sheets API 호출을 하던 방식 대신,
+행을 메모리(또는 로컬 SQLite 스풀 파일)에 모아 두었다가 백그라운드 스레드에서 한 번에 기록한다.
+- batch_size 이상 쌓이면 자동 flush, 종료 시(atexit) 남은 행 flush
+- 백엔드 교체 가능: SheetsBackend(기본, GOOGLE_SHEET_ID 설정 시) / CsvBackend / SqliteBackend
+- 기록 실패 시 행을 버리지 않고 다음 flush에서 재시도 (스풀 파일을 쓰면 프로세스가 죽어도 남음)
+
+환경변수:
+  RESULT_SINK=sheets|csv|sqlite   (기본: GOOGLE_SHEET_ID가 있으면 sheets, 없으면 csv)
+  RESULT_SINK_PATH=./reports/results.csv   (csv/sqlite 경로)
+  RESULT_BATCH_SIZE=50
+  RESULT_SPOOL_PATH=./reports/result_spool.db   (선택: 대기 행을 SQLite에 보관)
+"""
+from __future__ import annotations
+import os
+import csv
+import json
+import atexit
+import pickle
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+Row = List[str]
+HEADER = ["timestamp", "test_name", "status", "error_message", "screenshot_path"]
+
+
+# ---------- 백엔드 ----------
+class SheetsBackend:
+    """Google Sheets values.append 한 번으로 여러 행 기록. 클라이언트는 첫 기록 때 한 번만 생성"""
+
+    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+
+    def __init__(self, spreadsheet_id: Optional[str] = None, range_name: str = 'Test Results!A:E',
+                 token_path: str = 'token.pickle', credentials_path: str = 'credentials.json'):
+        self.spreadsheet_id = spreadsheet_id or os.getenv('GOOGLE_SHEET_ID')
+        self.range_name = range_name
+        self.token_path = token_path
+        self.credentials_path = credentials_path
+        self._service = None
+
+    def _build(self):
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+
+        creds = None
+        if os.path.exists(self.token_path):
+            with open(self.token_path, 'rb') as token:
+                creds = pickle.load(token)
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(self.credentials_path, self.SCOPES)
+                creds = flow.run_local_server(port=0)
+            with open(self.token_path, 'wb') as token:
+                pickle.dump(creds, token)
+        return build('sheets', 'v4', credentials=creds)
+
+    def write(self, rows: Sequence[Row]):
+        if self._service is None:
+            self._service = self._build()
+        self._service.spreadsheets().values().append(
+            spreadsheetId=self.spreadsheet_id,
+            range=self.range_name,
+            valueInputOption='RAW',
+            body={'values': [list(r) for r in rows]}
+        ).execute()
+        print(f"테스트 결과가 Google Sheets에 기록되었습니다: {len(rows)}건")
+
+    def close(self):
+        self._service = None
+
+
+class CsvBackend:
+    """로컬 CSV 파일에 이어 쓰기 (파일이 없으면 헤더부터)"""
+
+    def __init__(self, path: str = './reports/results.csv'):
+        self.path = path
+
+    def write(self, rows: Sequence[Row]):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        new_file = not os.path.exists(self.path)
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(HEADER)
+            writer.writerows(rows)
+
+    def close(self):
+        pass
+
+
+class SqliteBackend:
+    """로컬 SQLite 파일의 results 테이블에 기록"""
+
+    def __init__(self, path: str = './reports/results.db'):
+        self.path = path
+
+    def write(self, rows: Sequence[Row]):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS results "
+                         "(timestamp TEXT, test_name TEXT, status TEXT, error_message TEXT, screenshot_path TEXT)")
+            conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?)", [tuple(r) for r in rows])
+
+    def close(self):
+        pass
+
+
+# ---------- 대기 행 보관 ----------
+class _MemorySpool:
+    def __init__(self):
+        self._rows: List[Row] = []
+
+    def push(self, row: Row):
+        self._rows.append(row)
+
+    def peek(self, limit: int) -> List[Row]:
+        return self._rows[:limit]
+
+    def drop(self, count: int):
+        del self._rows[:count]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class _SqliteSpool:
+    """대기 행을 SQLite 파일에 보관 (비정상 종료 후 다음 실행에서 이어서 기록)"""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS pending (id INTEGER PRIMARY KEY AUTOINCREMENT, row TEXT)")
+        self._conn.commit()
+
+    def push(self, row: Row):
+        self._conn.execute("INSERT INTO pending (row) VALUES (?)", (json.dumps(row, ensure_ascii=False),))
+        self._conn.commit()
+
+    def peek(self, limit: int) -> List[Row]:
+        cur = self._conn.execute("SELECT row FROM pending ORDER BY id LIMIT ?", (limit,))
+        return [json.loads(r[0]) for r in cur.fetchall()]
+
+    def drop(self, count: int):
+        self._conn.execute("DELETE FROM pending WHERE id IN (SELECT id FROM pending ORDER BY id LIMIT ?)", (count,))
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+
+
+# ---------- 결과 버퍼 ----------
+class ResultSink:
+    """
+    결과 행을 모아 백그라운드 스레드에서 묶음 기록.
+    :param backend: write(rows) / close() 를 가진 객체
+    :param batch_size: 이만큼 쌓이면 자동 flush (한 번의 write에 보내는 최대 행 수이기도 함)
+    :param spool_path: 주면 대기 행을 SQLite 파일에 보관
+    """
+
+    def __init__(self, backend, batch_size: int = 50, spool_path: Optional[str] = None):
+        self.backend = backend
+        self.batch_size = max(1, batch_size)
+        self._spool = _SqliteSpool(spool_path) if spool_path else _MemorySpool()
+        self._cond = threading.Condition()
+        self._flush_requested = False
+        self._closed = False
+        self._busy = False
+        self._failed = False     # 직전 기록 실패 시 다음 flush 요청까지 자동 재시도 안 함
+        self.written = 0
+        self.last_error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, name="result-sink", daemon=True)
+        self._thread.start()
+
+    def add(self, test_name: str, status: str, error_message: Optional[str] = None,
+            screenshot_path: Optional[str] = None):
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("이미 닫힌 ResultSink입니다.")
+            self._spool.push([timestamp, test_name, status, error_message or '', screenshot_path or ''])
+            if len(self._spool) >= self.batch_size:
+                self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._spool)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 행 기록을 요청하고 끝날 때까지 대기. 기록 실패로 행이 남으면 False"""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify()
+            self._cond.wait_for(lambda: not self._flush_requested and not self._busy, timeout)
+            return len(self._spool) == 0
+
+    def close(self, timeout: Optional[float] = 30.0):
+        with self._cond:
+            if self._closed:
+                return
+        ok = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+        self.backend.close()
+        if not ok:
+            print(f"⚠️ 결과 {self.pending()}건 기록 실패 (마지막 오류: {self.last_error})")
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._flush_requested
+                                    or (not self._failed and len(self._spool) >= self.batch_size))
+                if self._closed:
+                    return
+                batch = self._spool.peek(self.batch_size)
+                self._busy = True
+            ok = self._write(batch)
+            with self._cond:
+                if ok:
+                    self._spool.drop(len(batch))
+                self._failed = not ok
+                self._busy = False
+                # 요청된 flush는 남은 행을 다 쓰거나 실패하면 끝
+                if self._flush_requested and (not ok or len(self._spool) == 0):
+                    self._flush_requested = False
+                self._cond.notify_all()
+
+    def _write(self, batch: List[Row]) -> bool:
+        if not batch:
+            return True
+        try:
+            self.backend.write(batch)
+            self.written += len(batch)
+            return True
+        except Exception as e:
+            self.last_error = e
+            print(f"결과 기록 중 오류 발생 ({len(batch)}건, 다음 flush에서 재시도): {str(e)}")
+            return False
+
+
+_sink: Optional[ResultSink] = None
+_sink_lock = threading.Lock()
+
+
+def make_backend(kind: Optional[str] = None, path: Optional[str] = None):
+    kind = (kind or os.environ.get("RESULT_SINK") or ("sheets" if os.getenv('GOOGLE_SHEET_ID') else "csv")).lower()
+    path = path or os.environ.get("RESULT_SINK_PATH")
+    if kind == "sheets":
+        return SheetsBackend()
+    if kind == "csv":
+        return CsvBackend(path or './reports/results.csv')
+    if kind == "sqlite":
+        return SqliteBackend(path or './reports/results.db')
+    raise ValueError(f"알 수 없는 RESULT_SINK: {kind} (sheets | csv | sqlite)")
+
+
+def get_result_sink() -> ResultSink:
+    """프로세스 전역 ResultSink (종료 시 자동 flush)"""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = ResultSink(
+                    make_backend(),
+                    batch_size=int(os.environ.get("RESULT_BATCH_SIZE", "50")),
+                    spool_path=os.environ.get("RESULT_SPOOL_PATH") or None,
+                )
+                atexit.register(_sink.close)
+    return _sink
+
+
+def close_result_sink():
+    """전역 ResultSink가 있으면 남은 행 기록 후 닫기 (atexit가 돌지 않는 자식 프로세스 종료 시 호출)"""
+    if _sink is not None:
+        _sink.close()
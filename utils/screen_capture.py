@@ -0,0 +1,81 @@
+# utils/screen_capture.py
+"""
+디스크를 거치지 않는 화면 캡처.
+
+driver.get_screenshot_as_png() 바이트를 바로 numpy 배열로 디코딩해 OCR에 넘기고,
+이름을 준 캡처는 실패 대비 링 버퍼(frame_buffer)에만 보관하고, 디스크 저장은 선택 사항으로
+ArtifactStore의 백그라운드 스레드에서 처리한다(내용 주소 파일명, 중복 저장 없음).
+"""
+from __future__ import annotations
+import os
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from utils.tracing import traced
+from utils.artifact_store import get_artifact_store
+from utils.frame_buffer import get_frame_buffer
+
+# OCR_SAVE_SCREENSHOTS=true 면 OCR용 캡처도 매번 디스크에 저장 (기본: 실패 시에만 링 버퍼에서 저장)
+SAVE_BY_DEFAULT = os.environ.get("OCR_SAVE_SCREENSHOTS", "false").lower() == "true"
+
+
+@traced("decode_png")
+def png_to_array(png_bytes: bytes, gray: bool = True) -> np.ndarray:
+    """PNG 바이트 → numpy 배열 (gray=True면 디코딩 단계에서 바로 흑백)"""
+    buf = np.frombuffer(png_bytes, dtype=np.uint8)
+    flag = cv2.IMREAD_GRAYSCALE if gray else cv2.IMREAD_COLOR
+    image = cv2.imdecode(buf, flag)
+    if image is None:
+        raise ValueError("스크린샷 PNG 디코딩 실패")
+    return image
+
+
+def save_png_async(png_bytes: bytes, name: str, keep: bool = False) -> str:
+    """PNG 바이트를 ArtifactStore에 백그라운드 저장 예약 → 저장될 경로 (같은 화면은 한 번만 저장)"""
+    return get_artifact_store().save_png(png_bytes, name, keep=keep)
+
+
+def save_png_sync(png_bytes: bytes, name: str, keep: bool = False) -> str:
+    """save_png_async와 같지만 파일 쓰기가 끝난 뒤 경로 반환 (경로를 바로 열거나 OCR하는 호출부용)"""
+    return get_artifact_store().save_png(png_bytes, name, keep=keep, wait=True)
+
+
+def flush_pending_writes():
+    """대기 중인 스크린샷 저장 작업이 끝날 때까지 대기 (+ manifest 갱신)"""
+    get_artifact_store().flush()
+
+
+@traced("capture_frame", "appium")
+def capture_frame(driver, name: Optional[str] = None, save: Optional[bool] = None,
+                  gray: bool = True) -> np.ndarray:
+    """
+    현재 화면을 numpy 배열로 캡처 (PNG 인코딩된 응답을 한 번만 디코딩).
+    :param name: 단계 라벨. 주어지면 실패 대비 링 버퍼에 보관
+    :param save: True면 디스크에도 백그라운드 저장, None이면 OCR_SAVE_SCREENSHOTS 설정을 따름
+    """
+    png = driver.get_screenshot_as_png()
+    frame = png_to_array(png, gray=gray)
+    if name:
+        get_frame_buffer().push(png, name)
+        if SAVE_BY_DEFAULT if save is None else save:
+            save_png_async(png, name)
+    return frame
+
+
+@traced("capture_thumbnail", "appium")
+def capture_thumbnail(driver, reduce: int = 8) -> np.ndarray:
+    """
+    화면 변화 감지용 저해상도 흑백 프레임.
+    reduce(2/4/8)배 축소 디코딩을 써서 원본 크기 배열을 만들지 않는다.
+    """
+    flags = {2: cv2.IMREAD_REDUCED_GRAYSCALE_2, 4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+             8: cv2.IMREAD_REDUCED_GRAYSCALE_8}
+    if reduce not in flags:
+        raise ValueError(f"reduce는 2, 4, 8 중 하나여야 합니다: {reduce}")
+    buf = np.frombuffer(driver.get_screenshot_as_png(), dtype=np.uint8)
+    image = cv2.imdecode(buf, flags[reduce])
+    if image is None:
+        raise ValueError("스크린샷 PNG 디코딩 실패")
+    return image
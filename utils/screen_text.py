@@ -0,0 +1,136 @@
+# utils/screen_text.py
+"""
+한 번의 OCR(검출+인식) 결과를 구조화한 객체.
+
+readtext(detail=1) 결과 하나로
+- 전체 텍스트(줄 단위로 합친 문자열)
+- 박스별 텍스트 / 중심 좌표 / 신뢰도
+- 영역(region) 제한 키워드 검색
+을 모두 제공해서, 같은 화면을 다시 OCR하지 않도록 한다.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from utils.coordinates import Rect, resolve_region
+
+Region = Union[str, Rect, None]  # rel_position.json의 영역 이름 또는 픽셀 사각형
+
+
+@dataclass(frozen=True)
+class OCRBox:
+    text: str
+    bbox: Tuple[Tuple[int, int], ...]  # 4개 꼭짓점 (좌상, 우상, 우하, 좌하)
+    conf: float
+
+    @property
+    def left(self) -> int:
+        return min(p[0] for p in self.bbox)
+
+    @property
+    def top(self) -> int:
+        return min(p[1] for p in self.bbox)
+
+    @property
+    def right(self) -> int:
+        return max(p[0] for p in self.bbox)
+
+    @property
+    def bottom(self) -> int:
+        return max(p[1] for p in self.bbox)
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        (x1, y1), _, (x3, y3), _ = self.bbox
+        return int((x1 + x3) / 2), int((y1 + y3) / 2)
+
+    def within(self, region: Optional[Rect]) -> bool:
+        """박스 중심이 region 안에 있는지 (region=None이면 항상 True)"""
+        if region is None:
+            return True
+        cx, cy = self.center
+        left, top, right, bottom = region
+        return left <= cx <= right and top <= cy <= bottom
+
+    def shifted(self, dx: int, dy: int) -> "OCRBox":
+        return OCRBox(self.text, tuple((x + dx, y + dy) for x, y in self.bbox), self.conf)
+
+
+@dataclass
+class ScreenText:
+    boxes: List[OCRBox] = field(default_factory=list)
+    size: Optional[Tuple[int, int]] = None  # 원본 화면 (width, height). 영역 이름 해석에 사용
+
+    @classmethod
+    def from_readtext(cls, results: Iterable, offset: Tuple[int, int] = (0, 0),
+                      size: Optional[Tuple[int, int]] = None, scale: float = 1.0) -> "ScreenText":
+        """
+        readtext(detail=1) 결과 → ScreenText
+        :param offset: crop 영역 좌상단. 전체 화면 좌표로 환산
+        :param scale: 전처리에서 축소한 배율. 좌표를 원본 해상도로 되돌림
+        """
+        dx, dy = offset
+        boxes = [
+            OCRBox(str(text), tuple((int(round(x / scale)) + dx, int(round(y / scale)) + dy) for x, y in bbox),
+                   float(prob))
+            for bbox, text, prob in results
+        ]
+        return cls(boxes, size)
+
+    def rect(self, region: Region) -> Optional[Rect]:
+        """영역 이름 → 이 화면 해상도 기준 사각형"""
+        if isinstance(region, str):
+            if self.size is None:
+                raise ValueError(f"화면 크기를 모르는 ScreenText에서는 영역 이름('{region}')을 쓸 수 없습니다.")
+            return resolve_region(region, self.size)
+        return region
+
+    @property
+    def texts(self) -> List[str]:
+        return [b.text for b in self.boxes]
+
+    def lines(self) -> List[List[OCRBox]]:
+        """세로 위치가 겹치는 박스끼리 한 줄로 묶어 위→아래, 왼→오 순으로 정렬"""
+        lines: List[List[OCRBox]] = []
+        for box in sorted(self.boxes, key=lambda b: (b.top, b.left)):
+            if lines:
+                last = lines[-1]
+                line_top = min(b.top for b in last)
+                line_bottom = max(b.bottom for b in last)
+                overlap = min(line_bottom, box.bottom) - max(line_top, box.top)
+                if overlap > 0.5 * min(line_bottom - line_top, box.bottom - box.top):
+                    last.append(box)
+                    continue
+            lines.append([box])
+        return [sorted(line, key=lambda b: b.left) for line in lines]
+
+    @property
+    def text(self) -> str:
+        """같은 줄은 공백, 줄 사이는 개행으로 합친 전체 텍스트 (paragraph 모드 대체)"""
+        return "\n".join(" ".join(b.text for b in line) for line in self.lines()).strip()
+
+    def in_region(self, region: Region) -> "ScreenText":
+        rect = self.rect(region)
+        return ScreenText([b for b in self.boxes if b.within(rect)], self.size)
+
+    def find(self, keywords: Sequence[str], region: Region = None) -> List[OCRBox]:
+        """키워드 중 하나라도 포함한 박스 목록 (OCR 결과 순서 유지)"""
+        rect = self.rect(region)
+        return [b for b in self.boxes if b.within(rect) and any(k in b.text for k in keywords)]
+
+    def first(self, keywords: Sequence[str], region: Region = None) -> Optional[OCRBox]:
+        hits = self.find(keywords, region)
+        return hits[0] if hits else None
+
+    def contains(self, keywords: Sequence[str], region: Region = None) -> bool:
+        """
+        키워드 존재 여부. 박스 단위로 못 찾으면 줄 단위로 합친 텍스트에서도 검사
+        ('결제 정보'가 '결제' / '정보' 두 박스로 나뉜 경우 대비)
+        """
+        if self.find(keywords, region):
+            return True
+        text = self.in_region(region).text if region else self.text
+        return any(k in text for k in keywords)
+
+    def __len__(self) -> int:
+        return len(self.boxes)
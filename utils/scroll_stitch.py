@@ -0,0 +1,171 @@
+# utils/scroll_stitch.py
+"""
+스크롤 목록 이어 붙이기 (stitching).
+
+스크롤 후 새 프레임의 대부분은 직전 프레임을 위/아래로 민 것과 같다.
+연속 프레임의 세로 이동량을 템플릿 매칭(cv2.matchTemplate)으로 구하고,
+새로 드러난 띠(strip)만 OCR해서 긴 캔버스에 이어 붙인다.
+캔버스의 박스는 '콘텐츠 좌표'(첫 화면의 영역 상단 = 0)로 보관하고, 매 프레임 현재 뷰포트
+기준 화면 좌표로 되돌려 ScreenText로 돌려주므로 그대로 탭에 쓸 수 있다.
+
+긴 채널 목록 전체를 훑어도 OCR 비용은 대략 화면 한 장 분량 + 띠 경계 여백 정도.
+"""
+from __future__ import annotations
+from typing import Callable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from utils.coordinates import Rect
+from utils.screen_text import OCRBox, ScreenText
+
+SIG_WIDTH = 64          # 이동량 추정용 축소 폭 (세로 해상도는 유지)
+TEMPLATE_RATIO = 0.1    # 템플릿으로 쓸 구간 높이 (영역 높이 비율)
+MIN_BAND_STD = 4.0      # 템플릿 구간의 최소 명암 표준편차
+MATCH_THRESHOLD = 0.1   # 1 - 상관계수 허용치. 넘으면 이동량을 믿지 않고 새로 시작
+OVERLAP = 96            # 띠 OCR 시 기존 영역과 겹쳐 읽는 높이(px). 글자 높이의 2배 이상
+
+
+def _signature(gray: np.ndarray) -> np.ndarray:
+    h = gray.shape[0]
+    return cv2.resize(gray, (SIG_WIDTH, h), interpolation=cv2.INTER_AREA).astype(np.float32)
+
+
+def _textured_band(sig: np.ndarray, t: int) -> Optional[int]:
+    """
+    위에서부터 높이 t 구간 중 처음으로 명암 변화가 있는 구간의 시작 행.
+    단색 구간은 어디든 맞으므로 제외하고, 큰 스크롤에서도 겹치는 부분에 남도록 최대한 위쪽을 고른다.
+    """
+    for r in range(0, max(1, sig.shape[0] - t), max(1, t // 4)):
+        if float(sig[r:r + t].std()) >= MIN_BAND_STD:
+            return r
+    return None
+
+
+def _best_match(template: np.ndarray, image: np.ndarray) -> Tuple[int, float]:
+    """template이 image의 몇 번째 행에서 가장 잘 맞는지 (행, 오차 = 1 - 정규화 상관계수)"""
+    scores = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(scores)
+    return max_loc[1], 1.0 - float(max_val)
+
+
+def estimate_shift(prev: np.ndarray, cur: np.ndarray) -> Tuple[int, float]:
+    """
+    두 프레임(같은 영역 crop) 사이 콘텐츠의 세로 이동량.
+    :return: (dy, 오차) — dy>0: 아래로 스크롤(콘텐츠가 위로 dy px 이동), dy<0: 위로 스크롤
+    """
+    if prev.shape != cur.shape:
+        return 0, 1.0
+    if np.array_equal(prev, cur):
+        return 0, 0.0
+    a, b = _signature(prev), _signature(cur)
+    t = max(8, int(a.shape[0] * TEMPLATE_RATIO))
+    # 아래로: 현재 화면의 r행이 이전 화면의 r+dy 행에 있음 / 위로: 이전 화면의 r행이 현재 화면의 r-dy 행에 있음
+    candidates = []
+    for src, dst, sign in ((b, a, 1), (a, b, -1)):
+        r = _textured_band(src, t)
+        if r is None:
+            continue
+        row, err = _best_match(src[r:r + t], dst)
+        candidates.append((err, sign * (row - r)))
+    if not candidates:
+        return 0, 1.0
+    err, dy = min(candidates)
+    return dy, err
+
+
+class ScrollStitcher:
+    """
+    한 목록 영역에 대한 이어 붙이기 상태.
+    :param rect: 목록 영역 (화면 픽셀 사각형)
+    :param reader: (frame, crop_area) → ScreenText. 화면 좌표로 환산된 박스를 돌려주는 OCR 함수 (read_screen)
+    """
+
+    def __init__(self, rect: Rect, reader: Callable[..., ScreenText], overlap: int = OVERLAP):
+        self.rect = rect
+        self.reader = reader
+        self.overlap = overlap
+        self.reset()
+
+    def reset(self):
+        self.canvas: Optional[np.ndarray] = None
+        self.canvas_top = 0      # 캔버스 0행의 콘텐츠 y
+        self.viewport_top = 0    # 현재 뷰포트 상단의 콘텐츠 y
+        self.boxes: List[OCRBox] = []   # 콘텐츠 좌표
+        self._prev: Optional[np.ndarray] = None
+        self.last_shift = 0
+        self.ocr_rows = 0        # 지금까지 OCR한 총 행 수 (비용 확인용)
+
+    @property
+    def height(self) -> int:
+        return self.rect[3] - self.rect[1]
+
+    def _crop(self, frame: np.ndarray) -> np.ndarray:
+        left, top, right, bottom = self.rect
+        return frame[top:bottom, left:right]
+
+    def _read(self, frame: np.ndarray, top: int, bottom: int) -> List[OCRBox]:
+        """뷰포트 행 [top, bottom) 띠만 OCR → 콘텐츠 좌표 박스"""
+        left, rtop, right, _ = self.rect
+        screen = self.reader(frame, crop_area=(left, rtop + top, right, rtop + bottom))
+        self.ocr_rows += bottom - top
+        return [b.shifted(0, self.viewport_top - rtop) for b in screen.boxes]
+
+    def feed(self, frame: np.ndarray) -> ScreenText:
+        """
+        새 프레임(전체 화면 흑백)을 받아 새로 드러난 부분만 OCR하고, 현재 뷰포트의 ScreenText를 반환
+        """
+        crop = self._crop(frame)
+        h = self.height
+        if self._prev is None:
+            self.reset()
+            self.canvas = crop.copy()
+            self.boxes = self._read(frame, 0, h)
+        else:
+            dy, err = estimate_shift(self._prev, crop)
+            if err > MATCH_THRESHOLD or abs(dy) >= h - self.overlap:
+                print(f"🧩 스크롤 이동량 추정 실패(오차 {err:.3f}, dy={dy}) → 뷰포트 전체 OCR")
+                self._prev = None
+                return self.feed(frame)
+            self.last_shift = dy
+            self.viewport_top += dy
+            if dy:
+                self._append(frame, crop, dy)
+        self._prev = crop
+        return self.viewport(frame)
+
+    def _append(self, frame: np.ndarray, crop: np.ndarray, dy: int):
+        h = self.height
+        vt = self.viewport_top
+        canvas_bottom = self.canvas_top + self.canvas.shape[0]
+        if dy > 0 and vt + h > canvas_bottom:
+            # 아래쪽에 새로 드러난 띠: [canvas_bottom, vt+h) + 위쪽 overlap
+            new_rows = vt + h - canvas_bottom
+            start = max(0, h - new_rows - self.overlap)
+            mid = vt + start + self.overlap // 2 if start else vt
+            strip = self._read(frame, start, h)
+            self.boxes = [b for b in self.boxes if b.center[1] < mid]
+            self.boxes += [b for b in strip if b.center[1] >= mid]
+            self.canvas = np.vstack([self.canvas, crop[h - new_rows:]])
+        elif dy < 0 and vt < self.canvas_top:
+            # 위쪽에 새로 드러난 띠: [vt, canvas_top) + 아래쪽 overlap
+            new_rows = self.canvas_top - vt
+            end = min(h, new_rows + self.overlap)
+            mid = vt + end - self.overlap // 2 if end < h else vt + h
+            strip = self._read(frame, 0, end)
+            self.boxes = [b for b in self.boxes if b.center[1] >= mid]
+            self.boxes = [b for b in strip if b.center[1] < mid] + self.boxes
+            self.canvas = np.vstack([crop[:new_rows], self.canvas])
+            self.canvas_top = vt
+
+    def viewport(self, frame: Optional[np.ndarray] = None) -> ScreenText:
+        """캔버스 박스 중 현재 뷰포트에 보이는 것만 화면 좌표로 환산"""
+        top = self.viewport_top
+        dy = self.rect[1] - top
+        boxes = [b.shifted(0, dy) for b in self.boxes if top <= b.center[1] < top + self.height]
+        size = (frame.shape[1], frame.shape[0]) if frame is not None else None
+        return ScreenText(boxes, size)
+
+    def canvas_text(self) -> ScreenText:
+        """지금까지 이어 붙인 목록 전체 (콘텐츠 좌표)"""
+        return ScreenText(list(self.boxes))
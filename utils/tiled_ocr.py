@@ -0,0 +1,200 @@
+# utils/tiled_ocr.py
+"""
+타일 병렬 OCR.
+
+gpu=False에서 세로로 긴 고해상도 화면(1080x2340 등)을 readtext 한 번으로 돌리면 CPU 코어를 고르게 못 쓴다.
+화면을 겹치는 가로 띠(타일)로 나눠 검출+인식을 타일별로 병렬 실행하고 결과를 합친다.
+- 병렬 실행: OCR 프로세스 풀(OCR_WORKERS>0)이 있으면 타일마다 풀 작업 1개, 없으면 프로세스 내 스레드 풀
+  (스레드 모드는 OCR_THREADS를 코어 수 / 타일 수 정도로 낮춰야 torch 스레드가 서로 다투지 않음)
+- 좌표는 타일 위치만큼 내려서 전체 화면 기준으로 환산
+- 겹침 구간에서 두 번 잡힌 박스는 하나만 남기고, 타일 경계에 잘린 조각은 잘리지 않은 쪽을 우선.
+  양쪽 모두 잘린 조각(겹침보다 큰 글자)은 하나의 박스로 합침
+- 영역 크롭처럼 낮은 이미지(OCR_TILE_MIN_HEIGHT 미만)는 나누지 않음
+
+환경변수:
+  OCR_TILES=0                 # 타일 수 (0/1이면 끔)
+  OCR_TILE_OVERLAP=96         # 타일 간 겹침(px, OCR 입력 기준). 가장 큰 글자 줄 높이보다 커야 함
+  OCR_TILE_MIN_HEIGHT=1200
+"""
+from __future__ import annotations
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.ocr_service import get_ocr_service
+
+DEFAULT_OVERLAP = 96
+DUPLICATE_RATIO = 0.6       # 교집합 / 작은 박스 면적이 이 이상이면 같은 글자로 봄
+EDGE_MARGIN = 2             # 타일 안쪽 경계에서 이만큼(px) 이내면 잘린 박스로 봄
+
+Rect = Tuple[float, float, float, float]
+
+
+def tile_bounds(height: int, tiles: int, overlap: int = DEFAULT_OVERLAP) -> List[Tuple[int, int]]:
+    """높이 height를 tiles개의 겹치는 가로 띠로 나눈 (top, bottom) 목록. 띠가 겹침의 3배보다 낮아지면 타일 수를 줄임"""
+    overlap = max(0, overlap)
+    if overlap:
+        tiles = min(tiles, (height + overlap) // (3 * overlap))
+    tiles = max(1, tiles)
+    step = (height - overlap) / tiles
+    tops = [int(round(i * step)) for i in range(tiles)]
+    # 아래 경계는 다음 타일 시작 + 겹침 (반올림으로 겹침이 설정보다 줄지 않게)
+    return [(top, height if i == tiles - 1 else tops[i + 1] + overlap) for i, top in enumerate(tops)]
+
+
+def _rect(points) -> Rect:
+    xs = [float(p[0]) for p in points]
+    ys = [float(p[1]) for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _overlap_ratio(a: Rect, b: Rect) -> float:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    if w <= 0 or h <= 0:
+        return 0.0
+    smaller = min((a[2] - a[0]) * (a[3] - a[1]), (b[2] - b[0]) * (b[3] - b[1]))
+    return w * h / smaller if smaller > 0 else 0.0
+
+
+def merge_tile_results(tile_results: Sequence[list], bounds: Sequence[Tuple[int, int]]) -> list:
+    """
+    타일별 readtext(detail=1) 결과를 전체 화면 좌표의 readtext 결과 하나로 합침.
+    :return: [(4점 좌표, 텍스트, 신뢰도), ...] 위→아래, 왼→오른 순
+    """
+    items = []      # (rect, points, text, conf, cut_top, cut_bottom, tile)
+    last = len(bounds) - 1
+    for i, (results, (top, bottom)) in enumerate(zip(tile_results, bounds)):
+        for bbox, text, conf in results:
+            points = [[float(x), float(y) + top] for x, y in bbox]
+            rect = _rect(points)
+            cut_top = i > 0 and rect[1] <= top + EDGE_MARGIN
+            cut_bottom = i < last and rect[3] >= bottom - EDGE_MARGIN
+            items.append((rect, points, text, float(conf), cut_top, cut_bottom, i))
+
+    # 1) 중복 제거 (서로 다른 타일끼리만): 잘리지 않은 박스 → 신뢰도 높은 박스 순으로 남김.
+    #    이웃 타일 경계를 사이에 두고 마주 보며 잘린 두 조각은 같은 글자의 위/아래이므로 2)에서 합침
+    def _facing(a, b) -> bool:
+        upper, lower = (a, b) if a[6] < b[6] else (b, a)
+        return upper[5] and lower[4] and lower[6] == upper[6] + 1
+
+    items.sort(key=lambda it: (it[4] or it[5], -it[3]))
+    kept: List[list] = []
+    for item in items:
+        if all(k[6] == item[6] or _facing(item, k) or _overlap_ratio(item[0], k[0]) < DUPLICATE_RATIO
+               for k in kept):
+            kept.append(list(item))
+
+    # 2) 경계 양쪽에서 모두 잘린 조각 합치기 (아래가 잘린 조각 + 바로 아래 타일의 위가 잘린 조각)
+    merged: List[list] = []
+    for item in sorted(kept, key=lambda it: it[0][1]):
+        partner = None
+        if item[4]:
+            for other in merged:
+                a, b = other[0], item[0]
+                horizontal = min(a[2], b[2]) - max(a[0], b[0])
+                adjacent = other[5] and other[6] == item[6] - 1
+                if adjacent and horizontal > 0.5 * min(a[2] - a[0], b[2] - b[0]) and b[1] <= a[3]:
+                    partner = other
+                    break
+        if partner is None:
+            merged.append(item)
+            continue
+        a, b = partner[0], item[0]
+        rect = (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+        partner[0] = rect
+        partner[1] = [[rect[0], rect[1]], [rect[2], rect[1]], [rect[2], rect[3]], [rect[0], rect[3]]]
+        partner[2] = partner[2] if len(partner[2]) >= len(item[2]) else item[2]
+        partner[3] = min(partner[3], item[3])
+        partner[5], partner[6] = item[5], item[6]
+
+    merged.sort(key=lambda it: (round(it[0][1]), it[0][0]))
+    return [([[int(round(x)), int(round(y))] for x, y in it[1]], it[2], it[3]) for it in merged]
+
+
+def _gather(futures: Sequence[Future], combine: Callable[[list], Any]) -> Future:
+    """모든 future가 끝나면 결과 목록에 combine을 적용한 Future (하나라도 실패하면 그 예외)"""
+    out: Future = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def _one_done(_done: Future):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        try:
+            out.set_result(combine([f.result() for f in futures]))
+        except BaseException as e:
+            out.set_exception(e)
+    for f in futures:
+        f.add_done_callback(_one_done)
+    return out
+
+
+class TiledOCR:
+    """
+    :param tiles: 타일 수
+    :param overlap: 타일 간 겹침(px)
+    :param min_height: 이보다 낮은 이미지는 나누지 않음
+    :param workers: 스레드 모드 동시 실행 수 (기본: 타일 수)
+    :param service: 타일을 보낼 OCR 서비스 (기본: get_ocr_service(), 없으면 스레드 모드)
+    """
+
+    def __init__(self, tiles: int = 4, overlap: int = DEFAULT_OVERLAP, min_height: int = 1200,
+                 workers: Optional[int] = None, service=None):
+        self.tiles = tiles
+        self.overlap = overlap
+        self.min_height = min_height
+        self.workers = workers or tiles
+        self.service = service
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def applies(self, np_image: np.ndarray, kwargs: dict) -> bool:
+        """좌표가 필요한 readtext(detail=1, paragraph=False)이고 충분히 긴 이미지에만 적용"""
+        return (self.tiles > 1 and np_image.shape[0] >= self.min_height
+                and kwargs.get("detail", 1) == 1 and not kwargs.get("paragraph", False))
+
+    def _submit_tile(self, tile: np.ndarray, kwargs: dict) -> Future:
+        service = self.service or get_ocr_service()
+        if service is not None:
+            return service.submit(tile, **kwargs)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ocr-tile")
+        from utils.ocr_engine import get_ocr_engine
+        return self._executor.submit(get_ocr_engine().readtext, tile, **kwargs)
+
+    def submit(self, np_image: np.ndarray, **kwargs) -> Future:
+        bounds = tile_bounds(np_image.shape[0], self.tiles, self.overlap)
+        futures = [self._submit_tile(np.ascontiguousarray(np_image[top:bottom]), kwargs) for top, bottom in bounds]
+        return _gather(futures, lambda results: merge_tile_results(results, bounds))
+
+    def readtext(self, np_image: np.ndarray, **kwargs) -> list:
+        return self.submit(np_image, **kwargs).result()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+_tiler: Optional[TiledOCR] = None
+_tiler_checked = False
+
+
+def get_tiled_ocr() -> Optional[TiledOCR]:
+    """전역 타일 OCR (OCR_TILES<=1 이면 None)"""
+    global _tiler, _tiler_checked
+    if not _tiler_checked:
+        tiles = int(os.environ.get("OCR_TILES", "0"))
+        if tiles > 1:
+            _tiler = TiledOCR(
+                tiles=tiles,
+                overlap=int(os.environ.get("OCR_TILE_OVERLAP", str(DEFAULT_OVERLAP))),
+                min_height=int(os.environ.get("OCR_TILE_MIN_HEIGHT", "1200")),
+            )
+        _tiler_checked = True
+    return _tiler
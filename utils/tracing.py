@@ -0,0 +1,190 @@
+# utils/tracing.py
+"""
+가벼운 단계별 타이밍 계측.
+
+- span(name, cat): 구간 하나를 기록하는 컨텍스트 매니저 / traced(): 함수 데코레이터
+- set_step(name, channel): 현재 테스트 단계와 채널 이름을 지정. 이후 모든 span에 args로 붙는다
+- export_chrome_trace(): Chrome trace event 형식(JSON)으로 저장 → chrome://tracing 또는 ui.perfetto.dev에서 열기
+- print_trace_summary(): 이름별 총 시간/자기 시간(하위 span 제외) 상위 항목 표
+
+카테고리: appium(탭/스와이프/캡처 왕복), ocr(추론), wait(대기), io(파일 저장), step(테스트 단계), app(그 외)
+TRACE_ENABLED=false 면 기록하지 않는다.
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import threading
+import functools
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+ENABLED = os.environ.get("TRACE_ENABLED", "true").lower() == "true"
+TRACE_DIR = "./reports/traces"
+
+
+@dataclass
+class Span:
+    name: str
+    cat: str
+    start: float                      # time.perf_counter() 기준 초
+    duration: float = 0.0
+    child_time: float = 0.0           # 같은 스레드의 직계 하위 span 시간 합
+    args: Dict[str, Any] = field(default_factory=dict)
+    tid: int = 0
+
+    @property
+    def self_time(self) -> float:
+        return max(0.0, self.duration - self.child_time)
+
+
+_spans: List[Span] = []
+_spans_lock = threading.Lock()
+_origin = time.perf_counter()
+
+_step: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("trace_step", default=None)
+_channel: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("trace_channel", default=None)
+_parent: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("trace_parent", default=None)
+
+
+@contextmanager
+def span(name: str, cat: str = "app", **args):
+    """구간 기록. step/channel은 현재 컨텍스트 값이 자동으로 붙음"""
+    if not ENABLED:
+        yield None
+        return
+    step_name, channel = _step.get(), _channel.get()
+    if step_name:
+        args.setdefault("step", step_name)
+    if channel:
+        args.setdefault("channel", channel)
+    parent = _parent.get()
+    record = Span(name, cat, time.perf_counter(), args=args, tid=threading.get_ident())
+    token = _parent.set(record)
+    try:
+        yield record
+    finally:
+        record.duration = time.perf_counter() - record.start
+        _parent.reset(token)
+        if parent is not None and parent.tid == record.tid:
+            parent.child_time += record.duration
+        with _spans_lock:
+            _spans.append(record)
+
+
+def traced(name: Optional[str] = None, cat: str = "app"):
+    """함수 전체를 span으로 감싸는 데코레이터"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_open_step: Optional[Span] = None
+
+
+def set_step(name: str, channel: Optional[str] = None):
+    """
+    현재 테스트 단계(예: 'BLOCK', 'CHAT 쓰기 검증')와 채널 지정. 이후 모든 span의 args에 붙는다.
+    이전 단계는 여기서 끝나고, 단계 자체도 'step' span으로 기록된다.
+    """
+    global _open_step
+    end_step()
+    _step.set(name)
+    _channel.set(channel)
+    if ENABLED:
+        label = name if channel is None else f"{name}:{channel}"
+        _open_step = Span(label, "step", time.perf_counter(), args={"step": name, "channel": channel},
+                          tid=threading.get_ident())
+
+
+def end_step():
+    global _open_step
+    _step.set(None)
+    _channel.set(None)
+    if _open_step is not None:
+        _open_step.duration = time.perf_counter() - _open_step.start
+        with _spans_lock:
+            _spans.append(_open_step)
+        _open_step = None
+
+
+def current_step() -> Tuple[Optional[str], Optional[str]]:
+    """현재 (단계, 채널). 스크린샷 manifest 등 다른 기록에 단계를 붙일 때 사용"""
+    return _step.get(), _channel.get()
+
+
+def trace_spans() -> List[Span]:
+    with _spans_lock:
+        return list(_spans)
+
+
+def reset_trace():
+    global _origin, _open_step
+    _open_step = None
+    with _spans_lock:
+        _spans.clear()
+    _origin = time.perf_counter()
+
+
+def chrome_trace_events() -> List[Dict[str, Any]]:
+    pid = os.getpid()
+    events = []
+    for s in sorted(trace_spans(), key=lambda s: s.start):
+        events.append({
+            "name": s.name, "cat": s.cat, "ph": "X", "pid": pid, "tid": s.tid,
+            "ts": round((s.start - _origin) * 1e6, 1), "dur": round(s.duration * 1e6, 1),
+            "args": s.args,
+        })
+    return events
+
+
+def export_chrome_trace(name: str, trace_dir: str = TRACE_DIR) -> Optional[str]:
+    """reports/traces/{name}_{시각}.json 저장 (chrome://tracing / Perfetto에서 열기)"""
+    if not ENABLED:
+        return None
+    os.makedirs(trace_dir, exist_ok=True)
+    path = os.path.join(trace_dir, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": chrome_trace_events(), "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+    print(f"🧭 타이밍 트레이스 저장: {path}")
+    return path
+
+
+def trace_summary(top: int = 10) -> List[Dict[str, Any]]:
+    """이름별 집계 (단계 span 제외). self_seconds 내림차순 = 실제로 시간을 먹은 곳"""
+    rows: Dict[str, Dict[str, Any]] = {}
+    for s in trace_spans():
+        if s.cat == "step":
+            continue
+        row = rows.setdefault(s.name, {"name": s.name, "cat": s.cat, "count": 0,
+                                       "total_seconds": 0.0, "self_seconds": 0.0})
+        row["count"] += 1
+        row["total_seconds"] += s.duration
+        row["self_seconds"] += s.self_time
+    return sorted(rows.values(), key=lambda r: r["self_seconds"], reverse=True)[:top]
+
+
+def print_trace_summary(title: str = "", top: int = 10):
+    spans = trace_spans()
+    if not spans:
+        return
+    wall = max(s.start + s.duration for s in spans) - min(s.start for s in spans)
+    by_cat: Dict[str, float] = {}
+    for s in spans:
+        if s.cat != "step":
+            by_cat[s.cat] = by_cat.get(s.cat, 0.0) + s.self_time
+    print(f"🧭 타이밍 요약{f' ({title})' if title else ''}: 전체 {wall:.1f}s — "
+          + ", ".join(f"{cat} {sec:.1f}s" for cat, sec in sorted(by_cat.items(), key=lambda x: -x[1])))
+    print(f"{'구간':<24}{'분류':<8}{'횟수':>6}{'자기 시간(s)':>14}{'총 시간(s)':>12}{'비율':>8}")
+    for row in trace_summary(top):
+        share = row["self_seconds"] / wall * 100 if wall else 0.0
+        print(f"{row['name']:<24}{row['cat']:<8}{row['count']:>6}{row['self_seconds']:>14.2f}"
+              f"{row['total_seconds']:>12.2f}{share:>7.1f}%")
@@ -0,0 +1,156 @@
+# utils/verifier.py
+"""
+지연 판정기.
+
+채널 진입 후 검증용 화면을 캡처해 OCR을 제출(submit)하고, 판정을 기다리지 않고 바로
+뒤로가기/다음 채널 탐색으로 넘어간다. OCR 서비스(OCR_WORKERS>0)가 있으면 그동안 직전 화면의 OCR이 돈다.
+판정 함수(check)는 OCR이 끝난 뒤 제출 순서대로 테스트 스레드에서 실행된다 (poll / drain 시점).
+OCR 서비스가 없으면 submit 안에서 바로 판정 → 기존 순차 실행과 같은 순서.
+
+지연 판정 모드(VERIFY_BATCH_SIZE>0): 다음 이동을 결정하지 않는 문구 검증은 프레임과 판정 함수만 기록해 두고,
+N장이 차거나 drain 때 EasyOCR readtext_batched로 한 번에 인식한 뒤 판정을 몰아서 실행한다.
+(같은 영역 크롭끼리 한 배치 → 검출 모델 호출 횟수가 줄고, 기기 루프에서는 OCR이 빠짐)
+
+판정은 몇 채널 뒤에 실행될 수 있으므로, 제출 시점의 프레임 버퍼 스냅샷을 함께 보관했다가
+판정 안의 dump_failure_frames / 판정 예외 때 그 스냅샷을 저장한다 (실패로 이어진 화면 그대로).
+
+판정 결과(True/False)는 프로세스 전역 기록(check_log)에도 남는다. 다중 기기 실행기는 케이스가 끝나면
+이 기록의 FAIL로 케이스 PASS/FAIL을 정한다 (Verifier를 거치지 않는 즉시 판정은 record_check로 기록).
+
+환경변수:
+  VERIFY_BATCH_SIZE=0     # 0: 제출 즉시 OCR(풀/인라인), N: N장씩 모아 배치 OCR
+"""
+from __future__ import annotations
+import os
+from collections import deque
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from utils.easyocr_utils import read_screen_async, read_screens_batched
+from utils.frame_buffer import BufferedFrame, dump_failure_frames, failure_frames, get_frame_buffer
+from utils.screen_text import ScreenText
+from utils.tracing import span
+
+
+_check_log: List[Tuple[str, bool]] = []
+_check_lock = threading.Lock()
+
+
+def record_check(label: str, passed: bool):
+    """판정 하나를 전역 기록에 추가 (Verifier 밖의 즉시 판정: 다이얼로그 확인, 채널 비노출 등)"""
+    with _check_lock:
+        _check_log.append((label, bool(passed)))
+
+
+def check_log() -> List[Tuple[str, bool]]:
+    """지금까지의 (판정 이름, 통과 여부) 목록"""
+    with _check_lock:
+        return list(_check_log)
+
+
+def failed_checks(since: int = 0) -> List[str]:
+    """check_log()[since:] 중 FAIL인 판정 이름"""
+    return [label for label, passed in check_log()[since:] if not passed]
+
+
+def _relay(source: Future, target: Future):
+    """source 결과(또는 예외)를 target으로 전달"""
+    def _copy(done: Future):
+        error = done.exception()
+        if error is not None:
+            target.set_exception(error)
+        else:
+            target.set_result(done.result())
+    source.add_done_callback(_copy)
+
+
+class Verifier:
+    """
+    :param batch_size: 지연 판정 모드 배치 크기. None이면 VERIFY_BATCH_SIZE, 0이면 제출 즉시 OCR
+    """
+
+    def __init__(self, batch_size: Optional[int] = None):
+        if batch_size is None:
+            batch_size = int(os.environ.get("VERIFY_BATCH_SIZE", "0"))
+        self.batch_size = max(0, batch_size)
+        self._pending: Deque[Tuple[str, Future, Callable[[ScreenText], Any], List[BufferedFrame]]] = deque()
+        self._batch: List[Tuple[Future, tuple]] = []
+        self.results: Dict[str, Any] = {}
+        self.batches = 0
+
+    def submit(self, label: str, image, check: Callable[[ScreenText], Any], region=None, crop_area=None) -> Future:
+        """
+        :param label: 판정 이름 (결과 키, 예외 시 실패 프레임 저장 사유)
+        :param image: capture_frame()으로 얻은 배열
+        :param check: ScreenText를 받아 PASS/FAIL을 출력하는 함수 (반환값은 results[label]에 보관)
+        """
+        frames = get_frame_buffer().frames()    # 실패 시 저장할 제출 시점 스냅샷
+        if self.batch_size:
+            future: Future = Future()
+            self._batch.append((future, (image, crop_area, region)))
+            self._pending.append((label, future, check, frames))
+            if len(self._batch) >= self.batch_size:
+                self.flush()
+        else:
+            future = read_screen_async(image, crop_area, region)
+            self._pending.append((label, future, check, frames))
+        self.poll()
+        return future
+
+    def flush(self):
+        """지연 판정 모드에서 모아 둔 프레임을 배치 OCR로 제출 (OCR 서비스가 없으면 여기서 인식까지)"""
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        self.batches += 1
+        with span("verify.batch", "ocr", frames=len(batch)):
+            screens = read_screens_batched([frame for _, frame in batch], max_images=len(batch))
+        for (placeholder, _), future in zip(batch, screens):
+            _relay(future, placeholder)
+
+    def poll(self) -> int:
+        """OCR이 끝난 판정을 제출 순서대로 실행 (앞 판정이 안 끝났으면 뒤는 대기). 실행한 개수 반환"""
+        count = 0
+        while self._pending and self._pending[0][1].done():
+            self._run(*self._pending.popleft())
+            count += 1
+        return count
+
+    def drain(self):
+        """남은 판정을 모두 실행 (그룹/시나리오 끝에서 호출)"""
+        self.flush()
+        if not self._pending:
+            return
+        with span("verify.drain", "wait", pending=len(self._pending)):
+            while self._pending:
+                self._run(*self._pending.popleft())
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, label: str, result: Any):
+        """OCR 제출 없이 바로 난 판정을 결과 표와 전역 기록에 추가 (True/False만 전역 기록)"""
+        self.results[label] = result
+        if isinstance(result, bool):
+            record_check(label, result)
+
+    def _run(self, label: str, future: Future, check: Callable[[ScreenText], Any], frames: List[BufferedFrame]):
+        try:
+            with failure_frames(frames):
+                self.record(label, check(future.result()))
+        except Exception as e:
+            print(f"❌ {label} 검증 중 예외: {e}")
+            dump_failure_frames(f"{label}_verify_error", frames)
+            self.results[label] = None
+            record_check(label, False)
+
+    def print_report(self, title: str = ""):
+        """판정별 결과 표 (True → PASS, False → FAIL, 그 외 → 반환값/예외 없음 표시)"""
+        if not self.results:
+            return
+        mode = f"배치 {self.batch_size}장 x {self.batches}회" if self.batch_size else "즉시"
+        print(f"🧾 검증 결과{f' ({title})' if title else ''} — OCR {mode}")
+        for label, result in self.results.items():
+            verdict = "PASS" if result is True else "FAIL" if result is False else "-"
+            print(f"   {label:<12}{verdict}")
@@ -0,0 +1,123 @@
+# utils/waits.py
+"""
+고정 time.sleep 대신 쓰는 화면 안정화 대기.
+
+저해상도 프레임을 주기적으로 캡처해서 연속 프레임 차이가 threshold 이하로 유지되면 바로 반환한다.
+각 대기는 기존 고정 sleep 값(baseline)과 실제 소요 시간을 기록해서, 실행 끝에 절약된 시간을 보고한다.
+"""
+from __future__ import annotations
+import time
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from utils.screen_capture import capture_thumbnail
+from utils.tracing import span
+
+
+@dataclass
+class WaitRecord:
+    label: str
+    baseline: float     # 기존 고정 sleep 시간(초)
+    elapsed: float      # 실제 대기 시간(초)
+    stable: bool        # 타임아웃 전에 안정화됐는지
+
+
+_records: List[WaitRecord] = []
+_records_lock = threading.Lock()
+
+
+def frame_diff(a: np.ndarray, b: np.ndarray) -> float:
+    """두 저해상도 프레임의 평균 절대 차이 (0~255). 크기가 다르면 큰 값"""
+    if a.shape != b.shape:
+        return 255.0
+    return float(np.mean(np.abs(a.astype(np.int16) - b.astype(np.int16))))
+
+
+def wait_until_stable(
+    driver,
+    baseline: float,
+    *,
+    timeout: Optional[float] = None,
+    min_wait: float = 0.3,
+    interval: float = 0.2,
+    stable_frames: int = 2,
+    threshold: float = 1.0,
+    label: str = "wait",
+) -> bool:
+    """
+    화면이 멈출 때까지 대기.
+    :param baseline: 이 대기가 대체하는 기존 고정 sleep 시간(초). 절약 시간 보고에 사용
+    :param timeout: 최대 대기 시간. 기본값은 baseline (기존보다 오래 기다리지 않음)
+    :param min_wait: 탭 직후 전환 애니메이션이 시작되기 전 프레임을 안정으로 오인하지 않기 위한 최소 대기
+    :param stable_frames: 연속으로 변화 없음이 확인되어야 하는 비교 횟수
+    :param threshold: 평균 절대 차이(0~255)가 이 값 이하이면 '변화 없음'
+    :return: 안정화 여부 (False면 timeout까지 기다린 것)
+    """
+    with span(f"wait:{label}", "wait", baseline=baseline):
+        timeout = baseline if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        time.sleep(min(min_wait, timeout))
+
+        stable = False
+        prev = None
+        calm = 0
+        while time.monotonic() < deadline:
+            try:
+                frame = capture_thumbnail(driver)
+            except Exception as e:
+                # 캡처 실패 시 남은 시간은 기존처럼 고정 대기
+                print(f"⚠️ 화면 안정화 확인 실패({label}): {e}")
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                break
+            if prev is not None:
+                calm = calm + 1 if frame_diff(prev, frame) <= threshold else 0
+                if calm >= stable_frames:
+                    stable = True
+                    break
+            prev = frame
+            time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+
+        record_wait(label, baseline, time.monotonic() - start, stable)
+        return stable
+
+
+def record_wait(label: str, baseline: float, elapsed: float, stable: bool):
+    """다른 대기 방식(텍스트 대기 등)도 같은 절약 시간 보고에 포함"""
+    with _records_lock:
+        _records.append(WaitRecord(label, baseline, elapsed, stable))
+
+
+def wait_records() -> List[WaitRecord]:
+    with _records_lock:
+        return list(_records)
+
+
+def reset_wait_records():
+    with _records_lock:
+        _records.clear()
+
+
+def wait_summary() -> Dict[str, float]:
+    records = wait_records()
+    baseline = sum(r.baseline for r in records)
+    actual = sum(r.elapsed for r in records)
+    return {
+        "count": len(records),
+        "stable": sum(1 for r in records if r.stable),
+        "baseline_seconds": baseline,
+        "actual_seconds": actual,
+        "saved_seconds": baseline - actual,
+    }
+
+
+def print_wait_report():
+    s = wait_summary()
+    if not s["count"]:
+        return
+    print(f"⏱️ 화면 안정화 대기 {s['count']}회 (안정화 {s['stable']}회): "
+          f"고정 sleep 합계 {s['baseline_seconds']:.1f}s → 실제 {s['actual_seconds']:.1f}s "
+          f"(절약 {s['saved_seconds']:.1f}s)")